@@ -24,6 +24,8 @@ from app.infrastructure.persistence.sqlalchemy.models import (  # noqa: F401; Us
     Playlist,
     PlaylistSong,
     Recipe,
+    RecipeFacetCount,
+    RecipeIngredient,
     RecipeRating,
     RecipeStep,
     Session,
@@ -0,0 +1,63 @@
+"""Add recipe_facet_counts aggregate for category and tag facets
+
+Revision ID: 5a1f7c3e9b84
+Revises: 0c5e9a7b3d12
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1f7c3e9b84"
+down_revision: Union[str, Sequence[str], None] = "0c5e9a7b3d12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add recipe_facet_counts and backfill it."""
+    op.create_table(
+        "recipe_facet_counts",
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("scope", sa.Text(), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("recipe_count", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("kind", "scope", "value"),
+        schema="parranda",
+    )
+
+    # Categories (global scope), tags (global scope) and tags per category
+    op.execute(
+        """
+        INSERT INTO parranda.recipe_facet_counts (kind, scope, value, recipe_count)
+        SELECT 'category', '', category, count(*)
+        FROM parranda.recipes
+        WHERE is_published AND coalesce(category, '') <> ''
+        GROUP BY category
+        """
+    )
+    op.execute(
+        """
+        WITH recipe_tags AS (
+            SELECT DISTINCT r.id, nullif(r.category, '') AS category, t.tag
+            FROM parranda.recipes r, unnest(r.tags) AS t(tag)
+            WHERE r.is_published AND t.tag IS NOT NULL
+        )
+        INSERT INTO parranda.recipe_facet_counts (kind, scope, value, recipe_count)
+        SELECT 'tag', '', tag, count(*) FROM recipe_tags GROUP BY tag
+        UNION ALL
+        SELECT 'tag', category, tag, count(*)
+        FROM recipe_tags
+        WHERE category IS NOT NULL
+        GROUP BY category, tag
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop recipe_facet_counts."""
+    op.drop_table("recipe_facet_counts", schema="parranda")
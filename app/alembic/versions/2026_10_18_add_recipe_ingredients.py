@@ -0,0 +1,110 @@
+"""Add normalized recipe_ingredients inverted index
+
+Revision ID: 0c5e9a7b3d12
+Revises: f2b6d8e4a9c3
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from collections import defaultdict
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.domain.services.ingredients import extract_ingredient_names
+
+# revision identifiers, used by Alembic.
+revision: str = "0c5e9a7b3d12"
+down_revision: Union[str, Sequence[str], None] = "f2b6d8e4a9c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add recipe_ingredients and recipes.ingredient_count."""
+    op.add_column(
+        "recipes",
+        sa.Column("ingredient_count", sa.Integer(), server_default="0", nullable=False),
+        schema="parranda",
+    )
+    recipe_ingredients = op.create_table(
+        "recipe_ingredients",
+        sa.Column(
+            "recipe_id",
+            sa.UUID(),
+            sa.ForeignKey("parranda.recipes.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column(
+            "head",
+            sa.Text(),
+            sa.Computed("split_part(name, ' ', 1)", persisted=True),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("recipe_id", "name"),
+        schema="parranda",
+    )
+
+    # Backfill with the same normalization the application uses
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT recipe_id, ingredients_json FROM parranda.recipe_steps")
+    )
+    ingredients_by_recipe = defaultdict(list)
+    for recipe_id, ingredients in rows:
+        if isinstance(ingredients, list):
+            ingredients_by_recipe[recipe_id].append(ingredients)
+
+    values = [
+        {"recipe_id": recipe_id, "name": name}
+        for recipe_id, lists in ingredients_by_recipe.items()
+        for name in extract_ingredient_names(lists)
+    ]
+    if values:
+        op.bulk_insert(recipe_ingredients, values)
+    op.execute(
+        """
+        UPDATE parranda.recipes r
+        SET ingredient_count = agg.total
+        FROM (
+            SELECT recipe_id, count(*) AS total
+            FROM parranda.recipe_ingredients
+            GROUP BY recipe_id
+        ) agg
+        WHERE agg.recipe_id = r.id
+        """
+    )
+
+    # Lookups go by name first, then join back to the recipe
+    op.create_index(
+        "ix_recipe_ingredients_name_recipe",
+        "recipe_ingredients",
+        ["name", "recipe_id"],
+        unique=False,
+        schema="parranda",
+    )
+    op.create_index(
+        "ix_recipe_ingredients_head_recipe",
+        "recipe_ingredients",
+        ["head", "recipe_id"],
+        unique=False,
+        schema="parranda",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop recipe_ingredients and recipes.ingredient_count."""
+    op.drop_index(
+        "ix_recipe_ingredients_head_recipe",
+        table_name="recipe_ingredients",
+        schema="parranda",
+    )
+    op.drop_index(
+        "ix_recipe_ingredients_name_recipe",
+        table_name="recipe_ingredients",
+        schema="parranda",
+    )
+    op.drop_table("recipe_ingredients", schema="parranda")
+    op.drop_column("recipes", "ingredient_count", schema="parranda")
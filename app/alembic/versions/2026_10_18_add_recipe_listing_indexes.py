@@ -0,0 +1,86 @@
+"""Add composite and partial indexes for recipe listings
+
+Revision ID: f2b6d8e4a9c3
+Revises: e7a3c9d2f5b1
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b6d8e4a9c3"
+down_revision: Union[str, Sequence[str], None] = "e7a3c9d2f5b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Single-column indexes made redundant by the composites below
+SUPERSEDED_INDEXES = (
+    ("idx_recipes_author_user_id", "author_user_id"),
+    ("idx_recipes_category", "category"),
+    ("idx_recipes_is_published", "is_published"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index recipe listings in their (created_at, id) order."""
+    # Listings order by (created_at DESC, id DESC) for keyset pagination
+    op.create_index(
+        "ix_recipes_published_created",
+        "recipes",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        schema="parranda",
+        postgresql_where=sa.text("is_published"),
+    )
+    for name, column in (
+        ("ix_recipes_author_created", "author_user_id"),
+        ("ix_recipes_category_created", "category"),
+    ):
+        op.create_index(
+            name,
+            "recipes",
+            [column, sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            schema="parranda",
+        )
+    op.create_index(
+        "ix_recipes_tags",
+        "recipes",
+        ["tags"],
+        unique=False,
+        schema="parranda",
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_user_favorite_recipes_user_created",
+        "user_favorite_recipes",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+        schema="parranda",
+    )
+
+    for name, _ in SUPERSEDED_INDEXES:
+        op.drop_index(name, table_name="recipes", schema="parranda")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore the single-column recipe indexes."""
+    for name, column in SUPERSEDED_INDEXES:
+        op.create_index(name, "recipes", [column], schema="parranda")
+
+    op.drop_index(
+        "ix_user_favorite_recipes_user_created",
+        table_name="user_favorite_recipes",
+        schema="parranda",
+    )
+    for name in (
+        "ix_recipes_tags",
+        "ix_recipes_category_created",
+        "ix_recipes_author_created",
+        "ix_recipes_published_created",
+    ):
+        op.drop_index(name, table_name="recipes", schema="parranda")
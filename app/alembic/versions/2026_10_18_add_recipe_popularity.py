@@ -0,0 +1,134 @@
+"""Add favorite count and trending score to recipes
+
+Revision ID: e7a3c9d2f5b1
+Revises: c4d8a2f1b6e3
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3c9d2f5b1"
+down_revision: Union[str, Sequence[str], None] = "c4d8a2f1b6e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add favorite_count (trigger-maintained) and trending_score."""
+    op.add_column(
+        "recipes",
+        sa.Column("favorite_count", sa.Integer(), server_default="0", nullable=False),
+        schema="parranda",
+    )
+    op.add_column(
+        "recipes",
+        sa.Column("trending_score", sa.Float(), server_default="0", nullable=False),
+        schema="parranda",
+    )
+
+    # Keep favorite_count in step with every insert/delete, including
+    # cascades from deleted users
+    op.execute(
+        """
+        CREATE FUNCTION parranda.recipe_favorite_count_trigger()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE parranda.recipes SET favorite_count = favorite_count + 1
+                WHERE id = NEW.recipe_id;
+            ELSE
+                UPDATE parranda.recipes SET favorite_count = favorite_count - 1
+                WHERE id = OLD.recipe_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER user_favorite_recipes_count_update
+        AFTER INSERT OR DELETE ON parranda.user_favorite_recipes
+        FOR EACH ROW EXECUTE FUNCTION parranda.recipe_favorite_count_trigger()
+        """
+    )
+
+    # Backfill existing favorites
+    op.execute(
+        """
+        UPDATE parranda.recipes r
+        SET favorite_count = agg.favorites
+        FROM (
+            SELECT recipe_id, count(*) AS favorites
+            FROM parranda.user_favorite_recipes
+            GROUP BY recipe_id
+        ) agg
+        WHERE agg.recipe_id = r.id
+        """
+    )
+
+    # Community feed sorts: index scans in sort order
+    for name, column in (
+        ("ix_recipes_published_popular", "favorite_count"),
+        ("ix_recipes_published_trending", "trending_score"),
+    ):
+        op.create_index(
+            name,
+            "recipes",
+            [
+                sa.text(f"{column} DESC"),
+                sa.text("created_at DESC"),
+                sa.text("id DESC"),
+            ],
+            unique=False,
+            schema="parranda",
+            postgresql_where=sa.text("is_published"),
+        )
+
+    # Trending refresh: scan the recent window, probe per recipe
+    op.create_index(
+        "ix_user_favorite_recipes_created_at",
+        "user_favorite_recipes",
+        ["created_at"],
+        unique=False,
+        schema="parranda",
+    )
+    op.create_index(
+        "ix_user_favorite_recipes_recipe_created",
+        "user_favorite_recipes",
+        ["recipe_id", "created_at"],
+        unique=False,
+        schema="parranda",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop favorite_count, trending_score and their indexes."""
+    op.drop_index(
+        "ix_user_favorite_recipes_recipe_created",
+        table_name="user_favorite_recipes",
+        schema="parranda",
+    )
+    op.drop_index(
+        "ix_user_favorite_recipes_created_at",
+        table_name="user_favorite_recipes",
+        schema="parranda",
+    )
+    op.drop_index(
+        "ix_recipes_published_trending", table_name="recipes", schema="parranda"
+    )
+    op.drop_index(
+        "ix_recipes_published_popular", table_name="recipes", schema="parranda"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS user_favorite_recipes_count_update "
+        "ON parranda.user_favorite_recipes"
+    )
+    op.execute("DROP FUNCTION IF EXISTS parranda.recipe_favorite_count_trigger()")
+    op.drop_column("recipes", "trending_score", schema="parranda")
+    op.drop_column("recipes", "favorite_count", schema="parranda")
@@ -0,0 +1,78 @@
+"""Add incremental rating aggregates to recipes
+
+Revision ID: c4d8a2f1b6e3
+Revises: 9b2e4f6a1c87
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8a2f1b6e3"
+down_revision: Union[str, Sequence[str], None] = "9b2e4f6a1c87"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add rating_sum/rating_count/rating_avg and best-rated index."""
+    op.add_column(
+        "recipes",
+        sa.Column("rating_sum", sa.Integer(), server_default="0", nullable=False),
+        schema="parranda",
+    )
+    op.add_column(
+        "recipes",
+        sa.Column("rating_count", sa.Integer(), server_default="0", nullable=False),
+        schema="parranda",
+    )
+    op.add_column(
+        "recipes",
+        sa.Column("rating_avg", sa.Numeric(precision=3, scale=2), nullable=True),
+        schema="parranda",
+    )
+
+    # Backfill from any ratings already stored
+    op.execute(
+        """
+        UPDATE parranda.recipes r
+        SET rating_sum = agg.total,
+            rating_count = agg.votes,
+            rating_avg = round(agg.total::numeric / agg.votes, 2)
+        FROM (
+            SELECT recipe_id, sum(rating) AS total, count(*) AS votes
+            FROM parranda.recipe_ratings
+            GROUP BY recipe_id
+        ) agg
+        WHERE agg.recipe_id = r.id
+        """
+    )
+
+    # "Best rated" community feed: index scan in sort order, ranking recipes
+    # without votes by their legacy editorial rating (as they are displayed)
+    op.create_index(
+        "ix_recipes_published_rating",
+        "recipes",
+        [
+            sa.text("coalesce(rating_avg, rating) DESC NULLS LAST"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+        unique=False,
+        schema="parranda",
+        postgresql_where=sa.text("is_published"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop rating aggregates."""
+    op.drop_index(
+        "ix_recipes_published_rating", table_name="recipes", schema="parranda"
+    )
+    op.drop_column("recipes", "rating_avg", schema="parranda")
+    op.drop_column("recipes", "rating_count", schema="parranda")
+    op.drop_column("recipes", "rating_sum", schema="parranda")
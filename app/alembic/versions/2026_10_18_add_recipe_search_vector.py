@@ -0,0 +1,197 @@
+"""Add full-text search vector to recipes
+
+Revision ID: 3f9c2d7e8a41
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2d7e8a41"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Statement-level triggers on recipe_steps and the transition tables they see
+STEP_TRIGGERS = (
+    ("INSERT", "NEW TABLE AS new_steps"),
+    ("UPDATE", "OLD TABLE AS old_steps NEW TABLE AS new_steps"),
+    ("DELETE", "OLD TABLE AS old_steps"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add recipes.search_vector with GIN index and triggers."""
+
+    # Spanish configuration that ignores accents ("buñuelos" == "bunuelos")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute(
+        "CREATE TEXT SEARCH CONFIGURATION parranda.spanish_unaccent "
+        "(COPY = pg_catalog.spanish)"
+    )
+    op.execute(
+        "ALTER TEXT SEARCH CONFIGURATION parranda.spanish_unaccent "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem"
+    )
+
+    op.add_column(
+        "recipes",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+        schema="parranda",
+    )
+
+    # Weighted document: title (A), tags and ingredients (B),
+    # author alias (C), step instructions (D)
+    op.execute(
+        """
+        CREATE FUNCTION parranda.recipe_search_document(
+            p_recipe_id uuid, p_title text, p_author_alias text, p_tags text[]
+        ) RETURNS tsvector
+        LANGUAGE sql STABLE AS $$
+            SELECT
+                setweight(to_tsvector('parranda.spanish_unaccent',
+                    coalesce(p_title, '')), 'A')
+                || setweight(to_tsvector('parranda.spanish_unaccent',
+                    coalesce(array_to_string(p_tags, ' '), '')), 'B')
+                || setweight(to_tsvector('parranda.spanish_unaccent',
+                    coalesce((
+                        SELECT string_agg(
+                            CASE jsonb_typeof(ingredient)
+                                WHEN 'object' THEN ingredient ->> 'name'
+                                WHEN 'string' THEN ingredient #>> '{}'
+                            END, ' ')
+                        FROM parranda.recipe_steps s,
+                            jsonb_array_elements(
+                                CASE WHEN jsonb_typeof(s.ingredients_json) = 'array'
+                                    THEN s.ingredients_json
+                                    ELSE '[]'::jsonb
+                                END
+                            ) AS ingredient
+                        WHERE s.recipe_id = p_recipe_id
+                    ), '')), 'B')
+                || setweight(to_tsvector('parranda.spanish_unaccent',
+                    coalesce(p_author_alias, '')), 'C')
+                || setweight(to_tsvector('parranda.spanish_unaccent',
+                    coalesce((
+                        SELECT string_agg(s.instruction_md, ' ')
+                        FROM parranda.recipe_steps s
+                        WHERE s.recipe_id = p_recipe_id
+                    ), '')), 'D')
+        $$
+        """
+    )
+
+    # Recompute on recipe insert or when its own searchable columns change
+    op.execute(
+        """
+        CREATE FUNCTION parranda.recipes_search_vector_trigger()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := parranda.recipe_search_document(
+                NEW.id, NEW.title, NEW.author_alias, NEW.tags
+            );
+            RETURN NEW;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER recipes_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, author_alias, tags
+        ON parranda.recipes
+        FOR EACH ROW EXECUTE FUNCTION parranda.recipes_search_vector_trigger()
+        """
+    )
+
+    # Recompute each affected recipe once per statement whenever its steps
+    # change (bulk inserts and step diffs touch many rows of one recipe)
+    op.execute(
+        """
+        CREATE FUNCTION parranda.recipe_steps_search_vector_trigger()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        DECLARE
+            changed uuid[];
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT array_agg(DISTINCT recipe_id) INTO changed FROM new_steps;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT array_agg(DISTINCT recipe_id) INTO changed FROM old_steps;
+            ELSE
+                -- Renumbering alone leaves the document unchanged
+                SELECT array_agg(DISTINCT affected.recipe_id) INTO changed
+                FROM old_steps o
+                JOIN new_steps n ON n.id = o.id,
+                    unnest(ARRAY[o.recipe_id, n.recipe_id]) AS affected(recipe_id)
+                WHERE (o.recipe_id, o.instruction_md, o.ingredients_json)
+                    IS DISTINCT FROM
+                    (n.recipe_id, n.instruction_md, n.ingredients_json);
+            END IF;
+
+            UPDATE parranda.recipes r
+            SET search_vector = parranda.recipe_search_document(
+                r.id, r.title, r.author_alias, r.tags
+            )
+            WHERE r.id = ANY(changed);
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    # Transition tables allow a single event per trigger
+    for event, transition_tables in STEP_TRIGGERS:
+        op.execute(
+            f"""
+            CREATE TRIGGER recipe_steps_search_vector_{event.lower()}
+            AFTER {event} ON parranda.recipe_steps
+            REFERENCING {transition_tables}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION parranda.recipe_steps_search_vector_trigger()
+            """
+        )
+
+    # Backfill existing recipes
+    op.execute(
+        """
+        UPDATE parranda.recipes
+        SET search_vector = parranda.recipe_search_document(
+            id, title, author_alias, tags
+        )
+        """
+    )
+
+    op.create_index(
+        "ix_recipes_search_vector",
+        "recipes",
+        ["search_vector"],
+        unique=False,
+        schema="parranda",
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop recipes.search_vector and its triggers."""
+    op.drop_index("ix_recipes_search_vector", table_name="recipes", schema="parranda")
+    for event, _ in STEP_TRIGGERS:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS recipe_steps_search_vector_{event.lower()} "
+            "ON parranda.recipe_steps"
+        )
+    op.execute(
+        "DROP TRIGGER IF EXISTS recipes_search_vector_update ON parranda.recipes"
+    )
+    op.execute("DROP FUNCTION IF EXISTS parranda.recipe_steps_search_vector_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS parranda.recipes_search_vector_trigger()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "parranda.recipe_search_document(uuid, text, text, text[])"
+    )
+    op.drop_column("recipes", "search_vector", schema="parranda")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS parranda.spanish_unaccent")
@@ -0,0 +1,37 @@
+"""Add session expiry index for the reaper
+
+Revision ID: 9b2e4f6a1c87
+Revises: 7d41e0b95c23
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2e4f6a1c87"
+down_revision: Union[str, Sequence[str], None] = "7d41e0b95c23"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index sessions.expires_at and drop unusable sessions."""
+    # Existing rows hold random tokens instead of refresh token digests,
+    # so no refresh request can ever match them
+    op.execute("DELETE FROM parranda.sessions")
+
+    op.create_index(
+        "ix_sessions_expires_at",
+        "sessions",
+        ["expires_at"],
+        unique=False,
+        schema="parranda",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop session expiry index."""
+    op.drop_index("ix_sessions_expires_at", table_name="sessions", schema="parranda")
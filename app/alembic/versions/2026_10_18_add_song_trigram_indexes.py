@@ -0,0 +1,47 @@
+"""Add trigram indexes for song search
+
+Revision ID: 7d41e0b95c23
+Revises: 3f9c2d7e8a41
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d41e0b95c23"
+down_revision: Union[str, Sequence[str], None] = "3f9c2d7e8a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add pg_trgm GIN indexes on song title and artist."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix_songs_title_trgm",
+        "songs",
+        ["title"],
+        unique=False,
+        schema="parranda",
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_songs_artist_trgm",
+        "songs",
+        ["artist"],
+        unique=False,
+        schema="parranda",
+        postgresql_using="gin",
+        postgresql_ops={"artist": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop song trigram indexes."""
+    op.drop_index("ix_songs_artist_trgm", table_name="songs", schema="parranda")
+    op.drop_index("ix_songs_title_trgm", table_name="songs", schema="parranda")
@@ -72,6 +72,7 @@ class RefreshTokenResponse(BaseModel):
     """Refresh token response."""
 
     access_token: str
+    refresh_token: str  # Rotated; the one sent in the request is now invalid
     token_type: str = "bearer"
 
 
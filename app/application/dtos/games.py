@@ -108,8 +108,9 @@ class AnoViejoListResponse(BaseModel):
     """DTO for paginated Año Viejo list."""
 
     items: List[AnoViejoResponse]
-    total: int
+    total: Optional[int] = None  # Omitted when paging by cursor
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # Pass as `after` for the next page
 
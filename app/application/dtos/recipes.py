@@ -3,6 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -87,6 +88,9 @@ class RecipeResponse(BaseModel):
     yield_amount: Optional[str] = None
     category: Optional[str] = None
     rating: Optional[float] = None
+    rating_count: int = 0
+    favorite_count: int = 0
+    is_favorite: Optional[bool] = None  # Only set for authenticated listings
     tags: List[str] = Field(default_factory=list)
     is_published: bool
     is_community: bool
@@ -99,12 +103,105 @@ class RecipeListResponse(BaseModel):
     """Recipe list response with pagination."""
 
     items: List[RecipeResponse]
+    total: Optional[int] = None  # Omitted when paging by cursor
+    page: int
+    page_size: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # Pass as `after` for the next page
+
+
+class RecipeIngredientMatchResponse(BaseModel):
+    """Recipe matched by available ingredients."""
+
+    recipe: RecipeResponse
+    matched_ingredients: List[str]  # Normalized names
+    ingredient_count: int
+    coverage: float  # Share of the recipe's ingredients that matched
+
+
+class RecipeIngredientMatchListResponse(BaseModel):
+    """Ingredient match list response with pagination."""
+
+    items: List[RecipeIngredientMatchResponse]
     total: int
     page: int
     page_size: int
     total_pages: int
 
 
+class FacetCount(BaseModel):
+    """Number of published recipes for a facet value."""
+
+    value: str
+    count: int
+
+
+class RecipeFacetsResponse(BaseModel):
+    """Category and tag facet counts."""
+
+    category: Optional[str] = None  # Tag counts are scoped to this category
+    categories: List[FacetCount]
+    tags: List[FacetCount]
+
+
+class RecipeExportItem(CreateRecipeRequest):
+    """Recipe as exported (one NDJSON line; importable as-is)."""
+
+    id: str
+    created_at: datetime
+
+
+class BulkImportError(BaseModel):
+    """Import failure for one NDJSON line."""
+
+    line: int
+    error: str
+
+
+class BulkImportResponse(BaseModel):
+    """Bulk import summary."""
+
+    imported: int
+    failed: int
+    errors: List[BulkImportError] = Field(default_factory=list)
+
+
+class RateRecipeRequest(BaseModel):
+    """Recipe rating request."""
+
+    rating: int = Field(..., ge=1, le=5)
+
+
+class RecipeRatingResponse(BaseModel):
+    """Recipe rating aggregates after a vote."""
+
+    recipe_id: str
+    user_rating: Optional[int] = None  # None after the rating is removed
+    rating_avg: Optional[float] = None
+    rating_count: int = 0
+
+
+class FavoriteOperation(BaseModel):
+    """Set or clear one favorite."""
+
+    recipe_id: UUID
+    favorite: bool
+
+
+class BatchFavoritesRequest(BaseModel):
+    """Favorite operations applied in order (the last one per recipe wins)."""
+
+    operations: List[FavoriteOperation] = Field(..., max_length=500)
+
+
+class BatchFavoritesResponse(BaseModel):
+    """Outcome of a favorites batch."""
+
+    added: List[str] = Field(default_factory=list)
+    removed: List[str] = Field(default_factory=list)
+    not_found: List[str] = Field(default_factory=list)  # Unknown recipes to add
+
+
 class RecipeFilterParams(BaseModel):
     """Recipe filter parameters."""
 
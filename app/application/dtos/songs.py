@@ -74,8 +74,9 @@ class SongListResponse(BaseModel):
     """DTO for paginated song list response."""
 
     items: List[SongResponse]
-    total: int
+    total: Optional[int] = None  # Omitted when paging by cursor
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # Pass as `after` for the next page
 
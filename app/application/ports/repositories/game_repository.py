@@ -11,59 +11,71 @@ class GameStatsRepositoryPort(ABC):
     """Abstract base class for game stats repository."""
 
     @abstractmethod
-    def get_by_user_and_game(
+    async def get_by_user_and_game(
         self, user_id: UUID, game_type: str
     ) -> Optional[UserGameStats]:
         """Get game stats by user ID and game type."""
         pass
 
     @abstractmethod
-    def get_all_by_user(self, user_id: UUID) -> List[UserGameStats]:
+    async def get_all_by_user(self, user_id: UUID) -> List[UserGameStats]:
         """Get all game stats for a user."""
         pass
 
     @abstractmethod
-    def create(self, stats: UserGameStats) -> UserGameStats:
+    async def create(self, stats: UserGameStats) -> UserGameStats:
         """Create new game stats."""
         pass
 
     @abstractmethod
-    def update(self, stats: UserGameStats) -> UserGameStats:
+    async def update(self, stats: UserGameStats) -> UserGameStats:
         """Update existing game stats."""
         pass
 
+    @abstractmethod
+    async def record_game(
+        self, user_id: UUID, game_type: str, score: int, won: bool
+    ) -> UserGameStats:
+        """Atomically add a played game to the user's stats."""
+        pass
+
 
 class AnoViejoRepositoryPort(ABC):
     """Abstract base class for Año Viejo repository."""
 
     @abstractmethod
-    def create(self, config: AnoViejoConfig) -> AnoViejoConfig:
+    async def create(self, config: AnoViejoConfig) -> AnoViejoConfig:
         """Create a new Año Viejo configuration."""
         pass
 
     @abstractmethod
-    def get_by_id(self, config_id: UUID) -> Optional[AnoViejoConfig]:
+    async def get_by_id(self, config_id: UUID) -> Optional[AnoViejoConfig]:
         """Get Año Viejo by ID."""
         pass
 
     @abstractmethod
-    def get_all_by_user(
+    async def get_all_by_user(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 10,
         include_burned: bool = True,
-    ) -> tuple[List[AnoViejoConfig], int]:
-        """Get all Año Viejo configs for a user."""
+        after: Optional[str] = None,
+        include_total: bool = True,
+    ) -> tuple[List[AnoViejoConfig], Optional[int], Optional[str]]:
+        """Get all Año Viejo configs for a user.
+
+        Returns (configs, total count or None, next cursor or None).
+        """
         pass
 
     @abstractmethod
-    def update(self, config: AnoViejoConfig) -> AnoViejoConfig:
+    async def update(self, config: AnoViejoConfig) -> AnoViejoConfig:
         """Update an existing Año Viejo."""
         pass
 
     @abstractmethod
-    def delete(self, config_id: UUID) -> bool:
+    async def delete(self, config_id: UUID) -> bool:
         """Delete an Año Viejo by ID."""
         pass
 
@@ -1,7 +1,8 @@
 """Recipe repository port."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
 from app.domain.entities.recipe import Recipe
@@ -11,17 +12,44 @@ class RecipeRepository(ABC):
     """Recipe repository interface."""
 
     @abstractmethod
-    def create(self, recipe: Recipe) -> Recipe:
-        """Create a new recipe with its steps."""
+    async def create(
+        self, recipe: Recipe, ingredients: Optional[List[str]] = None
+    ) -> Recipe:
+        """Create a new recipe with its steps and normalized ingredient names."""
         pass
 
     @abstractmethod
-    def get_by_id(self, recipe_id: UUID) -> Optional[Recipe]:
+    async def create_many(
+        self, recipes: List[Recipe], ingredients: List[List[str]]
+    ) -> None:
+        """Create a batch of recipes in one transaction (all or nothing).
+
+        Raises ValidationError when the store rejects a row.
+        """
+        pass
+
+    @abstractmethod
+    def stream_published(self, fetch_size: int = 500) -> AsyncIterator[Recipe]:
+        """Stream published recipes with their steps, oldest first."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, recipe_id: UUID) -> Optional[Recipe]:
         """Get recipe by ID with steps."""
         pass
 
     @abstractmethod
-    def get_all(
+    async def get_for_update(
+        self, recipe_id: UUID, include_steps: bool = True
+    ) -> Optional[Recipe]:
+        """Get and lock a recipe for a following update in the same transaction.
+
+        Without ``include_steps`` the recipe comes back with no steps.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all(
         self,
         page: int = 1,
         page_size: int = 10,
@@ -31,47 +59,150 @@ class RecipeRepository(ABC):
         author_user_id: Optional[UUID] = None,
         search: Optional[str] = None,
         tags: Optional[List[str]] = None,
-    ) -> Tuple[List[Recipe], int]:
+        after: Optional[str] = None,
+        include_total: bool = True,
+        include_steps: bool = False,
+        sort: str = "recent",
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[Recipe], Optional[int], Optional[str]]:
         """
         Get all recipes with filters and pagination.
-        
+
+        When ``after`` is given, rows are fetched by keyset from that cursor
+        instead of by page offset. Steps are only loaded when
+        ``include_steps`` is set; otherwise recipes come back with no steps.
+        ``sort`` of ``"best_rated"``, ``"popular"`` or ``"trending"`` orders by
+        displayed rating (user average, else legacy rating), favorite count or
+        trending score and pages by offset, as does ranking by ``search``; both
+        reject ``after`` with a ValidationError.
+        With ``viewer_id``, each recipe's ``is_favorite`` is set for that user.
+
         Returns:
-            Tuple of (recipes list, total count)
+            Tuple of (recipes list, total count or None, next cursor or None)
         """
         pass
 
     @abstractmethod
-    def get_by_user(
+    async def get_by_user(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 10,
-    ) -> Tuple[List[Recipe], int]:
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        include_steps: bool = False,
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[Recipe], Optional[int], Optional[str]]:
         """Get recipes by user ID."""
         pass
 
     @abstractmethod
-    def get_community_recipes(
+    async def get_community_recipes(
         self,
         page: int = 1,
         page_size: int = 10,
         category: Optional[str] = None,
-    ) -> Tuple[List[Recipe], int]:
+        search: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
+        include_steps: bool = False,
+        sort: str = "recent",
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[Recipe], Optional[int], Optional[str]]:
         """Get community (published) recipes."""
         pass
 
     @abstractmethod
-    def update(self, recipe: Recipe) -> Recipe:
-        """Update recipe and its steps."""
+    async def get_facets(
+        self, category: Optional[str] = None
+    ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """Get published recipe counts per category and per tag.
+
+        Tag counts are restricted to ``category`` when given.
+
+        Returns:
+            Tuple of ((category, count) list, (tag, count) list)
+        """
+        pass
+
+    @abstractmethod
+    async def refresh_trending_scores(
+        self, half_life_hours: float, window_days: int
+    ) -> int:
+        """Recompute time-decayed trending scores; returns rows updated."""
+        pass
+
+    @abstractmethod
+    async def get_user_favorites(
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 10,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        include_steps: bool = False,
+    ) -> Tuple[List[Recipe], int]:
+        """Get user favorite recipes."""
+        pass
+
+    @abstractmethod
+    async def rate(
+        self, user_id: UUID, recipe_id: UUID, rating: int
+    ) -> Optional[Tuple[Optional[Decimal], int]]:
+        """
+        Upsert a user's rating and update the recipe's aggregates.
+
+        Returns:
+            Tuple of (rating average, rating count), or None if no recipe
+        """
+        pass
+
+    @abstractmethod
+    async def remove_rating(
+        self, user_id: UUID, recipe_id: UUID
+    ) -> Optional[Tuple[Optional[Decimal], int]]:
+        """Remove a user's rating; same return value as rate()."""
+        pass
+
+    @abstractmethod
+    async def update(
+        self,
+        recipe: Recipe,
+        update_steps: bool = True,
+        ingredients: Optional[List[str]] = None,
+    ) -> Recipe:
+        """Update recipe and, when update_steps is set, its steps.
+
+        ``ingredients`` replaces the normalized ingredient names when given.
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_ingredients(
+        self,
+        names: List[str],
+        page: int = 1,
+        page_size: int = 10,
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[Tuple[Recipe, List[str]]], int]:
+        """Published recipes using any of the normalized ``names``.
+
+        An ingredient matches a name equal to it or to its head noun (its
+        first word, so "leche" matches "leche fria"). Ordered by ingredient
+        coverage; each recipe is paired with the ingredients it matched.
+
+        Returns:
+            Tuple of ((recipe, matched names) list, total count)
+        """
         pass
 
     @abstractmethod
-    def delete(self, recipe_id: UUID) -> bool:
+    async def delete(self, recipe_id: UUID) -> bool:
         """Delete recipe by ID."""
         pass
 
     @abstractmethod
-    def exists(self, recipe_id: UUID) -> bool:
+    async def exists(self, recipe_id: UUID) -> bool:
         """Check if recipe exists."""
         pass
 
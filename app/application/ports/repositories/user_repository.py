@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from typing import Optional
+from uuid import UUID
 
 from app.domain.entities.user import User
 from app.domain.value_objects.email_address import EmailAddress
@@ -11,26 +12,31 @@ class UserRepository(ABC):
     """User repository interface."""
 
     @abstractmethod
-    def create(self, user: User) -> User:
+    async def create(self, user: User) -> User:
         """Create a new user."""
         pass
 
     @abstractmethod
-    def get_by_id(self, user_id: str) -> Optional[User]:
+    async def get_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID."""
         pass
 
     @abstractmethod
-    def get_by_email(self, email: EmailAddress) -> Optional[User]:
+    async def get_active_status(self, user_id: UUID) -> Optional[bool]:
+        """Get user's is_active flag (None if the user does not exist)."""
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email: EmailAddress) -> Optional[User]:
         """Get user by email."""
         pass
 
     @abstractmethod
-    def get_by_alias(self, alias: str) -> Optional[User]:
+    async def get_by_alias(self, alias: str) -> Optional[User]:
         """Get user by alias."""
         pass
 
     @abstractmethod
-    def update(self, user: User) -> User:
+    async def update(self, user: User) -> User:
         """Update user."""
         pass
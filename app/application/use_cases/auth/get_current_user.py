@@ -10,10 +10,10 @@ class GetCurrentUserUseCase:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def execute(self, user_id: str) -> UserResponse:
+    async def execute(self, user_id: str) -> UserResponse:
         """Execute get current user."""
         # Get user by ID
-        user = self.user_repository.get_by_id(user_id)
+        user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise ValueError("User not found")
 
@@ -1,7 +1,5 @@
 """Login user use case."""
 
-from datetime import datetime, timedelta, timezone
-
 from app.application.dtos.auth import AuthResponse, LoginRequest, UserResponse
 from app.application.ports.repositories.user_repository import UserRepository
 from app.domain.entities.session import Session as SessionEntity
@@ -10,8 +8,11 @@ from app.domain.value_objects.email_address import EmailAddress
 from app.infrastructure.persistence.sqlalchemy.repositories.session import (
     SessionRepository,
 )
-from app.infrastructure.security.jwt_token_service import JWTTokenService
-from app.infrastructure.security.password_hasher import verify_password
+from app.infrastructure.security.jwt_token_service import (
+    JWTTokenService,
+    token_digest,
+)
+from app.infrastructure.security.password_hasher import verify_and_update
 
 
 class LoginUserUseCase:
@@ -27,7 +28,7 @@ class LoginUserUseCase:
         self.session_repository = session_repository
         self.jwt_service = jwt_service
 
-    def execute(self, request: LoginRequest) -> AuthResponse:
+    async def execute(self, request: LoginRequest) -> AuthResponse:
         """Execute user login."""
         # Validate required fields
         if not request.email or not request.email.strip():
@@ -37,7 +38,7 @@ class LoginUserUseCase:
             raise ValidationError("La contraseña es requerida")
 
         # Get user by email
-        user = self.user_repository.get_by_email(EmailAddress(request.email))
+        user = await self.user_repository.get_by_email(EmailAddress(request.email))
         if not user:
             raise UnauthorizedError("Correo electrónico o contraseña incorrectos")
 
@@ -46,11 +47,16 @@ class LoginUserUseCase:
             raise UnauthorizedError("La cuenta de usuario está desactivada")
 
         # Verify password
-        if not user.password_hash or not verify_password(
-            request.password, user.password_hash
-        ):
+        if not user.password_hash:
+            raise UnauthorizedError("Correo electrónico o contraseña incorrectos")
+        valid, new_hash = await verify_and_update(request.password, user.password_hash)
+        if not valid:
             raise UnauthorizedError("Correo electrónico o contraseña incorrectos")
 
+        # Upgrade hashes made with an old scheme or cost factor
+        if new_hash:
+            await self.user_repository.update(user.user_id, {"password_hash": new_hash})
+
         # Create token pair
         token_data = {
             "sub": str(user.user_id),
@@ -60,18 +66,13 @@ class LoginUserUseCase:
             data=token_data
         )
 
-        # Create session
-        session_token_hash = self.jwt_service.generate_session_token()
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            days=30
-        )  # 30 days for refresh token
-
+        # Create session keyed by the refresh token digest
         session = SessionEntity.create(
             user_id=user.user_id,
-            session_token_hash=session_token_hash,
-            expires_at=expires_at,
+            session_token_hash=token_digest(refresh_token),
+            expires_at=self.jwt_service.refresh_expires_at(),
         )
-        self.session_repository.add(session)
+        await self.session_repository.add(session)
 
         # Return response
         return AuthResponse(
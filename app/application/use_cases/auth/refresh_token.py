@@ -7,7 +7,10 @@ from app.domain.errors import UnauthorizedError
 from app.infrastructure.persistence.sqlalchemy.repositories.session import (
     SessionRepository,
 )
-from app.infrastructure.security.jwt_token_service import JWTTokenService
+from app.infrastructure.security.jwt_token_service import (
+    JWTTokenService,
+    token_digest,
+)
 
 
 class RefreshTokenUseCase:
@@ -21,21 +24,35 @@ class RefreshTokenUseCase:
         self.jwt_service = jwt_service
         self.session_repository = session_repository
 
-    def execute(self, request: RefreshTokenRequest) -> RefreshTokenResponse:
-        """Refresh access token using refresh token."""
+    async def execute(self, request: RefreshTokenRequest) -> RefreshTokenResponse:
+        """Refresh access token and rotate the refresh token."""
         # Verify refresh token
         payload = self.jwt_service.verify_refresh_token(request.refresh_token)
         if not payload:
             raise UnauthorizedError("Invalid refresh token")
+        try:
+            user_id = UUID(str(payload.get("sub")))
+        except ValueError:
+            raise UnauthorizedError("Invalid refresh token")
 
-        user_id = UUID(payload.get("sub"))
-
-        # Check if session exists and is valid
-        session = self.session_repository.get_by_token_hash(request.refresh_token)
-        if not session or session.is_expired():
+        token_data = {"sub": payload.get("sub")}
+        if payload.get("email"):
+            token_data["email"] = payload["email"]
+        access_token, refresh_token = self.jwt_service.create_token_pair(
+            data=token_data
+        )
+
+        # Swap the session over to the new token (rejects reused tokens and
+        # tokens whose subject does not own the session)
+        rotated = await self.session_repository.rotate_token_hash(
+            token_digest(request.refresh_token),
+            token_digest(refresh_token),
+            user_id,
+            self.jwt_service.refresh_expires_at(),
+        )
+        if not rotated:
             raise UnauthorizedError("Invalid or expired refresh token")
 
-        # Create new access token
-        access_token = self.jwt_service.create_access_token(data={"sub": str(user_id)})
-
-        return RefreshTokenResponse(access_token=access_token, token_type="bearer")
+        return RefreshTokenResponse(
+            access_token=access_token, refresh_token=refresh_token, token_type="bearer"
+        )
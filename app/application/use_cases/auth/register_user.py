@@ -13,16 +13,18 @@ class RegisterUserUseCase:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def execute(self, request: RegisterRequest) -> UserResponse:
+    async def execute(self, request: RegisterRequest) -> UserResponse:
         """Execute user registration."""
         # Check if user already exists
-        existing_user = self.user_repository.get_by_email(EmailAddress(request.email))
+        existing_user = await self.user_repository.get_by_email(
+            EmailAddress(request.email)
+        )
         if existing_user:
             raise ValueError("User with this email already exists")
 
         # Check alias uniqueness if provided
         if request.alias:
-            existing_alias = self.user_repository.get_by_alias(request.alias)
+            existing_alias = await self.user_repository.get_by_alias(request.alias)
             if existing_alias:
                 raise ValueError("Alias already taken")
 
@@ -36,10 +38,10 @@ class RegisterUserUseCase:
 
         # Hash password if provided
         if request.password:
-            user.password_hash = hash_password(request.password)
+            user.password_hash = await hash_password(request.password)
 
         # Save user
-        saved_user = self.user_repository.create(user)
+        saved_user = await self.user_repository.create(user)
 
         # Return response
         return UserResponse(
@@ -11,10 +11,12 @@ class UpdateProfileUseCase:
     def __init__(self, user_repository: Any):
         self.user_repository = user_repository
 
-    def execute(self, user_id: str, request: UpdateProfileRequest) -> UserResponse:
+    async def execute(
+        self, user_id: str, request: UpdateProfileRequest
+    ) -> UserResponse:
         """Update user profile."""
         # Get existing user to verify it exists
-        user = self.user_repository.get_by_id(user_id)
+        user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise ValueError("User not found")
 
@@ -30,7 +32,7 @@ class UpdateProfileUseCase:
             update_data["avatar_url"] = request.avatar_url
 
         if update_data:
-            updated_user = self.user_repository.update(user_id, update_data)
+            updated_user = await self.user_repository.update(user_id, update_data)
         else:
             updated_user = user
 
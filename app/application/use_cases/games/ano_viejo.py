@@ -27,7 +27,9 @@ class CreateAnoViejoUseCase:
     def __init__(self, repository: AnoViejoRepositoryPort):
         self.repository = repository
 
-    def execute(self, user_id: UUID, request: CreateAnoViejoRequest) -> AnoViejoResponse:
+    async def execute(
+        self, user_id: UUID, request: CreateAnoViejoRequest
+    ) -> AnoViejoResponse:
         """Execute the use case."""
         config = AnoViejoConfig(
             id=uuid4(),
@@ -39,7 +41,7 @@ class CreateAnoViejoUseCase:
             created_at=datetime.now(timezone.utc),
         )
 
-        created = self.repository.create(config)
+        created = await self.repository.create(config)
 
         return AnoViejoResponse(
             id=created.id,
@@ -58,9 +60,9 @@ class GetAnoViejoUseCase:
     def __init__(self, repository: AnoViejoRepositoryPort):
         self.repository = repository
 
-    def execute(self, config_id: UUID) -> AnoViejoResponse:
+    async def execute(self, config_id: UUID) -> AnoViejoResponse:
         """Execute the use case."""
-        config = self.repository.get_by_id(config_id)
+        config = await self.repository.get_by_id(config_id)
 
         if not config:
             raise AnoViejoNotFoundError(f"Año Viejo with ID {config_id} not found")
@@ -82,19 +84,23 @@ class ListAnoViejoUseCase:
     def __init__(self, repository: AnoViejoRepositoryPort):
         self.repository = repository
 
-    def execute(
+    async def execute(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 10,
         include_burned: bool = True,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> AnoViejoListResponse:
         """Execute the use case."""
-        configs, total = self.repository.get_all_by_user(
+        configs, total, cursor = await self.repository.get_all_by_user(
             user_id=user_id,
             page=page,
             page_size=page_size,
             include_burned=include_burned,
+            after=after,
+            include_total=include_total,
         )
 
         items = [
@@ -110,7 +116,9 @@ class ListAnoViejoUseCase:
             for c in configs
         ]
 
-        total_pages = max(1, math.ceil(total / page_size))
+        total_pages = (
+            max(1, math.ceil(total / page_size)) if total is not None else None
+        )
 
         return AnoViejoListResponse(
             items=items,
@@ -118,6 +126,7 @@ class ListAnoViejoUseCase:
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=cursor,
         )
 
 
@@ -127,11 +136,11 @@ class UpdateAnoViejoUseCase:
     def __init__(self, repository: AnoViejoRepositoryPort):
         self.repository = repository
 
-    def execute(
+    async def execute(
         self, config_id: UUID, user_id: UUID, request: UpdateAnoViejoRequest
     ) -> AnoViejoResponse:
         """Execute the use case."""
-        config = self.repository.get_by_id(config_id)
+        config = await self.repository.get_by_id(config_id)
 
         if not config:
             raise AnoViejoNotFoundError(f"Año Viejo with ID {config_id} not found")
@@ -150,7 +159,7 @@ class UpdateAnoViejoUseCase:
         if request.config_json is not None:
             config.config_json = request.config_json
 
-        updated = self.repository.update(config)
+        updated = await self.repository.update(config)
 
         return AnoViejoResponse(
             id=updated.id,
@@ -169,9 +178,9 @@ class BurnAnoViejoUseCase:
     def __init__(self, repository: AnoViejoRepositoryPort):
         self.repository = repository
 
-    def execute(self, config_id: UUID, user_id: UUID) -> AnoViejoResponse:
+    async def execute(self, config_id: UUID, user_id: UUID) -> AnoViejoResponse:
         """Execute the use case - burn the Año Viejo!"""
-        config = self.repository.get_by_id(config_id)
+        config = await self.repository.get_by_id(config_id)
 
         if not config:
             raise AnoViejoNotFoundError(f"Año Viejo with ID {config_id} not found")
@@ -188,7 +197,7 @@ class BurnAnoViejoUseCase:
         config.is_burned = True
         config.burned_at = datetime.now(timezone.utc)
 
-        burned = self.repository.update(config)
+        burned = await self.repository.update(config)
 
         return AnoViejoResponse(
             id=burned.id,
@@ -207,9 +216,9 @@ class DeleteAnoViejoUseCase:
     def __init__(self, repository: AnoViejoRepositoryPort):
         self.repository = repository
 
-    def execute(self, config_id: UUID, user_id: UUID) -> bool:
+    async def execute(self, config_id: UUID, user_id: UUID) -> bool:
         """Execute the use case."""
-        config = self.repository.get_by_id(config_id)
+        config = await self.repository.get_by_id(config_id)
 
         if not config:
             raise AnoViejoNotFoundError(f"Año Viejo with ID {config_id} not found")
@@ -218,5 +227,5 @@ class DeleteAnoViejoUseCase:
         if config.user_id != user_id:
             raise PermissionError("You don't have permission to delete this Año Viejo")
 
-        return self.repository.delete(config_id)
+        return await self.repository.delete(config_id)
 
@@ -10,7 +10,6 @@ from app.application.dtos.games import (
     UpdateGameStatsRequest,
 )
 from app.application.ports.repositories.game_repository import GameStatsRepositoryPort
-from app.domain.entities.game import UserGameStats
 
 
 class GetGameStatsUseCase:
@@ -19,9 +18,9 @@ class GetGameStatsUseCase:
     def __init__(self, repository: GameStatsRepositoryPort):
         self.repository = repository
 
-    def execute(self, user_id: UUID) -> GameStatsListResponse:
+    async def execute(self, user_id: UUID) -> GameStatsListResponse:
         """Get all game stats for a user."""
-        stats = self.repository.get_all_by_user(user_id)
+        stats = await self.repository.get_all_by_user(user_id)
 
         items = [
             GameStatsResponse(
@@ -41,9 +40,9 @@ class GetGameStatsUseCase:
 
         return GameStatsListResponse(items=items, total=len(items))
 
-    def execute_by_game(self, user_id: UUID, game_type: str) -> GameStatsResponse:
+    async def execute_by_game(self, user_id: UUID, game_type: str) -> GameStatsResponse:
         """Get stats for a specific game."""
-        stats = self.repository.get_by_user_and_game(user_id, game_type)
+        stats = await self.repository.get_by_user_and_game(user_id, game_type)
 
         if not stats:
             # Return empty stats
@@ -80,42 +79,16 @@ class UpdateGameStatsUseCase:
     def __init__(self, repository: GameStatsRepositoryPort):
         self.repository = repository
 
-    def execute(
+    async def execute(
         self, user_id: UUID, request: UpdateGameStatsRequest
     ) -> GameStatsResponse:
         """Update stats after a game is played."""
-        now = datetime.now(timezone.utc)
-
-        # Get existing stats or create new
-        stats = self.repository.get_by_user_and_game(user_id, request.game_type)
-
-        if stats:
-            # Update existing stats
-            stats.games_played += 1
-            if request.won:
-                stats.games_won += 1
-            stats.total_score += request.score
-            if stats.best_score is None or request.score > stats.best_score:
-                stats.best_score = request.score
-            stats.last_played_at = now
-            stats.updated_at = now
-
-            updated_stats = self.repository.update(stats)
-        else:
-            # Create new stats
-            stats = UserGameStats(
-                id=uuid4(),
-                user_id=user_id,
-                game_type=request.game_type,
-                games_played=1,
-                games_won=1 if request.won else 0,
-                best_score=request.score,
-                total_score=request.score,
-                last_played_at=now,
-                created_at=now,
-                updated_at=now,
-            )
-            updated_stats = self.repository.create(stats)
+        updated_stats = await self.repository.record_game(
+            user_id=user_id,
+            game_type=request.game_type,
+            score=request.score,
+            won=request.won,
+        )
 
         return GameStatsResponse(
             id=updated_stats.id,
@@ -28,10 +28,10 @@ class CreateNovenaDayUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute(self, request: CreateNovenaDayRequest) -> NovenaDayResponse:
+    async def execute(self, request: CreateNovenaDayRequest) -> NovenaDayResponse:
         """Create a new novena day with sections."""
         # Check if day already exists
-        existing = self.repository.get_day_by_number(request.day_number)
+        existing = await self.repository.get_day_by_number(request.day_number)
         if existing:
             raise ValueError(f"Day {request.day_number} already exists")
 
@@ -40,7 +40,7 @@ class CreateNovenaDayUseCase:
             day_number=request.day_number,
             title=request.title,
         )
-        created_day = self.repository.create_day(day)
+        created_day = await self.repository.create_day(day)
 
         # Create sections
         sections: List[NovenaSectionResponse] = []
@@ -51,7 +51,7 @@ class CreateNovenaDayUseCase:
                 position=section_req.position,
                 content_md=section_req.content_md,
             )
-            created_section = self.repository.create_section(section)
+            created_section = await self.repository.create_section(section)
             sections.append(
                 NovenaSectionResponse(
                     id=str(created_section.section_id),
@@ -76,22 +76,22 @@ class GetNovenaDayUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute_by_id(self, day_id: UUID) -> NovenaDayResponse:
+    async def execute_by_id(self, day_id: UUID) -> NovenaDayResponse:
         """Get novena day by ID."""
-        day = self.repository.get_day_by_id(day_id)
+        day = await self.repository.get_day_by_id(day_id)
         if not day:
             raise NovenaDayNotFoundError(f"Day with ID {day_id} not found")
 
-        sections = self.repository.get_sections_by_day(day.day_id)
+        sections = await self.repository.get_sections_by_day(day.day_id)
         return self._to_response(day, sections)
 
-    def execute_by_number(self, day_number: int) -> NovenaDayResponse:
+    async def execute_by_number(self, day_number: int) -> NovenaDayResponse:
         """Get novena day by number."""
-        day = self.repository.get_day_by_number(day_number)
+        day = await self.repository.get_day_by_number(day_number)
         if not day:
             raise NovenaDayNotFoundError(f"Day {day_number} not found")
 
-        sections = self.repository.get_sections_by_day(day.day_id)
+        sections = await self.repository.get_sections_by_day(day.day_id)
         return self._to_response(day, sections)
 
     def _to_response(
@@ -121,24 +121,25 @@ class ListNovenaDaysUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute(self, include_sections: bool = False) -> NovenaDayListResponse:
+    async def execute(self, include_sections: bool = False) -> NovenaDayListResponse:
         """List all novena days."""
-        days = self.repository.get_all_days()
+        if include_sections:
+            days_with_sections = await self.repository.get_all_days_with_sections()
+        else:
+            days = await self.repository.get_all_days()
+            days_with_sections = [(day, []) for day in days]
 
         day_responses = []
-        for day in days:
-            sections = []
-            if include_sections:
-                raw_sections = self.repository.get_sections_by_day(day.day_id)
-                sections = [
-                    NovenaSectionResponse(
-                        id=str(s.section_id),
-                        section_type=s.section_type,
-                        position=s.position,
-                        content_md=s.content_md,
-                    )
-                    for s in sorted(raw_sections, key=lambda x: x.position)
-                ]
+        for day, raw_sections in days_with_sections:
+            sections = [
+                NovenaSectionResponse(
+                    id=str(s.section_id),
+                    section_type=s.section_type,
+                    position=s.position,
+                    content_md=s.content_md,
+                )
+                for s in sorted(raw_sections, key=lambda x: x.position)
+            ]
 
             day_responses.append(
                 NovenaDayResponse(
@@ -162,19 +163,19 @@ class UpdateNovenaDayUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute(
+    async def execute(
         self, day_id: UUID, request: UpdateNovenaDayRequest
     ) -> NovenaDayResponse:
         """Update a novena day."""
-        day = self.repository.get_day_by_id(day_id)
+        day = await self.repository.get_day_by_id(day_id)
         if not day:
             raise NovenaDayNotFoundError(f"Day with ID {day_id} not found")
 
         if request.title is not None:
             day.title = request.title
 
-        updated_day = self.repository.update_day(day)
-        sections = self.repository.get_sections_by_day(updated_day.day_id)
+        updated_day = await self.repository.update_day(day)
+        sections = await self.repository.get_sections_by_day(updated_day.day_id)
 
         return NovenaDayResponse(
             id=str(updated_day.day_id),
@@ -199,10 +200,10 @@ class DeleteNovenaDayUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute(self, day_id: UUID) -> bool:
+    async def execute(self, day_id: UUID) -> bool:
         """Delete a novena day."""
-        day = self.repository.get_day_by_id(day_id)
+        day = await self.repository.get_day_by_id(day_id)
         if not day:
             raise NovenaDayNotFoundError(f"Day with ID {day_id} not found")
 
-        return self.repository.delete_day(day_id)
+        return await self.repository.delete_day(day_id)
@@ -25,12 +25,12 @@ class CreateNovenaSectionUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute(
+    async def execute(
         self, day_id: UUID, request: CreateNovenaSectionRequest
     ) -> NovenaSectionResponse:
         """Create a new section for a day."""
         # Verify day exists
-        day = self.repository.get_day_by_id(day_id)
+        day = await self.repository.get_day_by_id(day_id)
         if not day:
             raise ValueError(f"Day with ID {day_id} not found")
 
@@ -41,7 +41,7 @@ class CreateNovenaSectionUseCase:
             content_md=request.content_md,
         )
 
-        created = self.repository.create_section(section)
+        created = await self.repository.create_section(section)
 
         return NovenaSectionResponse(
             id=str(created.section_id),
@@ -57,11 +57,11 @@ class UpdateNovenaSectionUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute(
+    async def execute(
         self, section_id: UUID, request: UpdateNovenaSectionRequest
     ) -> NovenaSectionResponse:
         """Update a section."""
-        section = self.repository.get_section_by_id(section_id)
+        section = await self.repository.get_section_by_id(section_id)
         if not section:
             raise NovenaSectionNotFoundError(f"Section with ID {section_id} not found")
 
@@ -72,7 +72,7 @@ class UpdateNovenaSectionUseCase:
         if request.content_md is not None:
             section.content_md = request.content_md
 
-        updated = self.repository.update_section(section)
+        updated = await self.repository.update_section(section)
 
         return NovenaSectionResponse(
             id=str(updated.section_id),
@@ -88,10 +88,10 @@ class DeleteNovenaSectionUseCase:
     def __init__(self, repository: NovenaRepository):
         self.repository = repository
 
-    def execute(self, section_id: UUID) -> bool:
+    async def execute(self, section_id: UUID) -> bool:
         """Delete a section."""
-        section = self.repository.get_section_by_id(section_id)
+        section = await self.repository.get_section_by_id(section_id)
         if not section:
             raise NovenaSectionNotFoundError(f"Section with ID {section_id} not found")
 
-        return self.repository.delete_section(section_id)
+        return await self.repository.delete_section(section_id)
@@ -1,9 +1,12 @@
 """Recipe use cases."""
 
+from .bulk_recipes import BulkImportRecipesUseCase, ExportRecipesUseCase
 from .create_recipe import CreateRecipeUseCase
 from .delete_recipe import DeleteRecipeUseCase
+from .get_facets import GetRecipeFacetsUseCase
 from .get_recipe import GetRecipeUseCase
 from .list_recipes import ListRecipesUseCase
+from .rate_recipe import RateRecipeUseCase
 from .update_recipe import UpdateRecipeUseCase
 
 __all__ = [
@@ -12,5 +15,9 @@ __all__ = [
     "ListRecipesUseCase",
     "UpdateRecipeUseCase",
     "DeleteRecipeUseCase",
+    "RateRecipeUseCase",
+    "GetRecipeFacetsUseCase",
+    "BulkImportRecipesUseCase",
+    "ExportRecipesUseCase",
 ]
 
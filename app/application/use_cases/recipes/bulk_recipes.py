@@ -0,0 +1,174 @@
+"""Bulk recipe import / export use cases (NDJSON)."""
+
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError as PydanticValidationError
+
+from app.application.dtos.recipes import (
+    BulkImportError,
+    BulkImportResponse,
+    CreateRecipeRequest,
+    RecipeExportItem,
+    RecipeStepRequest,
+)
+from app.application.ports.repositories.recipe_repository import RecipeRepository
+from app.application.use_cases.recipes.create_recipe import CreateRecipeUseCase
+from app.domain.entities.recipe import Recipe
+from app.domain.errors import ValidationError
+from app.domain.services.ingredients import extract_ingredient_names
+
+
+class BulkImportRecipesUseCase:
+    """Import NDJSON recipes (one CreateRecipeRequest per line) as drafts.
+
+    Recipes are saved in batches, unpublished; reading stops after
+    ``max_lines`` lines.
+    """
+
+    def __init__(
+        self,
+        recipe_repository: RecipeRepository,
+        batch_size: int = 100,
+        max_line_bytes: int = 1_048_576,
+        max_lines: int = 1000,
+    ):
+        self.recipe_repository = recipe_repository
+        self.batch_size = batch_size
+        self.max_line_bytes = max_line_bytes
+        self.max_lines = max_lines
+
+    async def execute(
+        self, chunks: AsyncIterable[bytes], user_id: Optional[UUID] = None
+    ) -> BulkImportResponse:
+        """Validate each line, insert valid recipes and report failed lines."""
+        errors: List[BulkImportError] = []
+        batch: List[Tuple[int, Recipe]] = []
+        imported = 0
+
+        async for line_number, line in self._lines(chunks):
+            if line_number > self.max_lines:
+                errors.append(
+                    BulkImportError(
+                        line=line_number,
+                        error=f"Import is limited to {self.max_lines} lines",
+                    )
+                )
+                break
+            if line is None:
+                errors.append(
+                    BulkImportError(
+                        line=line_number,
+                        error=f"Line exceeds {self.max_line_bytes} bytes",
+                    )
+                )
+                continue
+            if not line.strip():
+                continue
+            try:
+                request = CreateRecipeRequest.model_validate_json(line)
+            except PydanticValidationError as exc:
+                errors.append(BulkImportError(line=line_number, error=_describe(exc)))
+                continue
+
+            recipe = CreateRecipeUseCase.build_recipe(
+                request, user_id, is_published=False
+            )
+            batch.append((line_number, recipe))
+            if len(batch) >= self.batch_size:
+                imported += await self._save(batch, errors)
+                batch = []
+
+        if batch:
+            imported += await self._save(batch, errors)
+
+        errors.sort(key=lambda e: e.line)
+        return BulkImportResponse(imported=imported, failed=len(errors), errors=errors)
+
+    async def _save(
+        self, batch: List[Tuple[int, Recipe]], errors: List[BulkImportError]
+    ) -> int:
+        """Insert a batch; if it fails, retry line by line to isolate bad rows."""
+        try:
+            await self._create_many([recipe for _, recipe in batch])
+            return len(batch)
+        except ValidationError as exc:
+            if len(batch) == 1:
+                errors.append(BulkImportError(line=batch[0][0], error=exc.message))
+                return 0
+
+        saved = 0
+        for entry in batch:
+            saved += await self._save([entry], errors)
+        return saved
+
+    async def _create_many(self, recipes: List[Recipe]) -> None:
+        """Create recipes with their normalized ingredient names."""
+        ingredients = [
+            extract_ingredient_names(s.ingredients_json for s in recipe.steps)
+            for recipe in recipes
+        ]
+        await self.recipe_repository.create_many(recipes, ingredients)
+
+    async def _lines(
+        self, chunks: AsyncIterable[bytes]
+    ) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+        """Split a byte stream into numbered lines (None for oversized lines)."""
+        buffer = b""
+        line_number = 0
+        oversized = False
+        async for chunk in chunks:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_number += 1
+                too_long = oversized or len(line) > self.max_line_bytes
+                yield line_number, None if too_long else line
+                oversized = False
+            # Drop an overlong partial line instead of buffering it
+            if len(buffer) > self.max_line_bytes:
+                oversized = True
+                buffer = b""
+        if buffer or oversized:
+            too_long = oversized or len(buffer) > self.max_line_bytes
+            yield line_number + 1, None if too_long else buffer
+
+
+class ExportRecipesUseCase:
+    """Export published recipes as NDJSON lines."""
+
+    def __init__(self, recipe_repository: RecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    async def execute(self, fetch_size: int = 500) -> AsyncIterator[str]:
+        """Yield one JSON line per published recipe."""
+        async for recipe in self.recipe_repository.stream_published(fetch_size):
+            item = RecipeExportItem(
+                id=str(recipe.recipe_id),
+                title=recipe.title,
+                author_alias=recipe.author_alias,
+                photo_url=recipe.photo_url,
+                prep_time_minutes=recipe.prep_time_minutes,
+                yield_amount=recipe.yield_amount,
+                category=recipe.category,
+                tags=recipe.tags,
+                created_at=recipe.created_at,
+                steps=[
+                    RecipeStepRequest(
+                        instruction_md=step.instruction_md,
+                        ingredients_json=step.ingredients_json,
+                        time_minutes=step.time_minutes,
+                    )
+                    for step in recipe.steps
+                ],
+            )
+            yield item.model_dump_json() + "\n"
+
+
+def _describe(exc: PydanticValidationError) -> str:
+    """Flatten a pydantic validation error into one message."""
+    messages = []
+    for error in exc.errors():
+        field = " -> ".join(str(loc) for loc in error["loc"])
+        messages.append(f"{field}: {error['msg']}" if field else error["msg"])
+    return "; ".join(messages)
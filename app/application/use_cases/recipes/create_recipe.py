@@ -10,6 +10,7 @@ from app.application.dtos.recipes import (
 )
 from app.application.ports.repositories.recipe_repository import RecipeRepository
 from app.domain.entities.recipe import Recipe, RecipeStep
+from app.domain.services.ingredients import extract_ingredient_names
 
 
 class CreateRecipeUseCase:
@@ -18,13 +19,28 @@ class CreateRecipeUseCase:
     def __init__(self, recipe_repository: RecipeRepository):
         self.recipe_repository = recipe_repository
 
-    def execute(
+    async def execute(
         self,
         request: CreateRecipeRequest,
         user_id: Optional[UUID] = None,
     ) -> RecipeResponse:
         """Execute recipe creation."""
-        # Create domain recipe
+        recipe = self.build_recipe(request, user_id)
+
+        # Save recipe with its normalized ingredient index
+        ingredients = extract_ingredient_names(s.ingredients_json for s in recipe.steps)
+        saved_recipe = await self.recipe_repository.create(recipe, ingredients)
+
+        # Return response
+        return self._to_response(saved_recipe)
+
+    @staticmethod
+    def build_recipe(
+        request: CreateRecipeRequest,
+        user_id: Optional[UUID] = None,
+        is_published: bool = True,
+    ) -> Recipe:
+        """Build the domain recipe (with numbered steps) for a request."""
         recipe = Recipe.create(
             title=request.title,
             author_user_id=user_id,
@@ -34,7 +50,7 @@ class CreateRecipeUseCase:
             yield_amount=request.yield_amount,
             category=request.category,
             tags=request.tags,
-            is_published=True,
+            is_published=is_published,
             is_community=user_id is None,
         )
 
@@ -47,11 +63,7 @@ class CreateRecipeUseCase:
             )
             recipe.add_step(step)
 
-        # Save recipe
-        saved_recipe = self.recipe_repository.create(recipe)
-
-        # Return response
-        return self._to_response(saved_recipe)
+        return recipe
 
     def _to_response(self, recipe: Recipe) -> RecipeResponse:
         """Convert domain entity to response."""
@@ -65,6 +77,8 @@ class CreateRecipeUseCase:
             yield_amount=recipe.yield_amount,
             category=recipe.category,
             rating=float(recipe.rating) if recipe.rating else None,
+            rating_count=recipe.rating_count,
+            favorite_count=recipe.favorite_count,
             tags=recipe.tags,
             is_published=recipe.is_published,
             is_community=recipe.is_community,
@@ -13,14 +13,14 @@ class DeleteRecipeUseCase:
     def __init__(self, recipe_repository: RecipeRepository):
         self.recipe_repository = recipe_repository
 
-    def execute(
+    async def execute(
         self,
         recipe_id: UUID,
         user_id: Optional[UUID] = None,
     ) -> bool:
         """Execute recipe deletion."""
         # Get existing recipe to check ownership
-        recipe = self.recipe_repository.get_by_id(recipe_id)
+        recipe = await self.recipe_repository.get_by_id(recipe_id)
         if not recipe:
             raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
 
@@ -29,5 +29,5 @@ class DeleteRecipeUseCase:
             raise PermissionError("You don't have permission to delete this recipe")
 
         # Delete recipe
-        return self.recipe_repository.delete(recipe_id)
+        return await self.recipe_repository.delete(recipe_id)
 
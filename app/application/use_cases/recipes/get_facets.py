@@ -0,0 +1,22 @@
+"""Get recipe facets use case."""
+
+from typing import Optional
+
+from app.application.dtos.recipes import FacetCount, RecipeFacetsResponse
+from app.application.ports.repositories.recipe_repository import RecipeRepository
+
+
+class GetRecipeFacetsUseCase:
+    """Get category and tag counts for published recipes."""
+
+    def __init__(self, recipe_repository: RecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    async def execute(self, category: Optional[str] = None) -> RecipeFacetsResponse:
+        """Execute get recipe facets."""
+        categories, tags = await self.recipe_repository.get_facets(category)
+        return RecipeFacetsResponse(
+            category=category,
+            categories=[FacetCount(value=v, count=c) for v, c in categories],
+            tags=[FacetCount(value=v, count=c) for v, c in tags],
+        )
@@ -19,9 +19,9 @@ class GetRecipeUseCase:
     def __init__(self, recipe_repository: RecipeRepository):
         self.recipe_repository = recipe_repository
 
-    def execute(self, recipe_id: UUID) -> RecipeResponse:
+    async def execute(self, recipe_id: UUID) -> RecipeResponse:
         """Execute get recipe by ID."""
-        recipe = self.recipe_repository.get_by_id(recipe_id)
+        recipe = await self.recipe_repository.get_by_id(recipe_id)
 
         if not recipe:
             raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
@@ -40,6 +40,8 @@ class GetRecipeUseCase:
             yield_amount=recipe.yield_amount,
             category=recipe.category,
             rating=float(recipe.rating) if recipe.rating else None,
+            rating_count=recipe.rating_count,
+            favorite_count=recipe.favorite_count,
             tags=recipe.tags,
             is_published=recipe.is_published,
             is_community=recipe.is_community,
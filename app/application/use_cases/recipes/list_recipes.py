@@ -5,12 +5,18 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.application.dtos.recipes import (
+    RecipeIngredientMatchListResponse,
+    RecipeIngredientMatchResponse,
     RecipeListResponse,
     RecipeResponse,
     RecipeStepResponse,
 )
 from app.application.ports.repositories.recipe_repository import RecipeRepository
 from app.domain.entities.recipe import Recipe
+from app.domain.errors import ValidationError
+from app.domain.services.ingredients import normalize_ingredient
+
+MAX_INGREDIENTS = 30
 
 
 class ListRecipesUseCase:
@@ -19,7 +25,7 @@ class ListRecipesUseCase:
     def __init__(self, recipe_repository: RecipeRepository):
         self.recipe_repository = recipe_repository
 
-    def execute(
+    async def execute(
         self,
         page: int = 1,
         page_size: int = 10,
@@ -29,9 +35,14 @@ class ListRecipesUseCase:
         author_user_id: Optional[UUID] = None,
         search: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
+        include_steps: bool = False,
+        sort: str = "recent",
+        viewer_id: Optional[UUID] = None,
     ) -> RecipeListResponse:
         """Execute list recipes."""
-        recipes, total = self.recipe_repository.get_all(
+        recipes, total, cursor = await self.recipe_repository.get_all(
             page=page,
             page_size=page_size,
             category=category,
@@ -40,70 +51,153 @@ class ListRecipesUseCase:
             author_user_id=author_user_id,
             search=search,
             tags=tags,
+            after=after,
+            include_total=include_total,
+            include_steps=include_steps,
+            sort=sort,
+            viewer_id=viewer_id,
         )
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
-
         return RecipeListResponse(
             items=[self._to_response(recipe) for recipe in recipes],
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages,
+            total_pages=self._total_pages(total, page_size),
+            next_cursor=cursor,
         )
 
-    def execute_my_recipes(
+    async def execute_my_recipes(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 10,
         category: Optional[str] = None,
         search: Optional[str] = None,
+        include_steps: bool = False,
     ) -> RecipeListResponse:
         """Get recipes for a specific user."""
-        recipes, total = self.recipe_repository.get_by_user(
+        recipes, total, cursor = await self.recipe_repository.get_by_user(
             user_id=user_id,
             page=page,
             page_size=page_size,
             category=category,
             search=search,
+            include_steps=include_steps,
+            viewer_id=user_id,
         )
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
-
         return RecipeListResponse(
             items=[self._to_response(recipe) for recipe in recipes],
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages,
+            total_pages=self._total_pages(total, page_size),
+            next_cursor=cursor,
         )
 
-    def execute_community(
+    async def execute_community(
         self,
         page: int = 1,
         page_size: int = 10,
         category: Optional[str] = None,
         search: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
+        include_steps: bool = False,
+        sort: str = "recent",
+        viewer_id: Optional[UUID] = None,
     ) -> RecipeListResponse:
         """Get community recipes."""
-        recipes, total = self.recipe_repository.get_community_recipes(
+        recipes, total, cursor = await self.recipe_repository.get_community_recipes(
             page=page,
             page_size=page_size,
             category=category,
             search=search,
+            after=after,
+            include_total=include_total,
+            include_steps=include_steps,
+            sort=sort,
+            viewer_id=viewer_id,
+        )
+
+        return RecipeListResponse(
+            items=[self._to_response(recipe) for recipe in recipes],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=self._total_pages(total, page_size),
+            next_cursor=cursor,
         )
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
+    async def execute_favorites(
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 10,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        include_steps: bool = False,
+    ) -> RecipeListResponse:
+        """Get a user's favorite recipes."""
+        recipes, total = await self.recipe_repository.get_user_favorites(
+            user_id=user_id,
+            page=page,
+            page_size=page_size,
+            category=category,
+            search=search,
+            include_steps=include_steps,
+        )
 
         return RecipeListResponse(
             items=[self._to_response(recipe) for recipe in recipes],
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages,
+            total_pages=self._total_pages(total, page_size),
+        )
+
+    async def execute_by_ingredients(
+        self,
+        ingredients: List[str],
+        page: int = 1,
+        page_size: int = 10,
+        viewer_id: Optional[UUID] = None,
+    ) -> RecipeIngredientMatchListResponse:
+        """Rank published recipes by how many of their ingredients are given."""
+        names = sorted({n for n in map(normalize_ingredient, ingredients) if n})
+        if not names:
+            raise ValidationError("At least one ingredient is required")
+        if len(names) > MAX_INGREDIENTS:
+            raise ValidationError(f"At most {MAX_INGREDIENTS} ingredients allowed")
+
+        matches, total = await self.recipe_repository.find_by_ingredients(
+            names, page=page, page_size=page_size, viewer_id=viewer_id
+        )
+
+        return RecipeIngredientMatchListResponse(
+            items=[
+                RecipeIngredientMatchResponse(
+                    recipe=self._to_response(recipe),
+                    matched_ingredients=matched,
+                    ingredient_count=recipe.ingredient_count,
+                    coverage=len(matched) / max(recipe.ingredient_count, 1),
+                )
+                for recipe, matched in matches
+            ],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=self._total_pages(total, page_size),
         )
 
+    @staticmethod
+    def _total_pages(total: Optional[int], page_size: int) -> Optional[int]:
+        """Compute page count (None when the total was not requested)."""
+        if total is None:
+            return None
+        return math.ceil(total / page_size) if total > 0 else 1
+
     def _to_response(self, recipe: Recipe) -> RecipeResponse:
         """Convert domain entity to response."""
         return RecipeResponse(
@@ -116,6 +210,9 @@ class ListRecipesUseCase:
             yield_amount=recipe.yield_amount,
             category=recipe.category,
             rating=float(recipe.rating) if recipe.rating else None,
+            rating_count=recipe.rating_count,
+            favorite_count=recipe.favorite_count,
+            is_favorite=recipe.is_favorite,
             tags=recipe.tags,
             is_published=recipe.is_published,
             is_community=recipe.is_community,
@@ -0,0 +1,50 @@
+"""Rate recipe use case."""
+
+from decimal import Decimal
+from typing import Optional, Tuple
+from uuid import UUID
+
+from app.application.dtos.recipes import RateRecipeRequest, RecipeRatingResponse
+from app.application.ports.repositories.recipe_repository import RecipeRepository
+from app.application.use_cases.recipes.get_recipe import RecipeNotFoundError
+
+
+class RateRecipeUseCase:
+    """Rate a recipe (one vote per user, re-rating replaces the vote)."""
+
+    def __init__(self, recipe_repository: RecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    async def execute(
+        self, recipe_id: UUID, user_id: UUID, request: RateRecipeRequest
+    ) -> RecipeRatingResponse:
+        """Execute rate recipe."""
+        aggregates = await self.recipe_repository.rate(
+            user_id, recipe_id, request.rating
+        )
+        return self._to_response(recipe_id, request.rating, aggregates)
+
+    async def execute_remove(
+        self, recipe_id: UUID, user_id: UUID
+    ) -> RecipeRatingResponse:
+        """Remove the user's rating."""
+        aggregates = await self.recipe_repository.remove_rating(user_id, recipe_id)
+        return self._to_response(recipe_id, None, aggregates)
+
+    def _to_response(
+        self,
+        recipe_id: UUID,
+        user_rating: Optional[int],
+        aggregates: Optional[Tuple[Optional[Decimal], int]],
+    ) -> RecipeRatingResponse:
+        """Convert aggregates to response."""
+        if aggregates is None:
+            raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
+
+        rating_avg, rating_count = aggregates
+        return RecipeRatingResponse(
+            recipe_id=str(recipe_id),
+            user_rating=user_rating,
+            rating_avg=float(rating_avg) if rating_avg is not None else None,
+            rating_count=rating_count,
+        )
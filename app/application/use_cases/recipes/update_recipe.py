@@ -12,6 +12,7 @@ from app.application.dtos.recipes import (
 from app.application.ports.repositories.recipe_repository import RecipeRepository
 from app.application.use_cases.recipes.get_recipe import RecipeNotFoundError
 from app.domain.entities.recipe import Recipe, RecipeStep
+from app.domain.services.ingredients import extract_ingredient_names
 
 
 class UpdateRecipeUseCase:
@@ -20,15 +21,18 @@ class UpdateRecipeUseCase:
     def __init__(self, recipe_repository: RecipeRepository):
         self.recipe_repository = recipe_repository
 
-    def execute(
+    async def execute(
         self,
         recipe_id: UUID,
         request: UpdateRecipeRequest,
         user_id: Optional[UUID] = None,
     ) -> RecipeResponse:
         """Execute recipe update."""
-        # Get existing recipe
-        recipe = self.recipe_repository.get_by_id(recipe_id)
+        # Get and lock existing recipe; its steps are only needed for the
+        # response when the request leaves them unchanged
+        recipe = await self.recipe_repository.get_for_update(
+            recipe_id, include_steps=request.steps is None
+        )
         if not recipe:
             raise RecipeNotFoundError(f"Recipe with ID {recipe_id} not found")
 
@@ -67,8 +71,16 @@ class UpdateRecipeUseCase:
 
         recipe.updated_at = datetime.now()
 
-        # Save updated recipe
-        updated_recipe = self.recipe_repository.update(recipe)
+        # Save updated recipe (steps and ingredients are left alone when
+        # steps are not in the request)
+        ingredients = None
+        if request.steps is not None:
+            ingredients = extract_ingredient_names(
+                s.ingredients_json for s in recipe.steps
+            )
+        updated_recipe = await self.recipe_repository.update(
+            recipe, update_steps=request.steps is not None, ingredients=ingredients
+        )
 
         return self._to_response(updated_recipe)
 
@@ -84,6 +96,8 @@ class UpdateRecipeUseCase:
             yield_amount=recipe.yield_amount,
             category=recipe.category,
             rating=float(recipe.rating) if recipe.rating else None,
+            rating_count=recipe.rating_count,
+            favorite_count=recipe.favorite_count,
             tags=recipe.tags,
             is_published=recipe.is_published,
             is_community=recipe.is_community,
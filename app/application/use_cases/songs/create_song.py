@@ -14,7 +14,7 @@ class CreateSongUseCase:
     def __init__(self, repository: SongRepositoryPort):
         self.repository = repository
 
-    def execute(self, request: CreateSongRequest) -> SongResponse:
+    async def execute(self, request: CreateSongRequest) -> SongResponse:
         """Execute the use case."""
         now = datetime.now(timezone.utc)
 
@@ -31,7 +31,7 @@ class CreateSongUseCase:
             updated_at=now,
         )
 
-        created_song = self.repository.create(song)
+        created_song = await self.repository.create(song)
 
         return SongResponse(
             id=created_song.id,
@@ -12,12 +12,12 @@ class DeleteSongUseCase:
     def __init__(self, repository: SongRepositoryPort):
         self.repository = repository
 
-    def execute(self, song_id: UUID) -> bool:
+    async def execute(self, song_id: UUID) -> bool:
         """Execute the use case."""
-        song = self.repository.get_by_id(song_id)
+        song = await self.repository.get_by_id(song_id)
 
         if not song:
             raise SongNotFoundError(f"Song with ID {song_id} not found")
 
-        return self.repository.delete(song_id)
+        return await self.repository.delete(song_id)
 
@@ -18,9 +18,9 @@ class GetSongUseCase:
     def __init__(self, repository: SongRepositoryPort):
         self.repository = repository
 
-    def execute(self, song_id: UUID) -> SongResponse:
+    async def execute(self, song_id: UUID) -> SongResponse:
         """Execute the use case."""
-        song = self.repository.get_by_id(song_id)
+        song = await self.repository.get_by_id(song_id)
 
         if not song:
             raise SongNotFoundError(f"Song with ID {song_id} not found")
@@ -38,9 +38,9 @@ class GetSongUseCase:
             updated_at=song.updated_at,
         )
 
-    def execute_by_youtube_id(self, youtube_id: str) -> SongResponse:
+    async def execute_by_youtube_id(self, youtube_id: str) -> SongResponse:
         """Get song by YouTube ID."""
-        song = self.repository.get_by_youtube_id(youtube_id)
+        song = await self.repository.get_by_youtube_id(youtube_id)
 
         if not song:
             raise SongNotFoundError(f"Song with YouTube ID {youtube_id} not found")
@@ -13,21 +13,27 @@ class ListSongsUseCase:
     def __init__(self, repository: SongRepositoryPort):
         self.repository = repository
 
-    def execute(
+    async def execute(
         self,
         page: int = 1,
         page_size: int = 10,
         genre: Optional[str] = None,
         is_christmas: Optional[bool] = None,
         search: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
+        fuzzy: bool = False,
     ) -> SongListResponse:
         """Execute the use case."""
-        songs, total = self.repository.get_all(
+        songs, total, cursor = await self.repository.get_all(
             page=page,
             page_size=page_size,
             genre=genre,
             is_christmas=is_christmas,
             search=search,
+            after=after,
+            include_total=include_total,
+            fuzzy=fuzzy,
         )
 
         items = [
@@ -46,7 +52,9 @@ class ListSongsUseCase:
             for song in songs
         ]
 
-        total_pages = max(1, math.ceil(total / page_size))
+        total_pages = (
+            max(1, math.ceil(total / page_size)) if total is not None else None
+        )
 
         return SongListResponse(
             items=items,
@@ -54,5 +62,6 @@ class ListSongsUseCase:
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=cursor,
         )
 
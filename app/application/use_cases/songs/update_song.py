@@ -14,9 +14,9 @@ class UpdateSongUseCase:
     def __init__(self, repository: SongRepositoryPort):
         self.repository = repository
 
-    def execute(self, song_id: UUID, request: UpdateSongRequest) -> SongResponse:
+    async def execute(self, song_id: UUID, request: UpdateSongRequest) -> SongResponse:
         """Execute the use case."""
-        song = self.repository.get_by_id(song_id)
+        song = await self.repository.get_by_id(song_id)
 
         if not song:
             raise SongNotFoundError(f"Song with ID {song_id} not found")
@@ -39,7 +39,7 @@ class UpdateSongUseCase:
 
         song.updated_at = datetime.now(timezone.utc)
 
-        updated_song = self.repository.update(song)
+        updated_song = await self.repository.update(song)
 
         return SongResponse(
             id=updated_song.id,
@@ -34,6 +34,10 @@ class Recipe:
     yield_amount: Optional[str] = None
     category: Optional[str] = None
     rating: Optional[Decimal] = None
+    rating_count: int = 0
+    favorite_count: int = 0
+    ingredient_count: int = 0
+    is_favorite: Optional[bool] = None  # For the viewing user; None if anonymous
     tags: List[str] = field(default_factory=list)
     is_published: bool = False
     is_community: bool = False
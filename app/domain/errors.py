@@ -32,3 +32,12 @@ class ValidationError(DomainError):
     """Validation error."""
 
     pass
+
+
+class TooManyRequestsError(DomainError):
+    """Too many requests / server saturated error."""
+
+    def __init__(self, message: str = "", retry_after: int = 1):
+        """Initialize with message and suggested retry delay in seconds."""
+        self.retry_after = retry_after
+        super().__init__(message)
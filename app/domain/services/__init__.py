@@ -0,0 +1,5 @@
+"""Domain services package."""
+
+from .ingredients import extract_ingredient_names, normalize_ingredient
+
+__all__ = ["normalize_ingredient", "extract_ingredient_names"]
@@ -0,0 +1,51 @@
+"""Ingredient name normalization."""
+
+import re
+import unicodedata
+from typing import Iterable, List, Optional
+
+_NON_WORD = re.compile(r"[^a-z0-9ñ]+")
+
+
+def _strip_accents(value: str) -> str:
+    """Remove diacritics, keeping ñ (it changes the word in Spanish)."""
+    value = value.replace("ñ", "\0")
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.replace("\0", "ñ")
+
+
+def _singularize(word: str) -> str:
+    """Reduce a Spanish plural to its singular form (heuristic)."""
+    if len(word) <= 3 or not word.endswith("s"):
+        return word
+    if word.endswith("ces"):
+        return word[:-3] + "z"  # nueces -> nuez
+    if word.endswith("es") and word[-3] in "lrndj":
+        return word[:-2]  # limones -> limon
+    if word[-2] in "aeiou":
+        return word[:-1]  # huevos -> huevo
+    return word
+
+
+def normalize_ingredient(name: str) -> Optional[str]:
+    """Normalize an ingredient name: lowercase, accent-free, singular words."""
+    value = _strip_accents(name.strip().lower())
+    words = [_singularize(word) for word in _NON_WORD.split(value) if word]
+    return " ".join(words) or None
+
+
+def extract_ingredient_names(ingredient_lists: Iterable[List]) -> List[str]:
+    """Collect the distinct normalized names from step ingredient lists.
+
+    Each list item may be a plain string or a dict with a ``name`` key.
+    """
+    names = set()
+    for ingredients in ingredient_lists:
+        for item in ingredients or []:
+            raw = item.get("name") if isinstance(item, dict) else item
+            if isinstance(raw, str):
+                name = normalize_ingredient(raw)
+                if name:
+                    names.add(name)
+    return sorted(names)
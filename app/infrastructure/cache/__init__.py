@@ -0,0 +1,14 @@
+"""In-process caches."""
+
+from .response_cache import ResponseCache, novena_cache
+from .token_cache import TokenCache, token_cache
+from .user_status_cache import UserStatusCache, user_status_cache
+
+__all__ = [
+    "ResponseCache",
+    "TokenCache",
+    "UserStatusCache",
+    "novena_cache",
+    "token_cache",
+    "user_status_cache",
+]
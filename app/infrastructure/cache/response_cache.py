@@ -0,0 +1,68 @@
+"""Process-wide read-through cache for rarely changing responses."""
+
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from ..config.settings import settings
+from ..metrics import registry
+
+
+class ResponseCache:
+    """Read-through cache of built responses with explicit invalidation.
+
+    Entries are dropped all at once by ``invalidate()`` after a write, and
+    expire after ``ttl_seconds`` as a backstop for writes made by other
+    processes. A generation counter stops a fill that raced with an
+    invalidation from storing stale data.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = registry.counter(f"{name}_cache_hits_total", f"{name} cache hits.")
+        self._misses = registry.counter(
+            f"{name}_cache_misses_total", f"{name} cache misses."
+        )
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value (None when missing or expired)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, loading and storing it on a miss."""
+        value = self.get(key)
+        if value is not None:
+            self._hits.inc()
+            return value
+
+        self._misses.inc()
+        generation = self._generation
+        value = await loader()
+        if value is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+# Global cache for rendered novena day responses
+novena_cache = ResponseCache("novena", settings.novena_cache_ttl_seconds)
@@ -0,0 +1,54 @@
+"""Cache of verified JWT claims for the auth path."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from ..config.settings import settings
+from ..metrics import registry
+
+
+class TokenCache:
+    """Bounded LRU cache of ``token digest -> claims`` that honours ``exp``.
+
+    Only successfully verified tokens are stored, and each entry expires when
+    its token does, so a cache hit never accepts a token the signature check
+    would reject.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = registry.counter("token_cache_hits_total", "Token cache hits.")
+        self._misses = registry.counter(
+            "token_cache_misses_total", "Token cache misses."
+        )
+
+    def get(self, digest: str) -> Optional[dict]:
+        """Get cached claims (None when missing or expired)."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] <= time.time():
+                self._entries.pop(digest, None)
+                self._misses.inc()
+                return None
+            self._entries.move_to_end(digest)
+            self._hits.inc()
+            return dict(entry[1])
+
+    def set(self, digest: str, claims: dict) -> None:
+        """Cache claims until the token's ``exp``."""
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[digest] = (expires_at, dict(claims))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Global cache for verified tokens
+token_cache = TokenCache(settings.token_cache_max_entries)
@@ -0,0 +1,55 @@
+"""Short-TTL cache of user account status for the auth path."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from ..config.settings import settings
+from ..metrics import registry
+
+
+class UserStatusCache:
+    """Bounded LRU cache of ``user_id -> is_active`` with per-entry expiry."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, tuple[float, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = registry.counter(
+            "user_status_cache_hits_total", "User status cache hits."
+        )
+        self._misses = registry.counter(
+            "user_status_cache_misses_total", "User status cache misses."
+        )
+
+    def get(self, user_id: UUID) -> Optional[bool]:
+        """Get cached active flag (None when missing or expired)."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(user_id, None)
+                self._misses.inc()
+                return None
+            self._entries.move_to_end(user_id)
+            self._hits.inc()
+            return entry[1]
+
+    def set(self, user_id: UUID, is_active: bool) -> None:
+        """Cache the active flag for a user."""
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, is_active)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop the cached status for a user."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+# Global cache for user status
+user_status_cache = UserStatusCache(settings.user_status_cache_ttl_seconds)
@@ -0,0 +1,5 @@
+"""Metrics."""
+
+from .registry import Counter, Gauge, Histogram, MetricsRegistry, registry
+
+__all__ = ["Counter", "Gauge", "Histogram", "MetricsRegistry", "registry"]
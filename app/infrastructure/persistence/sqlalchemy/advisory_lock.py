@@ -0,0 +1,33 @@
+"""PostgreSQL advisory locks for work that must run in one process at a time."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import func, select
+
+from .engine import async_engine
+
+
+@asynccontextmanager
+async def try_advisory_lock(name: str) -> AsyncIterator[bool]:
+    """Hold the session-level advisory lock ``name`` for the block if it is free.
+
+    Yields False at once when another connection (any worker or host) holds
+    it. The lock sits on its own connection, so the block may use other
+    sessions and commit freely; it is released when the block exits.
+    """
+    key = func.hashtextextended(name, 0)
+    async with async_engine.connect() as conn:
+        acquired = (await conn.execute(select(func.pg_try_advisory_lock(key)))).scalar()
+        await conn.commit()  # The lock outlives the transaction; don't idle in one
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                try:
+                    await conn.execute(select(func.pg_advisory_unlock(key)))
+                    await conn.commit()
+                except BaseException:
+                    # Never hand a connection still holding the lock to the pool
+                    await conn.invalidate()
+                    raise
@@ -1,28 +1,117 @@
 """SQLAlchemy engine configuration."""
 
+import time
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from ...config.settings import settings
+from ...metrics import registry
+
+# Server-side statement timeout (driver specific)
+statement_timeout_ms = settings.db_statement_timeout_ms
+async_connect_args = (
+    {"server_settings": {"statement_timeout": str(statement_timeout_ms)}}
+    if statement_timeout_ms
+    else {}
+)
+sync_connect_args = (
+    {"options": f"-c statement_timeout={statement_timeout_ms}"}
+    if statement_timeout_ms
+    else {}
+)
+
+# Shared pool options
+pool_options = {
+    "echo": settings.db_echo,
+    "pool_pre_ping": True,  # Verify connections before use
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout,
+    "pool_recycle": settings.db_pool_recycle,
+}
 
-# Create engine
+# Create async engine (used by the API)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    connect_args=async_connect_args,
+    **pool_options,
+)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,  # Keep loaded state usable after commit
+)
+
+# Create sync engine (used by scripts)
 engine = create_engine(
     settings.database_url,
-    echo=settings.debug,  # Log SQL queries in debug mode
-    pool_pre_ping=True,  # Verify connections before use
+    connect_args=sync_connect_args,
+    **pool_options,
 )
 
-# Create session factory
+# Create sync session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def get_db():
-    """Dependency to get database session."""
-    db = SessionLocal()
-    try:
+# === POOL METRICS ===
+
+_pool = async_engine.sync_engine.pool
+
+registry.gauge(
+    "db_pool_size",
+    "Configured number of persistent connections in the pool.",
+    _pool.size,
+)
+registry.gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    _pool.checkedout,
+)
+registry.gauge(
+    "db_pool_checked_in",
+    "Idle connections currently held by the pool.",
+    _pool.checkedin,
+)
+registry.gauge(
+    "db_pool_overflow",
+    "Connections opened beyond pool_size (negative while below it).",
+    _pool.overflow,
+)
+pool_wait_seconds = registry.histogram(
+    "db_pool_wait_seconds",
+    "Time a request waited to obtain a database connection.",
+)
+pool_timeouts_total = registry.counter(
+    "db_pool_timeouts_total",
+    "Requests that gave up waiting for a database connection.",
+)
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get async database session."""
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        try:
+            await db.connection()
+        except PoolTimeoutError:
+            pool_timeouts_total.inc()
+            raise
+        finally:
+            pool_wait_seconds.observe(time.perf_counter() - start)
+        yield db
+
+
+async def get_lazy_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get async session that connects on first query only."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 get_db_session = get_db
@@ -10,7 +10,14 @@ from .session import Session
 from .novena import NovenaDay, NovenaDaySection, UserNovenaProgress
 
 # Recipes
-from .recipe import Recipe, RecipeStep, RecipeRating, UserFavoriteRecipe
+from .recipe import (
+    Recipe,
+    RecipeStep,
+    RecipeRating,
+    RecipeIngredient,
+    RecipeFacetCount,
+    UserFavoriteRecipe,
+)
 
 # Music
 from .music import Song, Playlist, PlaylistSong, UserFavoriteSong
@@ -31,6 +38,8 @@ __all__ = [
     # Recipes
     "Recipe",
     "RecipeStep",
+    "RecipeIngredient",
+    "RecipeFacetCount",
     "RecipeRating",
     "UserFavoriteRecipe",
     # Music
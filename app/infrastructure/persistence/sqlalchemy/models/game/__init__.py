@@ -2,7 +2,16 @@
 
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -14,7 +23,10 @@ class UserGameStats(Base):
     """User game statistics model."""
 
     __tablename__ = "user_game_stats"
-    __table_args__ = {"schema": "parranda"}
+    __table_args__ = (
+        UniqueConstraint("user_id", "game_type", name="uq_user_game_type"),
+        {"schema": "parranda"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(
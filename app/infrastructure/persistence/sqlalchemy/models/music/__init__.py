@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -22,7 +23,21 @@ class Song(Base):
     """Song model for Christmas music library."""
 
     __tablename__ = "songs"
-    __table_args__ = {"schema": "parranda"}
+    __table_args__ = (
+        Index(
+            "ix_songs_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_songs_artist_trgm",
+            "artist",
+            postgresql_using="gin",
+            postgresql_ops={"artist": "gin_trgm_ops"},
+        ),
+        {"schema": "parranda"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     youtube_video_id = Column(String(20), unique=True, nullable=False)
@@ -34,7 +34,10 @@ class NovenaDay(Base):
 
     # Relationships
     sections = relationship(
-        "NovenaDaySection", back_populates="day", cascade="all, delete-orphan"
+        "NovenaDaySection",
+        back_populates="day",
+        cascade="all, delete-orphan",
+        order_by="NovenaDaySection.position",
     )
     user_progress = relationship(
         "UserNovenaProgress", back_populates="day", cascade="all, delete-orphan"
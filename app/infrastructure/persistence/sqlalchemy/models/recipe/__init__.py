@@ -5,14 +5,18 @@ import uuid
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     Text,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, query_expression, relationship
 from sqlalchemy.sql import func
 
 from ..base import Base
@@ -22,7 +26,50 @@ class Recipe(Base):
     """Recipe model."""
 
     __tablename__ = "recipes"
-    __table_args__ = {"schema": "parranda"}
+    __table_args__ = (
+        Index("ix_recipes_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_recipes_tags", "tags", postgresql_using="gin"),
+        Index(
+            "ix_recipes_published_created",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_published"),
+        ),
+        Index(
+            "ix_recipes_author_created",
+            "author_user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_recipes_category_created",
+            "category",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_recipes_published_rating",
+            text("coalesce(rating_avg, rating) DESC NULLS LAST"),
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_published"),
+        ),
+        Index(
+            "ix_recipes_published_popular",
+            text("favorite_count DESC"),
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_published"),
+        ),
+        Index(
+            "ix_recipes_published_trending",
+            text("trending_score DESC"),
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_published"),
+        ),
+        {"schema": "parranda"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(Text, nullable=False)
@@ -36,8 +83,18 @@ class Recipe(Base):
     prep_time_minutes = Column(Integer)
     yield_amount = Column("yield", Text)
     category = Column(Text)
-    rating = Column(Numeric(2, 1))
+    rating = Column(Numeric(2, 1))  # Legacy editorial rating
+    # User rating aggregates, kept in step with recipe_ratings by the repository
+    rating_sum = Column(Integer, server_default="0", nullable=False)
+    rating_count = Column(Integer, server_default="0", nullable=False)
+    rating_avg = Column(Numeric(3, 2))
+    # Maintained by a trigger on user_favorite_recipes (see migrations)
+    favorite_count = Column(Integer, server_default="0", nullable=False)
+    # Time-decayed favorites, recomputed in bulk by the trending updater
+    trending_score = Column(Float, server_default="0", nullable=False)
     tags = Column(ARRAY(Text), default=[])
+    # Distinct rows in recipe_ingredients, kept in step by the repository
+    ingredient_count = Column(Integer, server_default="0", nullable=False)
     is_published = Column(Boolean, default=False, nullable=False)
     is_community = Column(Boolean, default=False, nullable=False)
     created_at = Column(
@@ -46,6 +103,10 @@ class Recipe(Base):
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    # Full-text document, maintained by database triggers (see migrations)
+    search_vector = deferred(Column(TSVECTOR))
+    # Per-viewer favorite flag, only loaded by listings (with_expression)
+    is_favorite = query_expression()
 
     # Relationships
     author = relationship("User", back_populates="recipes")
@@ -88,6 +149,44 @@ class RecipeStep(Base):
     recipe = relationship("Recipe", back_populates="steps")
 
 
+class RecipeIngredient(Base):
+    """Normalized ingredient name of a recipe (inverted index)."""
+
+    __tablename__ = "recipe_ingredients"
+    __table_args__ = (
+        Index("ix_recipe_ingredients_name_recipe", "name", "recipe_id"),
+        Index("ix_recipe_ingredients_head_recipe", "head", "recipe_id"),
+        {"schema": "parranda"},
+    )
+
+    recipe_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("parranda.recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    name = Column(Text, primary_key=True)
+    # Head noun: Spanish names lead with it ("leche" in "leche fria")
+    head = Column(
+        Text, Computed("split_part(name, ' ', 1)", persisted=True), nullable=False
+    )
+
+
+class RecipeFacetCount(Base):
+    """Published recipe count per category or tag, kept by the repository.
+
+    Category rows use an empty ``scope``; tag rows are kept both under the
+    empty scope (all recipes) and under each recipe's category.
+    """
+
+    __tablename__ = "recipe_facet_counts"
+    __table_args__ = {"schema": "parranda"}
+
+    kind = Column(Text, primary_key=True)  # "category" or "tag"
+    scope = Column(Text, primary_key=True)
+    value = Column(Text, primary_key=True)
+    recipe_count = Column(Integer, server_default="0", nullable=False)
+
+
 class RecipeRating(Base):
     """Recipe rating model."""
 
@@ -122,7 +221,14 @@ class UserFavoriteRecipe(Base):
     """User favorite recipe model."""
 
     __tablename__ = "user_favorite_recipes"
-    __table_args__ = {"schema": "parranda"}
+    __table_args__ = (
+        Index(
+            "ix_user_favorite_recipes_user_created", "user_id", text("created_at DESC")
+        ),
+        Index("ix_user_favorite_recipes_created_at", "created_at"),
+        Index("ix_user_favorite_recipes_recipe_created", "recipe_id", "created_at"),
+        {"schema": "parranda"},
+    )
 
     user_id = Column(
         UUID(as_uuid=True),
@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -14,13 +14,16 @@ class Session(Base):
     """User session model."""
 
     __tablename__ = "sessions"
-    __table_args__ = {"schema": "parranda"}
+    __table_args__ = (
+        Index("ix_sessions_expires_at", "expires_at"),
+        {"schema": "parranda"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(
         UUID(as_uuid=True), ForeignKey("parranda.users.id"), nullable=False
     )
-    session_token_hash = Column(Text, unique=True)
+    session_token_hash = Column(Text, unique=True)  # SHA-256 of refresh token
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
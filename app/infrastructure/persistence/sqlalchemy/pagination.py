@@ -0,0 +1,66 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+from app.domain.errors import ValidationError
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a (created_at, id) position as an opaque cursor token."""
+    raw = json.dumps({"c": created_at.isoformat(), "i": str(row_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode an opaque cursor token into a (created_at, id) position."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["c"]), UUID(data["i"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationError("Cursor de paginación inválido")
+
+
+def apply_keyset(
+    stmt: Select,
+    created_at_column,
+    id_column,
+    after: Optional[str],
+    descending: bool = True,
+) -> Select:
+    """Order by (created_at, id) and seek past the cursor position."""
+    if after:
+        cursor_created_at, cursor_id = decode_cursor(after)
+        position = tuple_(created_at_column, id_column)
+        if descending:
+            stmt = stmt.where(position < tuple_(cursor_created_at, cursor_id))
+        else:
+            stmt = stmt.where(position > tuple_(cursor_created_at, cursor_id))
+
+    if descending:
+        return stmt.order_by(created_at_column.desc(), id_column.desc())
+    return stmt.order_by(created_at_column.asc(), id_column.asc())
+
+
+def reject_cursor(after: Optional[str]) -> None:
+    """Refuse a cursor for ranked orders, which are paged by offset only."""
+    if after:
+        raise ValidationError(
+            "La paginación por cursor solo aplica al orden por fecha; usa page"
+        )
+
+
+def next_cursor(rows, page_size: int) -> Optional[str]:
+    """Build the cursor for the page after ``rows`` (None on the last page)."""
+    if len(rows) < page_size:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
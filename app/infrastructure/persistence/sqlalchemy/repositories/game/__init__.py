@@ -3,7 +3,9 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.ports.repositories.game_repository import (
     AnoViejoRepositoryPort,
@@ -16,12 +18,16 @@ from app.infrastructure.persistence.sqlalchemy.models.game import (
 from app.infrastructure.persistence.sqlalchemy.models.game import (
     UserGameStats as GameStatsORM,
 )
+from app.infrastructure.persistence.sqlalchemy.pagination import (
+    apply_keyset,
+    next_cursor,
+)
 
 
 class GameStatsRepository(GameStatsRepositoryPort):
     """SQLAlchemy implementation of game stats repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def _to_domain(self, orm: GameStatsORM) -> UserGameStats:
@@ -39,25 +45,23 @@ class GameStatsRepository(GameStatsRepositoryPort):
             updated_at=orm.updated_at,
         )
 
-    def get_by_user_and_game(
+    async def get_by_user_and_game(
         self, user_id: UUID, game_type: str
     ) -> Optional[UserGameStats]:
         """Get game stats by user ID and game type."""
-        orm = (
-            self.db.query(GameStatsORM)
-            .filter(GameStatsORM.user_id == user_id, GameStatsORM.game_type == game_type)
-            .first()
+        stmt = select(GameStatsORM).where(
+            GameStatsORM.user_id == user_id, GameStatsORM.game_type == game_type
         )
+        orm = (await self.db.execute(stmt)).scalars().first()
         return self._to_domain(orm) if orm else None
 
-    def get_all_by_user(self, user_id: UUID) -> List[UserGameStats]:
+    async def get_all_by_user(self, user_id: UUID) -> List[UserGameStats]:
         """Get all game stats for a user."""
-        orms = (
-            self.db.query(GameStatsORM).filter(GameStatsORM.user_id == user_id).all()
-        )
+        stmt = select(GameStatsORM).where(GameStatsORM.user_id == user_id)
+        orms = (await self.db.execute(stmt)).scalars().all()
         return [self._to_domain(o) for o in orms]
 
-    def create(self, stats: UserGameStats) -> UserGameStats:
+    async def create(self, stats: UserGameStats) -> UserGameStats:
         """Create new game stats."""
         orm = GameStatsORM(
             id=stats.id,
@@ -70,13 +74,14 @@ class GameStatsRepository(GameStatsRepositoryPort):
             last_played_at=stats.last_played_at,
         )
         self.db.add(orm)
-        self.db.commit()
-        self.db.refresh(orm)
+        await self.db.commit()
+        await self.db.refresh(orm)
         return self._to_domain(orm)
 
-    def update(self, stats: UserGameStats) -> UserGameStats:
+    async def update(self, stats: UserGameStats) -> UserGameStats:
         """Update existing game stats."""
-        orm = self.db.query(GameStatsORM).filter(GameStatsORM.id == stats.id).first()
+        stmt = select(GameStatsORM).where(GameStatsORM.id == stats.id)
+        orm = (await self.db.execute(stmt)).scalars().first()
 
         if orm:
             orm.games_played = stats.games_played
@@ -86,17 +91,55 @@ class GameStatsRepository(GameStatsRepositoryPort):
             orm.last_played_at = stats.last_played_at
             orm.updated_at = stats.updated_at
 
-            self.db.commit()
-            self.db.refresh(orm)
+            await self.db.commit()
+            await self.db.refresh(orm)
             return self._to_domain(orm)
 
         return stats
 
+    async def record_game(
+        self, user_id: UUID, game_type: str, score: int, won: bool
+    ) -> UserGameStats:
+        """Atomically add a played game to the user's stats (single upsert)."""
+        now = func.now()
+        insert_stmt = insert(GameStatsORM).values(
+            user_id=user_id,
+            game_type=game_type,
+            games_played=1,
+            games_won=1 if won else 0,
+            best_score=score,
+            total_score=score,
+            last_played_at=now,
+            updated_at=now,
+        )
+        excluded = insert_stmt.excluded
+        stmt = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[GameStatsORM.user_id, GameStatsORM.game_type],
+                set_={
+                    "games_played": GameStatsORM.games_played + 1,
+                    "games_won": GameStatsORM.games_won + excluded.games_won,
+                    "best_score": func.greatest(
+                        GameStatsORM.best_score, excluded.best_score
+                    ),
+                    "total_score": func.coalesce(GameStatsORM.total_score, 0)
+                    + excluded.total_score,
+                    "last_played_at": excluded.last_played_at,
+                    "updated_at": excluded.updated_at,
+                },
+            )
+            .returning(GameStatsORM)
+            .execution_options(populate_existing=True)
+        )
+        orm = (await self.db.execute(stmt)).scalar_one()
+        await self.db.commit()
+        return self._to_domain(orm)
+
 
 class AnoViejoRepository(AnoViejoRepositoryPort):
     """SQLAlchemy implementation of Año Viejo repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def _to_domain(self, orm: AnoViejoORM) -> AnoViejoConfig:
@@ -111,7 +154,7 @@ class AnoViejoRepository(AnoViejoRepositoryPort):
             created_at=orm.created_at,
         )
 
-    def create(self, config: AnoViejoConfig) -> AnoViejoConfig:
+    async def create(self, config: AnoViejoConfig) -> AnoViejoConfig:
         """Create a new Año Viejo configuration."""
         orm = AnoViejoORM(
             id=config.id,
@@ -122,43 +165,52 @@ class AnoViejoRepository(AnoViejoRepositoryPort):
             burned_at=config.burned_at,
         )
         self.db.add(orm)
-        self.db.commit()
-        self.db.refresh(orm)
+        await self.db.commit()
+        await self.db.refresh(orm)
         return self._to_domain(orm)
 
-    def get_by_id(self, config_id: UUID) -> Optional[AnoViejoConfig]:
+    async def get_by_id(self, config_id: UUID) -> Optional[AnoViejoConfig]:
         """Get Año Viejo by ID."""
-        orm = self.db.query(AnoViejoORM).filter(AnoViejoORM.id == config_id).first()
+        stmt = select(AnoViejoORM).where(AnoViejoORM.id == config_id)
+        orm = (await self.db.execute(stmt)).scalars().first()
         return self._to_domain(orm) if orm else None
 
-    def get_all_by_user(
+    async def get_all_by_user(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 10,
         include_burned: bool = True,
-    ) -> tuple[List[AnoViejoConfig], int]:
+        after: Optional[str] = None,
+        include_total: bool = True,
+    ) -> tuple[List[AnoViejoConfig], Optional[int], Optional[str]]:
         """Get all Año Viejo configs for a user."""
-        query = self.db.query(AnoViejoORM).filter(AnoViejoORM.user_id == user_id)
+        query = select(AnoViejoORM).where(AnoViejoORM.user_id == user_id)
 
         if not include_burned:
-            query = query.filter(AnoViejoORM.is_burned == False)
+            query = query.where(AnoViejoORM.is_burned == False)
 
-        # Order by created_at descending
-        query = query.order_by(AnoViejoORM.created_at.desc())
+        # Get total (optional, skipped when scrolling by cursor)
+        total = None
+        if include_total:
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await self.db.execute(count_query)).scalar() or 0
 
-        # Get total
-        total = query.count()
+        # Order by created_at descending, seeking past the cursor if given
+        query = apply_keyset(query, AnoViejoORM.created_at, AnoViejoORM.id, after)
 
         # Apply pagination
-        offset = (page - 1) * page_size
-        orms = query.offset(offset).limit(page_size).all()
+        if not after:
+            query = query.offset((page - 1) * page_size)
+        query = query.limit(page_size)
+        orms = (await self.db.execute(query)).scalars().all()
 
-        return [self._to_domain(o) for o in orms], total
+        return [self._to_domain(o) for o in orms], total, next_cursor(orms, page_size)
 
-    def update(self, config: AnoViejoConfig) -> AnoViejoConfig:
+    async def update(self, config: AnoViejoConfig) -> AnoViejoConfig:
         """Update an existing Año Viejo."""
-        orm = self.db.query(AnoViejoORM).filter(AnoViejoORM.id == config.id).first()
+        stmt = select(AnoViejoORM).where(AnoViejoORM.id == config.id)
+        orm = (await self.db.execute(stmt)).scalars().first()
 
         if orm:
             orm.name = config.name
@@ -166,18 +218,19 @@ class AnoViejoRepository(AnoViejoRepositoryPort):
             orm.is_burned = config.is_burned
             orm.burned_at = config.burned_at
 
-            self.db.commit()
-            self.db.refresh(orm)
+            await self.db.commit()
+            await self.db.refresh(orm)
             return self._to_domain(orm)
 
         return config
 
-    def delete(self, config_id: UUID) -> bool:
+    async def delete(self, config_id: UUID) -> bool:
         """Delete an Año Viejo by ID."""
-        orm = self.db.query(AnoViejoORM).filter(AnoViejoORM.id == config_id).first()
+        stmt = select(AnoViejoORM).where(AnoViejoORM.id == config_id)
+        orm = (await self.db.execute(stmt)).scalars().first()
         if orm:
-            self.db.delete(orm)
-            self.db.commit()
+            await self.db.delete(orm)
+            await self.db.commit()
             return True
         return False
 
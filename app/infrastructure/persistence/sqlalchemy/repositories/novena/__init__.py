@@ -1,17 +1,19 @@
 """Novena repository implementation."""
 
-from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.domain.entities.novena_day import NovenaDay as DomainNovenaDay
 from app.domain.entities.novena_day import NovenaDaySection as DomainNovenaDaySection
 from app.domain.entities.novena_progress import (
     UserNovenaProgress as DomainNovenaProgress,
 )
+from app.infrastructure.cache import novena_cache
 
 from ...models.novena import NovenaDay as NovenaDayORM
 from ...models.novena import NovenaDaySection as NovenaDaySectionORM
@@ -21,12 +23,12 @@ from ...models.novena import UserNovenaProgress as UserNovenaProgressORM
 class NovenaRepository:
     """Novena repository implementation."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     # === NOVENA DAYS ===
 
-    def create_day(self, day: DomainNovenaDay) -> DomainNovenaDay:
+    async def create_day(self, day: DomainNovenaDay) -> DomainNovenaDay:
         """Create a new novena day."""
         day_orm = NovenaDayORM(
             id=day.day_id,
@@ -35,53 +37,74 @@ class NovenaRepository:
             created_at=day.created_at,
         )
         self.db.add(day_orm)
-        self.db.commit()
-        self.db.refresh(day_orm)
+        await self.db.commit()
+        novena_cache.invalidate()
+        await self.db.refresh(day_orm)
         return self._to_domain_day(day_orm)
 
-    def get_day_by_id(self, day_id: UUID) -> Optional[DomainNovenaDay]:
+    async def get_day_by_id(self, day_id: UUID) -> Optional[DomainNovenaDay]:
         """Get novena day by ID."""
         stmt = select(NovenaDayORM).where(NovenaDayORM.id == day_id)
-        day_orm = self.db.execute(stmt).scalar_one_or_none()
+        day_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain_day(day_orm) if day_orm else None
 
-    def get_day_by_number(self, day_number: int) -> Optional[DomainNovenaDay]:
+    async def get_day_by_number(self, day_number: int) -> Optional[DomainNovenaDay]:
         """Get novena day by number."""
         stmt = select(NovenaDayORM).where(NovenaDayORM.day_number == day_number)
-        day_orm = self.db.execute(stmt).scalar_one_or_none()
+        day_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain_day(day_orm) if day_orm else None
 
-    def get_all_days(self) -> List[DomainNovenaDay]:
+    async def get_all_days(self) -> List[DomainNovenaDay]:
         """Get all novena days."""
         stmt = select(NovenaDayORM).order_by(NovenaDayORM.day_number)
-        days_orm = self.db.execute(stmt).scalars().all()
+        days_orm = (await self.db.execute(stmt)).scalars().all()
         return [self._to_domain_day(day_orm) for day_orm in days_orm]
 
-    def update_day(self, day: DomainNovenaDay) -> DomainNovenaDay:
+    async def get_all_days_with_sections(
+        self,
+    ) -> List[Tuple[DomainNovenaDay, List[DomainNovenaDaySection]]]:
+        """Get all novena days with their sections (two queries)."""
+        stmt = (
+            select(NovenaDayORM)
+            .options(selectinload(NovenaDayORM.sections))
+            .order_by(NovenaDayORM.day_number)
+        )
+        days_orm = (await self.db.execute(stmt)).scalars().all()
+        return [
+            (
+                self._to_domain_day(day_orm),
+                [self._to_domain_section(s) for s in day_orm.sections],
+            )
+            for day_orm in days_orm
+        ]
+
+    async def update_day(self, day: DomainNovenaDay) -> DomainNovenaDay:
         """Update a novena day."""
         stmt = select(NovenaDayORM).where(NovenaDayORM.id == day.day_id)
-        day_orm = self.db.execute(stmt).scalar_one()
+        day_orm = (await self.db.execute(stmt)).scalar_one()
 
         day_orm.title = day.title
 
-        self.db.commit()
-        self.db.refresh(day_orm)
+        await self.db.commit()
+        novena_cache.invalidate()
+        await self.db.refresh(day_orm)
         return self._to_domain_day(day_orm)
 
-    def delete_day(self, day_id: UUID) -> bool:
+    async def delete_day(self, day_id: UUID) -> bool:
         """Delete a novena day."""
         stmt = select(NovenaDayORM).where(NovenaDayORM.id == day_id)
-        day_orm = self.db.execute(stmt).scalar_one_or_none()
+        day_orm = (await self.db.execute(stmt)).scalar_one_or_none()
 
         if day_orm:
-            self.db.delete(day_orm)
-            self.db.commit()
+            await self.db.delete(day_orm)
+            await self.db.commit()
+            novena_cache.invalidate()
             return True
         return False
 
     # === NOVENA SECTIONS ===
 
-    def create_section(
+    async def create_section(
         self, section: DomainNovenaDaySection
     ) -> DomainNovenaDaySection:
         """Create a new section for a day."""
@@ -93,71 +116,98 @@ class NovenaRepository:
             content_md=section.content_md,
         )
         self.db.add(section_orm)
-        self.db.commit()
-        self.db.refresh(section_orm)
+        await self.db.commit()
+        novena_cache.invalidate()
+        await self.db.refresh(section_orm)
         return self._to_domain_section(section_orm)
 
-    def get_sections_by_day(self, day_id: UUID) -> List[DomainNovenaDaySection]:
+    async def get_sections_by_day(self, day_id: UUID) -> List[DomainNovenaDaySection]:
         """Get all sections for a day."""
         stmt = (
             select(NovenaDaySectionORM)
             .where(NovenaDaySectionORM.day_id == day_id)
             .order_by(NovenaDaySectionORM.position)
         )
-        sections_orm = self.db.execute(stmt).scalars().all()
+        sections_orm = (await self.db.execute(stmt)).scalars().all()
         return [self._to_domain_section(s) for s in sections_orm]
 
-    def get_section_by_id(
+    async def get_section_by_id(
         self, section_id: UUID
     ) -> Optional[DomainNovenaDaySection]:
         """Get section by ID."""
         stmt = select(NovenaDaySectionORM).where(
             NovenaDaySectionORM.id == section_id
         )
-        section_orm = self.db.execute(stmt).scalar_one_or_none()
+        section_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain_section(section_orm) if section_orm else None
 
-    def update_section(
+    async def update_section(
         self, section: DomainNovenaDaySection
     ) -> DomainNovenaDaySection:
         """Update a section."""
         stmt = select(NovenaDaySectionORM).where(
             NovenaDaySectionORM.id == section.section_id
         )
-        section_orm = self.db.execute(stmt).scalar_one()
+        section_orm = (await self.db.execute(stmt)).scalar_one()
 
         section_orm.section_type = section.section_type
         section_orm.position = section.position
         section_orm.content_md = section.content_md
 
-        self.db.commit()
-        self.db.refresh(section_orm)
+        await self.db.commit()
+        novena_cache.invalidate()
+        await self.db.refresh(section_orm)
         return self._to_domain_section(section_orm)
 
-    def delete_section(self, section_id: UUID) -> bool:
+    async def delete_section(self, section_id: UUID) -> bool:
         """Delete a section."""
         stmt = select(NovenaDaySectionORM).where(
             NovenaDaySectionORM.id == section_id
         )
-        section_orm = self.db.execute(stmt).scalar_one_or_none()
+        section_orm = (await self.db.execute(stmt)).scalar_one_or_none()
 
         if section_orm:
-            self.db.delete(section_orm)
-            self.db.commit()
+            await self.db.delete(section_orm)
+            await self.db.commit()
+            novena_cache.invalidate()
             return True
         return False
 
     # === USER PROGRESS ===
 
-    def get_user_progress(self, user_id: UUID) -> List[DomainNovenaProgress]:
+    async def get_user_progress(self, user_id: UUID) -> List[DomainNovenaProgress]:
         """Get all progress for a user."""
         stmt = select(UserNovenaProgressORM).where(
             UserNovenaProgressORM.user_id == user_id
         )
-        progress_orm = self.db.execute(stmt).scalars().all()
+        progress_orm = (await self.db.execute(stmt)).scalars().all()
         return [self._to_domain_progress(p) for p in progress_orm]
 
-    def get_progress_for_day(
+    async def get_days_with_user_progress(
+        self, user_id: UUID
+    ) -> List[Tuple[DomainNovenaDay, Optional[DomainNovenaProgress]]]:
+        """Get all novena days joined with the user's progress (one query)."""
+        stmt = (
+            select(NovenaDayORM, UserNovenaProgressORM)
+            .outerjoin(
+                UserNovenaProgressORM,
+                and_(
+                    UserNovenaProgressORM.day_id == NovenaDayORM.id,
+                    UserNovenaProgressORM.user_id == user_id,
+                ),
+            )
+            .order_by(NovenaDayORM.day_number)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        return [
+            (
+                self._to_domain_day(day_orm),
+                self._to_domain_progress(progress_orm) if progress_orm else None,
+            )
+            for day_orm, progress_orm in rows
+        ]
+
+    async def get_progress_for_day(
         self, user_id: UUID, day_id: UUID
     ) -> Optional[DomainNovenaProgress]:
         """Get user progress for a specific day."""
@@ -165,67 +215,73 @@ class NovenaRepository:
             UserNovenaProgressORM.user_id == user_id,
             UserNovenaProgressORM.day_id == day_id,
         )
-        progress_orm = self.db.execute(stmt).scalar_one_or_none()
+        progress_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain_progress(progress_orm) if progress_orm else None
 
-    def create_or_update_progress(
+    async def create_or_update_progress(
         self, progress: DomainNovenaProgress
     ) -> DomainNovenaProgress:
-        """Create or update user progress."""
-        stmt = select(UserNovenaProgressORM).where(
-            UserNovenaProgressORM.user_id == progress.user_id,
-            UserNovenaProgressORM.day_id == progress.day_id,
+        """Create or update user progress (single upsert)."""
+        values = {
+            "is_completed": progress.is_completed,
+            "completed_at": progress.completed_at,
+            "last_read_at": progress.last_read_at,
+        }
+        return await self._upsert_progress(
+            progress.user_id, progress.day_id, values, update=values.keys()
         )
-        existing = self.db.execute(stmt).scalar_one_or_none()
-
-        if existing:
-            existing.is_completed = progress.is_completed
-            existing.completed_at = progress.completed_at
-            existing.last_read_at = progress.last_read_at
-            self.db.commit()
-            self.db.refresh(existing)
-            return self._to_domain_progress(existing)
-        else:
-            progress_orm = UserNovenaProgressORM(
-                user_id=progress.user_id,
-                day_id=progress.day_id,
-                is_completed=progress.is_completed,
-                completed_at=progress.completed_at,
-                last_read_at=progress.last_read_at,
-            )
-            self.db.add(progress_orm)
-            self.db.commit()
-            self.db.refresh(progress_orm)
-            return self._to_domain_progress(progress_orm)
 
-    def mark_day_complete(
+    async def mark_day_complete(
         self, user_id: UUID, day_id: UUID
     ) -> DomainNovenaProgress:
-        """Mark a day as complete for a user."""
-        progress = self.get_progress_for_day(user_id, day_id)
-
-        if progress:
-            progress.is_completed = True
-            progress.completed_at = datetime.now()
-            progress.last_read_at = datetime.now()
-            return self.create_or_update_progress(progress)
-        else:
-            new_progress = DomainNovenaProgress(
-                user_id=user_id,
-                day_id=day_id,
-                is_completed=True,
-                completed_at=datetime.now(),
-                last_read_at=datetime.now(),
+        """Mark a day as complete for a user (single upsert)."""
+        values = {
+            "is_completed": True,
+            "completed_at": func.now(),
+            "last_read_at": func.now(),
+        }
+        return await self._upsert_progress(
+            user_id, day_id, values, update=values.keys()
+        )
+
+    async def mark_day_read(
+        self, user_id: UUID, day_id: UUID
+    ) -> DomainNovenaProgress:
+        """Record that a user read a day (single upsert)."""
+        values = {"is_completed": False, "last_read_at": func.now()}
+        return await self._upsert_progress(
+            user_id, day_id, values, update=["last_read_at"]
+        )
+
+    async def _upsert_progress(
+        self, user_id: UUID, day_id: UUID, values: dict, update: Iterable[str]
+    ) -> DomainNovenaProgress:
+        """Insert progress, or overwrite the ``update`` columns on conflict."""
+        stmt = insert(UserNovenaProgressORM).values(
+            user_id=user_id, day_id=day_id, **values
+        )
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    UserNovenaProgressORM.user_id,
+                    UserNovenaProgressORM.day_id,
+                ],
+                set_={name: getattr(stmt.excluded, name) for name in update},
             )
-            return self.create_or_update_progress(new_progress)
+            .returning(UserNovenaProgressORM)
+            .execution_options(populate_existing=True)
+        )
+        progress_orm = (await self.db.execute(stmt)).scalar_one()
+        await self.db.commit()
+        return self._to_domain_progress(progress_orm)
 
-    def reset_user_progress(self, user_id: UUID) -> bool:
+    async def reset_user_progress(self, user_id: UUID) -> bool:
         """Reset all progress for a user."""
         stmt = delete(UserNovenaProgressORM).where(
             UserNovenaProgressORM.user_id == user_id
         )
-        self.db.execute(stmt)
-        self.db.commit()
+        await self.db.execute(stmt)
+        await self.db.commit()
         return True
 
     # === CONVERTERS ===
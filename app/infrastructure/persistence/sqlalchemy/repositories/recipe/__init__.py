@@ -1,28 +1,187 @@
 """Recipe repository implementation."""
 
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select, or_
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    Float,
+    Numeric,
+    and_,
+    any_,
+    cast,
+    column,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    JSONB,
+    REGCONFIG,
+    UUID as PG_UUID,
+    aggregate_order_by,
+    insert,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload, with_expression
 
 from app.domain.entities.recipe import Recipe as DomainRecipe
 from app.domain.entities.recipe import RecipeStep as DomainRecipeStep
+from app.domain.errors import ValidationError
 
 from ...models.recipe import Recipe as RecipeORM
+from ...models.recipe import RecipeFacetCount as RecipeFacetCountORM
+from ...models.recipe import RecipeIngredient as RecipeIngredientORM
+from ...models.recipe import RecipeRating as RecipeRatingORM
 from ...models.recipe import RecipeStep as RecipeStepORM
 from ...models.recipe import UserFavoriteRecipe as UserFavoriteRecipeORM
+from ...pagination import apply_keyset, next_cursor, reject_cursor
+
+# SQLSTATE classes of rows the database rejects: data exception and
+# integrity constraint violation (asyncpg reports some only as DBAPIError)
+REJECTED_ROW_SQLSTATE_CLASSES = ("22", "23")
+
+# Text search configuration created by the recipe search_vector migration
+SEARCH_CONFIG = "parranda.spanish_unaccent"
+
+# Columns shown on list cards (no steps, no search vector)
+SUMMARY_COLUMNS = (
+    RecipeORM.id,
+    RecipeORM.title,
+    RecipeORM.author_user_id,
+    RecipeORM.author_alias,
+    RecipeORM.photo_url,
+    RecipeORM.prep_time_minutes,
+    RecipeORM.yield_amount.label("yield_amount"),  # Column is named "yield"
+    RecipeORM.category,
+    RecipeORM.rating,
+    RecipeORM.rating_avg,
+    RecipeORM.rating_count,
+    RecipeORM.favorite_count,
+    RecipeORM.ingredient_count,
+    RecipeORM.tags,
+    RecipeORM.is_published,
+    RecipeORM.is_community,
+    RecipeORM.created_at,
+    RecipeORM.updated_at,
+)
+
+
+# Rating shown on recipes: the user average, else the legacy editorial rating
+EFFECTIVE_RATING = func.coalesce(RecipeORM.rating_avg, RecipeORM.rating)
+
+# Ranked sorts, each backed by a partial index on published recipes
+SORT_COLUMNS = {
+    "best_rated": EFFECTIVE_RATING.desc().nulls_last(),
+    "popular": RecipeORM.favorite_count.desc(),
+    "trending": RecipeORM.trending_score.desc(),
+}
+
+
+def _uuid_array(ids: Iterable[UUID]):
+    """Bind ids as one uuid[] parameter (stable SQL text for any list size)."""
+    return any_(literal(list(ids), ARRAY(PG_UUID(as_uuid=True))))
+
+
+# recipe_steps columns rewritten in place by step diffs (key first)
+STEP_UPDATE_COLUMNS = tuple(
+    RecipeStepORM.__table__.c[name]
+    for name in (
+        "id",
+        "step_number",
+        "instruction_md",
+        "ingredients_json",
+        "time_minutes",
+    )
+)
+
+
+def _step_row(step: DomainRecipeStep, recipe_id: UUID) -> dict:
+    """recipe_steps column values for a domain step."""
+    return {
+        "id": step.step_id,
+        "recipe_id": recipe_id,
+        "step_number": step.step_number,
+        "instruction_md": step.instruction_md,
+        "ingredients_json": step.ingredients_json,
+        "time_minutes": step.time_minutes,
+    }
+
+
+def facet_keys(
+    category: Optional[str], tags: Optional[Iterable[str]], is_published: bool
+) -> Set[Tuple[str, str, str]]:
+    """(kind, scope, value) facet rows a recipe counts towards."""
+    if not is_published:
+        return set()
+    keys = {("category", "", category)} if category else set()
+    for tag in set(tags or []):
+        keys.add(("tag", "", tag))
+        if category:
+            keys.add(("tag", category, tag))
+    return keys
+
+
+def facet_upsert(deltas: Counter):
+    """Upsert adding per-row deltas to the facet counts (None if all zero)."""
+    # Sorted so concurrent writers lock rows in the same order
+    rows = [
+        {"kind": kind, "scope": scope, "value": value, "recipe_count": delta}
+        for (kind, scope, value), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return None
+    stmt = insert(RecipeFacetCountORM).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["kind", "scope", "value"],
+        set_={
+            "recipe_count": RecipeFacetCountORM.recipe_count
+            + stmt.excluded.recipe_count
+        },
+    )
+
+
+def _sqlstate(exc: SQLAlchemyError) -> str:
+    """SQLSTATE of the driver error behind ``exc`` ("" when there is none)."""
+    return getattr(getattr(exc, "orig", None), "sqlstate", None) or ""
+
+
+def _driver_message(exc: SQLAlchemyError) -> str:
+    """First line of the driver error, without SQL or parameters."""
+    message = str(getattr(exc, "orig", None) or exc).strip()
+    if not message:
+        return type(exc).__name__
+    # asyncpg errors read "<class 'asyncpg.exceptions.X'>: message"
+    return message.splitlines()[0].split(">: ", 1)[-1]
+
+
+def _search_query(search: str):
+    """Build a tsquery from free-form user input."""
+    return func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), search)
 
 
 class RecipeRepository:
     """Recipe repository implementation."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
+        # Rows locked by get_for_update, reused by update() in the same transaction
+        self._locked: Dict[UUID, RecipeORM] = {}
 
-    def create(self, recipe: DomainRecipe) -> DomainRecipe:
-        """Create a new recipe with its steps."""
+    async def create(
+        self, recipe: DomainRecipe, ingredients: Optional[List[str]] = None
+    ) -> DomainRecipe:
+        """Create a new recipe with its steps and normalized ingredient names."""
         recipe_orm = RecipeORM(
             id=recipe.recipe_id,
             title=recipe.title,
@@ -36,39 +195,111 @@ class RecipeRepository:
             tags=recipe.tags,
             is_published=recipe.is_published,
             is_community=recipe.is_community,
+            ingredient_count=len(ingredients or []),
             created_at=recipe.created_at,
             updated_at=recipe.updated_at,
         )
 
-        # Add steps
-        for step in recipe.steps:
-            step_orm = RecipeStepORM(
-                id=step.step_id,
-                recipe_id=recipe.recipe_id,
-                step_number=step.step_number,
-                instruction_md=step.instruction_md,
-                ingredients_json=step.ingredients_json,
-                time_minutes=step.time_minutes,
+        self.db.add(recipe_orm)
+        await self._adjust_facets(
+            facet_keys(recipe.category, recipe.tags, recipe.is_published), set()
+        )
+        await self.db.flush()
+        if recipe.steps:
+            # One multi-row INSERT, so the search vector is rebuilt once
+            await self.db.execute(
+                insert(RecipeStepORM).values(
+                    [_step_row(step, recipe.recipe_id) for step in recipe.steps]
+                )
+            )
+        if ingredients:
+            await self.db.execute(
+                insert(RecipeIngredientORM),
+                [{"recipe_id": recipe.recipe_id, "name": n} for n in ingredients],
             )
-            recipe_orm.steps.append(step_orm)
+        await self.db.commit()
 
-        self.db.add(recipe_orm)
-        self.db.commit()
-        self.db.refresh(recipe_orm)
+        created = self._to_summary(recipe_orm)
+        created.steps = recipe.steps
+        return created
 
-        return self._to_domain(recipe_orm)
+    async def create_many(
+        self, recipes: List[DomainRecipe], ingredients: List[List[str]]
+    ) -> None:
+        """Insert a batch of recipes in one transaction (multi-row inserts).
 
-    def get_by_id(self, recipe_id: UUID) -> Optional[DomainRecipe]:
+        ``ingredients`` holds each recipe's normalized ingredient names.
+        The batch is rolled back as a whole if any row fails; rows the
+        database rejects raise a ValidationError with its message.
+        """
+        recipe_rows, step_rows, ingredient_rows = [], [], []
+        facets = Counter()
+        for recipe, names in zip(recipes, ingredients):
+            recipe_rows.append(
+                {
+                    "id": recipe.recipe_id,
+                    "title": recipe.title,
+                    "author_user_id": recipe.author_user_id,
+                    "author_alias": recipe.author_alias,
+                    "photo_url": recipe.photo_url,
+                    "prep_time_minutes": recipe.prep_time_minutes,
+                    "yield_amount": recipe.yield_amount,
+                    "category": recipe.category,
+                    "tags": recipe.tags,
+                    "is_published": recipe.is_published,
+                    "is_community": recipe.is_community,
+                    "ingredient_count": len(names),
+                    "created_at": recipe.created_at,
+                    "updated_at": recipe.updated_at,
+                }
+            )
+            step_rows += [_step_row(step, recipe.recipe_id) for step in recipe.steps]
+            ingredient_rows += [
+                {"recipe_id": recipe.recipe_id, "name": name} for name in names
+            ]
+            facets.update(facet_keys(recipe.category, recipe.tags, recipe.is_published))
+
+        try:
+            await self.db.execute(insert(RecipeORM), recipe_rows)
+            if step_rows:
+                # RETURNING makes SQLAlchemy send multi-row INSERTs instead of
+                # one statement (and one search vector rebuild) per step
+                await self.db.execute(
+                    insert(RecipeStepORM).returning(RecipeStepORM.id), step_rows
+                )
+            if ingredient_rows:
+                await self.db.execute(insert(RecipeIngredientORM), ingredient_rows)
+            await self._apply_facet_deltas(facets)
+            await self.db.commit()
+        except SQLAlchemyError as exc:
+            await self.db.rollback()
+            if _sqlstate(exc)[:2] in REJECTED_ROW_SQLSTATE_CLASSES:
+                raise ValidationError(_driver_message(exc)) from exc
+            raise
+
+    async def get_by_id(self, recipe_id: UUID) -> Optional[DomainRecipe]:
         """Get recipe by ID with steps."""
         stmt = (
             select(RecipeORM)
             .options(selectinload(RecipeORM.steps))
             .where(RecipeORM.id == recipe_id)
         )
-        recipe_orm = self.db.execute(stmt).scalar_one_or_none()
+        recipe_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain(recipe_orm) if recipe_orm else None
 
-    def get_all(
+    async def get_for_update(
+        self, recipe_id: UUID, include_steps: bool = True
+    ) -> Optional[DomainRecipe]:
+        """Load and lock a recipe ahead of update(), which then reuses the row."""
+        recipe_orm = await self._lock_row(recipe_id, include_steps)
+        if recipe_orm is None:
+            return None
+        self._locked[recipe_id] = recipe_orm
+        if include_steps:
+            return self._to_domain(recipe_orm)
+        return self._to_summary(recipe_orm)
+
+    async def get_all(
         self,
         page: int = 1,
         page_size: int = 10,
@@ -78,10 +309,16 @@ class RecipeRepository:
         author_user_id: Optional[UUID] = None,
         search: Optional[str] = None,
         tags: Optional[List[str]] = None,
-    ) -> Tuple[List[DomainRecipe], int]:
-        """Get all recipes with filters and pagination."""
-        # Base query
-        stmt = select(RecipeORM).options(selectinload(RecipeORM.steps))
+        after: Optional[str] = None,
+        include_total: bool = True,
+        include_steps: bool = False,
+        sort: str = "recent",
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[DomainRecipe], Optional[int], Optional[str]]:
+        """Get all recipes with filters and offset or keyset pagination."""
+        # Base query (summary columns only unless steps are requested)
+        stmt = self._list_select(include_steps)
+        ts_query = None
 
         # Apply filters
         if category:
@@ -93,125 +330,425 @@ class RecipeRepository:
         if author_user_id:
             stmt = stmt.where(RecipeORM.author_user_id == author_user_id)
         if search:
-            search_pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    RecipeORM.title.ilike(search_pattern),
-                    RecipeORM.author_alias.ilike(search_pattern),
-                )
-            )
+            ts_query = _search_query(search)
+            stmt = stmt.where(RecipeORM.search_vector.op("@@")(ts_query))
         if tags:
             stmt = stmt.where(RecipeORM.tags.overlap(tags))
 
-        # Count total
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = self.db.execute(count_stmt).scalar() or 0
+        # Ranked orders (rating, popularity, relevance) are paged by offset
+        if sort in SORT_COLUMNS:
+            ranking = [SORT_COLUMNS[sort]]
+        elif ts_query is not None:
+            ranking = [func.ts_rank_cd(RecipeORM.search_vector, ts_query).desc()]
+        else:
+            ranking = None
+        if ranking:
+            reject_cursor(after)
 
-        # Apply pagination and ordering
-        offset = (page - 1) * page_size
-        stmt = stmt.order_by(RecipeORM.created_at.desc()).offset(offset).limit(page_size)
+        # Count total (optional, skipped when scrolling by cursor)
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total = (await self.db.execute(count_stmt)).scalar() or 0
+
+        stmt = self._with_favorite_flag(stmt, include_steps, viewer_id)
+
+        if ranking:
+            stmt = (
+                stmt.order_by(
+                    *ranking, RecipeORM.created_at.desc(), RecipeORM.id.desc()
+                )
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+            )
+            rows = await self._fetch(stmt, include_steps)
+            return self._rows_to_domain(rows, include_steps), total, None
+
+        # Apply ordering and pagination (seek past cursor, or offset)
+        stmt = apply_keyset(stmt, RecipeORM.created_at, RecipeORM.id, after)
+        if not after:
+            stmt = stmt.offset((page - 1) * page_size)
+        stmt = stmt.limit(page_size)
 
         # Execute
-        recipes_orm = self.db.execute(stmt).scalars().all()
+        rows = await self._fetch(stmt, include_steps)
 
-        return [self._to_domain(r) for r in recipes_orm], total
+        return (
+            self._rows_to_domain(rows, include_steps),
+            total,
+            next_cursor(rows, page_size),
+        )
 
-    def get_by_user(
+    async def get_by_user(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 10,
         category: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> Tuple[List[DomainRecipe], int]:
+        include_steps: bool = False,
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[DomainRecipe], Optional[int], Optional[str]]:
         """Get recipes by user ID."""
-        return self.get_all(
+        return await self.get_all(
             page=page,
             page_size=page_size,
             author_user_id=user_id,
             category=category,
             search=search,
+            include_steps=include_steps,
+            viewer_id=viewer_id,
         )
 
-    def get_community_recipes(
+    async def get_community_recipes(
         self,
         page: int = 1,
         page_size: int = 10,
         category: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> Tuple[List[DomainRecipe], int]:
+        after: Optional[str] = None,
+        include_total: bool = True,
+        include_steps: bool = False,
+        sort: str = "recent",
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[DomainRecipe], Optional[int], Optional[str]]:
         """Get community (published) recipes."""
-        return self.get_all(
+        return await self.get_all(
             page=page,
             page_size=page_size,
             is_published=True,
             category=category,
             search=search,
+            after=after,
+            include_total=include_total,
+            include_steps=include_steps,
+            sort=sort,
+            viewer_id=viewer_id,
         )
 
-    def update(self, recipe: DomainRecipe) -> DomainRecipe:
-        """Update recipe and its steps."""
-        stmt = (
-            select(RecipeORM)
-            .options(selectinload(RecipeORM.steps))
-            .where(RecipeORM.id == recipe.recipe_id)
+    async def update(
+        self,
+        recipe: DomainRecipe,
+        update_steps: bool = True,
+        ingredients: Optional[List[str]] = None,
+    ) -> DomainRecipe:
+        """Update recipe and, when update_steps is set, diff its steps.
+
+        ``ingredients`` (normalized names) replaces the recipe's ingredient
+        index when given and is left untouched when None.
+        """
+        # Lock the row (unless get_for_update did) so concurrent updates diff
+        # facets against fresh values
+        recipe_orm = self._locked.pop(recipe.recipe_id, None)
+        if recipe_orm is None:
+            recipe_orm = await self._lock_row(recipe.recipe_id)
+        old_facets = facet_keys(
+            recipe_orm.category, recipe_orm.tags, recipe_orm.is_published
         )
-        recipe_orm = self.db.execute(stmt).scalar_one()
 
-        # Update recipe fields
+        # Update recipe fields (only changed columns are written)
         recipe_orm.title = recipe.title
         recipe_orm.author_alias = recipe.author_alias
         recipe_orm.photo_url = recipe.photo_url
         recipe_orm.prep_time_minutes = recipe.prep_time_minutes
         recipe_orm.yield_amount = recipe.yield_amount
         recipe_orm.category = recipe.category
-        recipe_orm.rating = recipe.rating
         recipe_orm.tags = recipe.tags
         recipe_orm.is_published = recipe.is_published
         recipe_orm.updated_at = recipe.updated_at
 
-        # Delete existing steps and recreate
-        for step_orm in recipe_orm.steps:
-            self.db.delete(step_orm)
-
-        # Add new steps
-        for step in recipe.steps:
-            step_orm = RecipeStepORM(
-                id=step.step_id,
-                recipe_id=recipe.recipe_id,
-                step_number=step.step_number,
-                instruction_md=step.instruction_md,
-                ingredients_json=step.ingredients_json,
-                time_minutes=step.time_minutes,
+        await self._adjust_facets(
+            facet_keys(recipe.category, recipe.tags, recipe.is_published),
+            old_facets,
+        )
+        if update_steps:
+            await self._sync_steps(recipe.recipe_id, recipe.steps)
+        if ingredients is not None:
+            await self._replace_ingredients(recipe.recipe_id, ingredients)
+            recipe_orm.ingredient_count = len(ingredients)
+
+        await self.db.commit()
+
+        updated = self._to_summary(recipe_orm)
+        updated.steps = recipe.steps
+        return updated
+
+    async def _sync_steps(self, recipe_id: UUID, steps: List[DomainRecipeStep]) -> None:
+        """Write only the difference between stored and desired steps.
+
+        Unchanged steps keep their row (and ID) and are just renumbered,
+        remaining positions reuse leftover rows in place, and only the
+        surplus is inserted or deleted, with one bulk statement per kind.
+        """
+        stmt = (
+            select(
+                RecipeStepORM.id,
+                RecipeStepORM.step_number,
+                RecipeStepORM.instruction_md,
+                RecipeStepORM.ingredients_json,
+                RecipeStepORM.time_minutes,
             )
-            recipe_orm.steps.append(step_orm)
+            .where(RecipeStepORM.recipe_id == recipe_id)
+            .order_by(RecipeStepORM.step_number)
+        )
+        existing = (await self.db.execute(stmt)).all()
+
+        def content(step) -> tuple:
+            return (step.instruction_md, step.ingredients_json or [], step.time_minutes)
 
-        self.db.commit()
-        self.db.refresh(recipe_orm)
+        # Pair desired steps with identical stored ones first
+        unused = list(existing)
+        matched = {}
+        for index, step in enumerate(steps):
+            row = next((r for r in unused if content(r) == content(step)), None)
+            if row is not None:
+                unused.remove(row)
+                matched[index] = row
 
-        return self._to_domain(recipe_orm)
+        updates, inserts = [], []
+        for index, step in enumerate(steps):
+            step.recipe_id = recipe_id
+            step.step_number = index + 1
+            row = matched.get(index)
+            if row is not None:
+                step.step_id = row.id
+                if row.step_number == step.step_number:
+                    continue
+            elif unused:
+                step.step_id = unused.pop(0).id
+            else:
+                inserts.append(step)
+                continue
+            updates.append(step)
+
+        # One statement per kind, so the search vector trigger (which skips
+        # pure renumbering) rebuilds the recipe once
+        if unused:
+            await self.db.execute(
+                delete(RecipeStepORM).where(
+                    RecipeStepORM.id.in_([r.id for r in unused])
+                )
+            )
+        if updates:
+            rows = [_step_row(step, recipe_id) for step in updates]
+            changed = values(
+                *(column(c.name, c.type) for c in STEP_UPDATE_COLUMNS), name="changed"
+            ).data([tuple(row[c.name] for c in STEP_UPDATE_COLUMNS) for row in rows])
+            # Cast back: an all-NULL VALUES column would be typed text
+            assignments = {
+                c.name: cast(changed.c[c.name], c.type) for c in STEP_UPDATE_COLUMNS[1:]
+            }
+            await self.db.execute(
+                update(RecipeStepORM)
+                .where(RecipeStepORM.id == changed.c.id)
+                .values(assignments)
+                .execution_options(synchronize_session=False)
+            )
+        if inserts:
+            await self.db.execute(
+                insert(RecipeStepORM).values([_step_row(s, recipe_id) for s in inserts])
+            )
 
-    def delete(self, recipe_id: UUID) -> bool:
+    async def _replace_ingredients(self, recipe_id: UUID, names: List[str]) -> None:
+        """Make the recipe's ingredient rows match ``names``."""
+        await self.db.execute(
+            delete(RecipeIngredientORM).where(
+                RecipeIngredientORM.recipe_id == recipe_id,
+                RecipeIngredientORM.name.not_in(names),
+            )
+        )
+        if names:
+            await self.db.execute(
+                insert(RecipeIngredientORM)
+                .values([{"recipe_id": recipe_id, "name": n} for n in names])
+                .on_conflict_do_nothing()
+            )
+
+    async def find_by_ingredients(
+        self,
+        names: List[str],
+        page: int = 1,
+        page_size: int = 10,
+        viewer_id: Optional[UUID] = None,
+    ) -> Tuple[List[Tuple[DomainRecipe, List[str]]], int]:
+        """Published recipes using any of ``names``, best ingredient coverage first.
+
+        An ingredient matches a name equal to its own or to its head noun, so
+        "leche" finds "leche fria". Coverage is the share of a recipe's
+        ingredients matched; each result is paired with the ingredients it
+        matched.
+        """
+        matches = (
+            select(
+                RecipeIngredientORM.recipe_id,
+                func.count().label("matched"),
+                func.array_agg(RecipeIngredientORM.name).label("matched_names"),
+            )
+            .where(
+                or_(
+                    RecipeIngredientORM.name.in_(names),
+                    RecipeIngredientORM.head.in_(names),
+                )
+            )
+            .group_by(RecipeIngredientORM.recipe_id)
+            .subquery()
+        )
+        stmt = (
+            select(*SUMMARY_COLUMNS, matches.c.matched_names)
+            .join(matches, matches.c.recipe_id == RecipeORM.id)
+            .where(RecipeORM.is_published)
+        )
+
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total = (await self.db.execute(count_stmt)).scalar() or 0
+
+        coverage = cast(matches.c.matched, Float) / func.greatest(
+            RecipeORM.ingredient_count, 1
+        )
+        stmt = (
+            self._with_favorite_flag(stmt, False, viewer_id)
+            .order_by(
+                coverage.desc(),
+                matches.c.matched.desc(),
+                RecipeORM.created_at.desc(),
+                RecipeORM.id.desc(),
+            )
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        return [(self._to_summary(r), sorted(r.matched_names)) for r in rows], total
+
+    async def delete(self, recipe_id: UUID) -> bool:
         """Delete recipe by ID."""
-        stmt = select(RecipeORM).where(RecipeORM.id == recipe_id)
-        recipe_orm = self.db.execute(stmt).scalar_one_or_none()
+        stmt = (
+            select(RecipeORM)
+            .where(RecipeORM.id == recipe_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        recipe_orm = (await self.db.execute(stmt)).scalar_one_or_none()
 
         if recipe_orm:
-            self.db.delete(recipe_orm)
-            self.db.commit()
+            await self._adjust_facets(
+                set(),
+                facet_keys(
+                    recipe_orm.category, recipe_orm.tags, recipe_orm.is_published
+                ),
+            )
+            await self.db.delete(recipe_orm)
+            await self.db.commit()
             return True
 
         return False
 
-    def exists(self, recipe_id: UUID) -> bool:
+    async def stream_published(
+        self, fetch_size: int = 500
+    ) -> AsyncIterator[DomainRecipe]:
+        """Stream published recipes with steps through a server-side cursor.
+
+        Steps come aggregated as JSON in the same row, so memory stays bounded
+        by ``fetch_size`` rows regardless of catalogue size.
+        """
+        # Keys are inlined: jsonb_build_object cannot infer bound parameter types
+        fields = (
+            RecipeStepORM.id,
+            RecipeStepORM.step_number,
+            RecipeStepORM.instruction_md,
+            RecipeStepORM.ingredients_json,
+            RecipeStepORM.time_minutes,
+        )
+        step = func.jsonb_build_object(
+            *(part for f in fields for part in (literal_column(f"'{f.key}'"), f))
+        )
+        steps = (
+            select(
+                func.jsonb_agg(
+                    aggregate_order_by(step, RecipeStepORM.step_number), type_=JSONB
+                )
+            )
+            .where(RecipeStepORM.recipe_id == RecipeORM.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(*SUMMARY_COLUMNS, steps.label("steps_json"))
+            .where(RecipeORM.is_published)
+            .order_by(RecipeORM.created_at, RecipeORM.id)
+            .execution_options(yield_per=fetch_size)
+        )
+
+        result = await self.db.stream(stmt)
+        async for row in result:
+            recipe = self._to_summary(row)
+            recipe.steps = [
+                DomainRecipeStep(
+                    step_id=UUID(step["id"]),
+                    recipe_id=row.id,
+                    step_number=step["step_number"],
+                    instruction_md=step["instruction_md"],
+                    ingredients_json=step["ingredients_json"] or [],
+                    time_minutes=step["time_minutes"],
+                )
+                for step in row.steps_json or []
+            ]
+            yield recipe
+
+    async def exists(self, recipe_id: UUID) -> bool:
         """Check if recipe exists."""
         stmt = select(func.count()).where(RecipeORM.id == recipe_id)
-        count = self.db.execute(stmt).scalar() or 0
+        count = (await self.db.execute(stmt)).scalar() or 0
         return count > 0
 
+    async def _lock_row(
+        self, recipe_id: UUID, include_steps: bool = False
+    ) -> Optional[RecipeORM]:
+        """Select a recipe FOR NO KEY UPDATE, refreshing any cached instance."""
+        stmt = (
+            select(RecipeORM)
+            .where(RecipeORM.id == recipe_id)
+            .with_for_update(key_share=True)
+            .execution_options(populate_existing=True)
+        )
+        if include_steps:
+            stmt = stmt.options(selectinload(RecipeORM.steps))
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    def _list_select(self, include_steps: bool):
+        """Select full recipes with steps, or just the summary columns."""
+        if include_steps:
+            return select(RecipeORM).options(selectinload(RecipeORM.steps))
+        return select(*SUMMARY_COLUMNS)
+
+    @staticmethod
+    def _with_favorite_flag(stmt, include_steps: bool, viewer_id: Optional[UUID]):
+        """Add ``is_favorite`` for ``viewer_id`` via one LEFT JOIN (no-op if None)."""
+        if viewer_id is None:
+            return stmt
+        favorite = aliased(UserFavoriteRecipeORM)
+        is_favorite = favorite.recipe_id.is_not(None)
+        stmt = stmt.outerjoin(
+            favorite,
+            and_(favorite.recipe_id == RecipeORM.id, favorite.user_id == viewer_id),
+        )
+        if include_steps:
+            return stmt.options(with_expression(RecipeORM.is_favorite, is_favorite))
+        return stmt.add_columns(is_favorite.label("is_favorite"))
+
+    async def _fetch(self, stmt, include_steps: bool) -> list:
+        """Execute a list query built by _list_select."""
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all() if include_steps else result.all())
+
+    def _rows_to_domain(self, rows: list, include_steps: bool) -> List[DomainRecipe]:
+        """Convert list rows to domain entities."""
+        if include_steps:
+            return [self._to_domain(r) for r in rows]
+        return [self._to_summary(r) for r in rows]
+
     def _to_domain(self, recipe_orm: RecipeORM) -> DomainRecipe:
         """Convert ORM to domain entity."""
-        steps = [
+        recipe = self._to_summary(recipe_orm)
+        recipe.steps = [
             DomainRecipeStep(
                 step_id=step_orm.id,
                 recipe_id=step_orm.recipe_id,
@@ -222,82 +759,292 @@ class RecipeRepository:
             )
             for step_orm in sorted(recipe_orm.steps, key=lambda s: s.step_number)
         ]
+        return recipe
 
+    @staticmethod
+    def _effective_rating(row) -> Optional[Decimal]:
+        """User rating average, falling back to the legacy editorial rating."""
+        rating = row.rating_avg if row.rating_avg is not None else row.rating
+        return Decimal(str(rating)) if rating else None
+
+    def _to_summary(self, row) -> DomainRecipe:
+        """Convert an ORM object or summary row to a domain entity without steps."""
         return DomainRecipe(
-            recipe_id=recipe_orm.id,
-            title=recipe_orm.title,
-            author_user_id=recipe_orm.author_user_id,
-            author_alias=recipe_orm.author_alias,
-            photo_url=recipe_orm.photo_url,
-            prep_time_minutes=recipe_orm.prep_time_minutes,
-            yield_amount=recipe_orm.yield_amount,
-            category=recipe_orm.category,
-            rating=Decimal(str(recipe_orm.rating)) if recipe_orm.rating else None,
-            tags=recipe_orm.tags or [],
-            is_published=recipe_orm.is_published,
-            is_community=recipe_orm.is_community,
-            created_at=recipe_orm.created_at,
-            updated_at=recipe_orm.updated_at,
-            steps=steps,
+            recipe_id=row.id,
+            title=row.title,
+            author_user_id=row.author_user_id,
+            author_alias=row.author_alias,
+            photo_url=row.photo_url,
+            prep_time_minutes=row.prep_time_minutes,
+            yield_amount=row.yield_amount,
+            category=row.category,
+            rating=self._effective_rating(row),
+            rating_count=row.rating_count or 0,
+            favorite_count=row.favorite_count or 0,
+            ingredient_count=row.ingredient_count or 0,
+            is_favorite=getattr(row, "is_favorite", None),
+            tags=row.tags or [],
+            is_published=row.is_published,
+            is_community=row.is_community,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
         )
 
-    # === FAVORITES ===
+    # === FACETS ===
 
-    def add_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
-        """Add recipe to user favorites."""
-        existing = self.db.execute(
-            select(UserFavoriteRecipeORM).where(
-                UserFavoriteRecipeORM.user_id == user_id,
-                UserFavoriteRecipeORM.recipe_id == recipe_id,
+    async def _adjust_facets(
+        self, added: Set[Tuple[str, str, str]], removed: Set[Tuple[str, str, str]]
+    ) -> None:
+        """Increment facet rows a recipe entered and decrement those it left."""
+        deltas = Counter(added - removed)
+        deltas.subtract(removed - added)
+        await self._apply_facet_deltas(deltas)
+
+    async def _apply_facet_deltas(self, deltas: Counter) -> None:
+        """Add per-row deltas to the facet counts in one upsert."""
+        stmt = facet_upsert(deltas)
+        if stmt is not None:
+            await self.db.execute(stmt)
+
+    async def get_facets(
+        self, category: Optional[str] = None
+    ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """Published recipe counts per category and per tag (within category)."""
+        stmt = (
+            select(
+                RecipeFacetCountORM.kind,
+                RecipeFacetCountORM.value,
+                RecipeFacetCountORM.recipe_count,
+            )
+            .where(
+                (
+                    (RecipeFacetCountORM.kind == "category")
+                    & (RecipeFacetCountORM.scope == "")
+                )
+                | (
+                    (RecipeFacetCountORM.kind == "tag")
+                    & (RecipeFacetCountORM.scope == (category or ""))
+                ),
+                RecipeFacetCountORM.recipe_count > 0,
+            )
+            .order_by(
+                RecipeFacetCountORM.recipe_count.desc(), RecipeFacetCountORM.value
             )
+        )
+        rows = (await self.db.execute(stmt)).all()
+        categories = [(r.value, r.recipe_count) for r in rows if r.kind == "category"]
+        tags = [(r.value, r.recipe_count) for r in rows if r.kind == "tag"]
+        return categories, tags
+
+    # === RATINGS ===
+
+    async def rate(
+        self, user_id: UUID, recipe_id: UUID, rating: int
+    ) -> Optional[Tuple[Optional[Decimal], int]]:
+        """Upsert a user's rating; returns (avg, count) or None if no recipe."""
+        return await self._apply_rating(user_id, recipe_id, rating)
+
+    async def remove_rating(
+        self, user_id: UUID, recipe_id: UUID
+    ) -> Optional[Tuple[Optional[Decimal], int]]:
+        """Remove a user's rating; returns (avg, count) or None if no recipe."""
+        return await self._apply_rating(user_id, recipe_id, None)
+
+    async def _apply_rating(
+        self, user_id: UUID, recipe_id: UUID, rating: Optional[int]
+    ) -> Optional[Tuple[Optional[Decimal], int]]:
+        """Write the vote and adjust the recipe aggregates by its delta."""
+        # Lock the recipe so concurrent votes apply their deltas one at a time
+        lock_stmt = (
+            select(RecipeORM.id)
+            .where(RecipeORM.id == recipe_id)
+            .with_for_update(key_share=True)
+        )
+        if (await self.db.execute(lock_stmt)).scalar_one_or_none() is None:
+            return None
+
+        vote = (
+            RecipeRatingORM.user_id == user_id,
+            RecipeRatingORM.recipe_id == recipe_id,
+        )
+        previous = (
+            await self.db.execute(select(RecipeRatingORM.rating).where(*vote))
         ).scalar_one_or_none()
 
-        if existing:
-            return False
+        if rating is not None:
+            stmt = insert(RecipeRatingORM).values(
+                user_id=user_id, recipe_id=recipe_id, rating=rating
+            )
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_user_recipe_rating",
+                set_={"rating": stmt.excluded.rating, "updated_at": func.now()},
+            )
+            await self.db.execute(stmt)
+        elif previous is not None:
+            await self.db.execute(delete(RecipeRatingORM).where(*vote))
+
+        sum_delta = (rating or 0) - (previous or 0)
+        count_delta = (rating is not None) - (previous is not None)
+        new_sum = RecipeORM.rating_sum + sum_delta
+        new_count = RecipeORM.rating_count + count_delta
+        stmt = (
+            update(RecipeORM)
+            .where(RecipeORM.id == recipe_id)
+            .values(
+                rating_sum=new_sum,
+                rating_count=new_count,
+                rating_avg=func.round(
+                    cast(new_sum, Numeric) / func.nullif(new_count, 0), 2
+                ),
+            )
+            .returning(RecipeORM.rating_avg, RecipeORM.rating_count)
+        )
+        rating_avg, rating_count = (await self.db.execute(stmt)).one()
+        await self.db.commit()
+        return rating_avg, rating_count
+
+    # === POPULARITY ===
+
+    async def refresh_trending_scores(
+        self, half_life_hours: float, window_days: int
+    ) -> int:
+        """Recompute time-decayed trending scores in bulk.
+
+        Each favorite inside the window counts 0.5 ** (age / half-life);
+        recipes with no recent favorites drop back to 0.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=window_days)
+        favorites = UserFavoriteRecipeORM
+        age_hours = func.extract("epoch", func.now() - favorites.created_at) / 3600
+        scores = (
+            select(
+                favorites.recipe_id,
+                func.sum(func.power(0.5, age_hours / half_life_hours)).label("score"),
+            )
+            .where(favorites.created_at > cutoff)
+            .group_by(favorites.recipe_id)
+            .subquery()
+        )
+        scored = await self.db.execute(
+            update(RecipeORM)
+            .where(RecipeORM.id == scores.c.recipe_id)
+            .values(trending_score=scores.c.score)
+            .execution_options(synchronize_session=False)
+        )
+
+        recent = select(favorites.recipe_id).where(
+            favorites.recipe_id == RecipeORM.id, favorites.created_at > cutoff
+        )
+        cleared = await self.db.execute(
+            update(RecipeORM)
+            .where(RecipeORM.trending_score > 0, ~recent.exists())
+            .values(trending_score=0)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return (scored.rowcount or 0) + (cleared.rowcount or 0)
+
+    # === FAVORITES ===
 
-        favorite = UserFavoriteRecipeORM(user_id=user_id, recipe_id=recipe_id)
-        self.db.add(favorite)
-        self.db.commit()
-        return True
+    async def add_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
+        """Add recipe to user favorites (favorite_count follows via trigger)."""
+        stmt = (
+            insert(UserFavoriteRecipeORM)
+            .values(user_id=user_id, recipe_id=recipe_id)
+            .on_conflict_do_nothing()
+            .returning(UserFavoriteRecipeORM.recipe_id)
+        )
+        added = (await self.db.execute(stmt)).scalar_one_or_none() is not None
+        await self.db.commit()
+        return added
 
-    def remove_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
+    async def remove_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
         """Remove recipe from user favorites."""
-        favorite = self.db.execute(
-            select(UserFavoriteRecipeORM).where(
+        stmt = (
+            delete(UserFavoriteRecipeORM)
+            .where(
                 UserFavoriteRecipeORM.user_id == user_id,
                 UserFavoriteRecipeORM.recipe_id == recipe_id,
             )
-        ).scalar_one_or_none()
+            .returning(UserFavoriteRecipeORM.recipe_id)
+        )
+        removed = (await self.db.execute(stmt)).scalar_one_or_none() is not None
+        await self.db.commit()
+        return removed
 
-        if not favorite:
-            return False
+    async def apply_favorites(
+        self, user_id: UUID, add: List[UUID], remove: List[UUID]
+    ) -> Tuple[List[UUID], List[UUID], List[UUID]]:
+        """Add and remove many favorites in one transaction.
 
-        self.db.delete(favorite)
-        self.db.commit()
-        return True
+        Returns the ids actually (added, removed) and the ids in ``add`` that
+        match no recipe, which are skipped.
+        """
+        added: List[UUID] = []
+        removed: List[UUID] = []
+        missing: List[UUID] = []
+        if add:
+            stmt = select(RecipeORM.id).where(RecipeORM.id == _uuid_array(add))
+            found = set((await self.db.execute(stmt)).scalars().all())
+            missing = [recipe_id for recipe_id in add if recipe_id not in found]
+            if found:
+                stmt = (
+                    insert(UserFavoriteRecipeORM)
+                    .values(
+                        [{"user_id": user_id, "recipe_id": r} for r in sorted(found)]
+                    )
+                    .on_conflict_do_nothing()
+                    .returning(UserFavoriteRecipeORM.recipe_id)
+                )
+                added = list((await self.db.execute(stmt)).scalars().all())
+        if remove:
+            stmt = (
+                delete(UserFavoriteRecipeORM)
+                .where(
+                    UserFavoriteRecipeORM.user_id == user_id,
+                    UserFavoriteRecipeORM.recipe_id == _uuid_array(remove),
+                )
+                .returning(UserFavoriteRecipeORM.recipe_id)
+            )
+            removed = list((await self.db.execute(stmt)).scalars().all())
+        await self.db.commit()
+        return added, removed, missing
 
-    def is_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
+    async def get_favorite_membership(
+        self, user_id: UUID, recipe_ids: List[UUID]
+    ) -> List[UUID]:
+        """Return which of ``recipe_ids`` the user has favorited."""
+        stmt = select(UserFavoriteRecipeORM.recipe_id).where(
+            UserFavoriteRecipeORM.user_id == user_id,
+            UserFavoriteRecipeORM.recipe_id == _uuid_array(recipe_ids),
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def is_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
         """Check if recipe is in user favorites."""
         stmt = select(func.count()).select_from(UserFavoriteRecipeORM).where(
             UserFavoriteRecipeORM.user_id == user_id,
             UserFavoriteRecipeORM.recipe_id == recipe_id,
         )
-        count = self.db.execute(stmt).scalar() or 0
+        count = (await self.db.execute(stmt)).scalar() or 0
         return count > 0
 
-    def get_user_favorites(
+    async def get_user_favorites(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 10,
         category: Optional[str] = None,
         search: Optional[str] = None,
+        include_steps: bool = False,
     ) -> Tuple[List[DomainRecipe], int]:
         """Get user favorite recipes."""
         stmt = (
-            select(RecipeORM)
-            .join(UserFavoriteRecipeORM)
-            .options(selectinload(RecipeORM.steps))
+            self._list_select(include_steps)
+            .join(
+                UserFavoriteRecipeORM,
+                UserFavoriteRecipeORM.recipe_id == RecipeORM.id,
+            )
             .where(UserFavoriteRecipeORM.user_id == user_id)
         )
 
@@ -305,28 +1052,31 @@ class RecipeRepository:
         if category:
             stmt = stmt.where(RecipeORM.category == category)
         if search:
-            search_pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    RecipeORM.title.ilike(search_pattern),
-                    RecipeORM.author_alias.ilike(search_pattern),
-                )
-            )
+            ts_query = _search_query(search)
+            stmt = stmt.where(RecipeORM.search_vector.op("@@")(ts_query))
 
         count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = self.db.execute(count_stmt).scalar() or 0
+        total = (await self.db.execute(count_stmt)).scalar() or 0
 
+        # Rank by relevance when searching, otherwise most recently favorited
+        if search:
+            stmt = stmt.order_by(
+                func.ts_rank_cd(RecipeORM.search_vector, ts_query).desc()
+            )
         offset = (page - 1) * page_size
         stmt = stmt.order_by(UserFavoriteRecipeORM.created_at.desc()).offset(offset).limit(page_size)
 
-        recipes_orm = self.db.execute(stmt).scalars().all()
-        return [self._to_domain(r) for r in recipes_orm], total
+        rows = await self._fetch(stmt, include_steps)
+        recipes = self._rows_to_domain(rows, include_steps)
+        for recipe in recipes:
+            recipe.is_favorite = True
+        return recipes, total
 
-    def get_user_favorite_ids(self, user_id: UUID) -> List[UUID]:
+    async def get_user_favorite_ids(self, user_id: UUID) -> List[UUID]:
         """Get list of recipe IDs that user has favorited."""
         stmt = select(UserFavoriteRecipeORM.recipe_id).where(
             UserFavoriteRecipeORM.user_id == user_id
         )
-        result = self.db.execute(stmt).scalars().all()
+        result = (await self.db.execute(stmt)).scalars().all()
         return list(result)
 
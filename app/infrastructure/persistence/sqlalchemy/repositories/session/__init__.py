@@ -4,8 +4,8 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.session import Session as SessionEntity
 
@@ -15,10 +15,10 @@ from ...models.session import Session as SessionORM
 class SessionRepository:
     """Session repository implementation."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def add(self, session: SessionEntity) -> None:
+    async def add(self, session: SessionEntity) -> None:
         """Add a new session."""
         session_orm = SessionORM(
             id=session.session_id,
@@ -30,80 +30,104 @@ class SessionRepository:
             ip_address=session.ip_address,
         )
         self.db.add(session_orm)
-        self.db.commit()
+        await self.db.commit()
 
-    def get_by_id(self, session_id: UUID) -> Optional[SessionEntity]:
+    async def get_by_id(self, session_id: UUID) -> Optional[SessionEntity]:
         """Get session by ID."""
-        session_orm = (
-            self.db.query(SessionORM).filter(SessionORM.id == session_id).first()
-        )
+        stmt = select(SessionORM).where(SessionORM.id == session_id)
+        session_orm = (await self.db.execute(stmt)).scalars().first()
         if not session_orm:
             return None
         return self._to_entity(session_orm)
 
-    def get_by_user_id(self, user_id: UUID) -> List[SessionEntity]:
+    async def get_by_user_id(self, user_id: UUID) -> List[SessionEntity]:
         """Get all sessions for a user."""
-        sessions_orm = (
-            self.db.query(SessionORM).filter(SessionORM.user_id == user_id).all()
-        )
+        stmt = select(SessionORM).where(SessionORM.user_id == user_id)
+        sessions_orm = (await self.db.execute(stmt)).scalars().all()
         return [self._to_entity(session_orm) for session_orm in sessions_orm]
 
-    def get_by_token_hash(self, token_hash: str) -> Optional[SessionEntity]:
+    async def get_by_token_hash(self, token_hash: str) -> Optional[SessionEntity]:
         """Get session by token hash."""
-        session_orm = (
-            self.db.query(SessionORM)
-            .filter(SessionORM.session_token_hash == token_hash)
-            .first()
-        )
+        stmt = select(SessionORM).where(SessionORM.session_token_hash == token_hash)
+        session_orm = (await self.db.execute(stmt)).scalars().first()
         if not session_orm:
             return None
         return self._to_entity(session_orm)
 
-    def get_active_sessions(self, user_id: UUID) -> List[SessionEntity]:
+    async def rotate_token_hash(
+        self,
+        token_hash: str,
+        new_token_hash: str,
+        user_id: UUID,
+        expires_at: datetime,
+    ) -> bool:
+        """Swap a live session's token hash in one statement.
+
+        Returns False, changing nothing, if the token is unknown, expired,
+        already rotated (so a replayed refresh token is rejected) or belongs
+        to another user.
+        """
+        stmt = (
+            update(SessionORM)
+            .where(
+                SessionORM.session_token_hash == token_hash,
+                SessionORM.user_id == user_id,
+                SessionORM.expires_at > func.now(),
+            )
+            .values(session_token_hash=new_token_hash, expires_at=expires_at)
+            .returning(SessionORM.id)
+        )
+        rotated = (await self.db.execute(stmt)).scalar_one_or_none() is not None
+        await self.db.commit()
+        return rotated
+
+    async def get_active_sessions(self, user_id: UUID) -> List[SessionEntity]:
         """Get active (non-expired) sessions for a user."""
         now = datetime.now(timezone.utc)
-        sessions_orm = (
-            self.db.query(SessionORM)
-            .filter(and_(SessionORM.user_id == user_id, SessionORM.expires_at > now))
-            .all()
+        stmt = select(SessionORM).where(
+            and_(SessionORM.user_id == user_id, SessionORM.expires_at > now)
         )
+        sessions_orm = (await self.db.execute(stmt)).scalars().all()
         return [self._to_entity(session_orm) for session_orm in sessions_orm]
 
-    def update(self, session: SessionEntity) -> None:
+    async def update(self, session: SessionEntity) -> None:
         """Update an existing session."""
-        session_orm = (
-            self.db.query(SessionORM)
-            .filter(SessionORM.id == session.session_id)
-            .first()
-        )
+        stmt = select(SessionORM).where(SessionORM.id == session.session_id)
+        session_orm = (await self.db.execute(stmt)).scalars().first()
         if session_orm:
             session_orm.session_token_hash = session.session_token_hash
             session_orm.expires_at = session.expires_at
             session_orm.user_agent = session.user_agent
             session_orm.ip_address = session.ip_address
-            self.db.commit()
+            await self.db.commit()
 
-    def delete(self, session_id: UUID) -> None:
+    async def delete(self, session_id: UUID) -> None:
         """Delete a session."""
-        session_orm = (
-            self.db.query(SessionORM).filter(SessionORM.id == session_id).first()
-        )
+        stmt = select(SessionORM).where(SessionORM.id == session_id)
+        session_orm = (await self.db.execute(stmt)).scalars().first()
         if session_orm:
-            self.db.delete(session_orm)
-            self.db.commit()
+            await self.db.delete(session_orm)
+            await self.db.commit()
 
-    def delete_by_user_id(self, user_id: UUID) -> None:
+    async def delete_by_user_id(self, user_id: UUID) -> None:
         """Delete all sessions for a user."""
-        self.db.query(SessionORM).filter(SessionORM.user_id == user_id).delete()
-        self.db.commit()
-
-    def delete_expired_sessions(self) -> int:
-        """Delete all expired sessions and return count."""
-        now = datetime.now(timezone.utc)
-        count = self.db.query(SessionORM).filter(SessionORM.expires_at <= now).count()
-        self.db.query(SessionORM).filter(SessionORM.expires_at <= now).delete()
-        self.db.commit()
-        return count
+        await self.db.execute(delete(SessionORM).where(SessionORM.user_id == user_id))
+        await self.db.commit()
+
+    async def delete_expired_sessions(self, batch_size: int = 1000) -> int:
+        """Delete up to batch_size expired sessions and return how many."""
+        expired = (
+            select(SessionORM.id)
+            .where(SessionORM.expires_at <= func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            delete(SessionORM).where(SessionORM.id.in_(expired))
+        )
+        await self.db.commit()
+        return result.rowcount or 0
 
     def _to_entity(self, session_orm: SessionORM) -> SessionEntity:
         """Convert ORM to domain entity."""
@@ -3,18 +3,23 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.ports.repositories.song_repository import SongRepositoryPort
 from app.domain.entities.song import Song
 from app.infrastructure.persistence.sqlalchemy.models.music import Song as SongORM
+from app.infrastructure.persistence.sqlalchemy.pagination import (
+    apply_keyset,
+    next_cursor,
+    reject_cursor,
+)
 
 
 class SongRepository(SongRepositoryPort):
     """SQLAlchemy implementation of song repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def _to_domain(self, orm_song: SongORM) -> Song:
@@ -45,63 +50,108 @@ class SongRepository(SongRepositoryPort):
             is_christmas=song.is_christmas,
         )
 
-    def create(self, song: Song) -> Song:
+    async def create(self, song: Song) -> Song:
         """Create a new song."""
         orm_song = self._to_orm(song)
         self.db.add(orm_song)
-        self.db.commit()
-        self.db.refresh(orm_song)
+        await self.db.commit()
+        await self.db.refresh(orm_song)
         return self._to_domain(orm_song)
 
-    def get_by_id(self, song_id: UUID) -> Optional[Song]:
+    async def get_by_id(self, song_id: UUID) -> Optional[Song]:
         """Get song by ID."""
-        orm_song = self.db.query(SongORM).filter(SongORM.id == song_id).first()
+        stmt = select(SongORM).where(SongORM.id == song_id)
+        orm_song = (await self.db.execute(stmt)).scalars().first()
         return self._to_domain(orm_song) if orm_song else None
 
-    def get_by_youtube_id(self, youtube_id: str) -> Optional[Song]:
+    async def get_by_youtube_id(self, youtube_id: str) -> Optional[Song]:
         """Get song by YouTube ID."""
-        orm_song = (
-            self.db.query(SongORM).filter(SongORM.youtube_video_id == youtube_id).first()
-        )
+        stmt = select(SongORM).where(SongORM.youtube_video_id == youtube_id)
+        orm_song = (await self.db.execute(stmt)).scalars().first()
         return self._to_domain(orm_song) if orm_song else None
 
-    def get_all(
+    async def get_all(
         self,
         page: int = 1,
         page_size: int = 10,
         genre: Optional[str] = None,
         is_christmas: Optional[bool] = None,
         search: Optional[str] = None,
-    ) -> tuple[List[Song], int]:
-        """Get all songs with pagination and filters."""
-        query = self.db.query(SongORM)
+        after: Optional[str] = None,
+        include_total: bool = True,
+        fuzzy: bool = False,
+    ) -> tuple[List[Song], Optional[int], Optional[str]]:
+        """Get all songs with offset or keyset pagination and filters.
+
+        Searches are backed by the pg_trgm indexes on title and artist and
+        ranked by similarity. With ``fuzzy`` the search term only has to be
+        word-similar to the title or artist, which tolerates typos.
+        """
+        query = select(SongORM)
+        if search:
+            reject_cursor(after)  # Ranked results are paged by offset
 
         # Apply filters
         if genre:
-            query = query.filter(SongORM.genre == genre)
+            query = query.where(SongORM.genre == genre)
         if is_christmas is not None:
-            query = query.filter(SongORM.is_christmas == is_christmas)
+            query = query.where(SongORM.is_christmas == is_christmas)
         if search:
-            search_filter = f"%{search}%"
-            query = query.filter(
-                or_(
-                    SongORM.title.ilike(search_filter),
-                    SongORM.artist.ilike(search_filter),
+            if fuzzy:
+                query = query.where(
+                    or_(
+                        SongORM.title.op("%>")(search),
+                        SongORM.artist.op("%>")(search),
+                    )
+                )
+            else:
+                search_filter = f"%{search}%"
+                query = query.where(
+                    or_(
+                        SongORM.title.ilike(search_filter),
+                        SongORM.artist.ilike(search_filter),
+                    )
                 )
-            )
 
-        # Get total count
-        total = query.count()
+        # Get total count (optional, skipped when scrolling by cursor)
+        total = None
+        if include_total:
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await self.db.execute(count_query)).scalar() or 0
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        songs = query.offset(offset).limit(page_size).all()
+        # Search results are ranked by similarity and paged by offset
+        if search:
+            similarity = func.greatest(
+                func.word_similarity(search, SongORM.title),
+                func.word_similarity(search, SongORM.artist),
+            )
+            query = (
+                query.order_by(similarity.desc(), SongORM.title, SongORM.id)
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+            )
+            songs = (await self.db.execute(query)).scalars().all()
+            return [self._to_domain(s) for s in songs], total, None
 
-        return [self._to_domain(s) for s in songs], total
+        # Apply ordering (oldest first) and pagination
+        query = apply_keyset(
+            query, SongORM.created_at, SongORM.id, after, descending=False
+        )
+        if not after:
+            query = query.offset((page - 1) * page_size)
+        query = query.limit(page_size)
+        songs = (await self.db.execute(query)).scalars().all()
+
+        return (
+            [self._to_domain(s) for s in songs],
+            total,
+            next_cursor(songs, page_size),
+        )
 
-    def update(self, song: Song) -> Song:
+    async def update(self, song: Song) -> Song:
         """Update an existing song."""
-        orm_song = self.db.query(SongORM).filter(SongORM.id == song.id).first()
+        stmt = select(SongORM).where(SongORM.id == song.id)
+        orm_song = (await self.db.execute(stmt)).scalars().first()
 
         if orm_song:
             orm_song.title = song.title
@@ -112,18 +162,19 @@ class SongRepository(SongRepositoryPort):
             orm_song.genre = song.genre
             orm_song.is_christmas = song.is_christmas
 
-            self.db.commit()
-            self.db.refresh(orm_song)
+            await self.db.commit()
+            await self.db.refresh(orm_song)
             return self._to_domain(orm_song)
 
         return song
 
-    def delete(self, song_id: UUID) -> bool:
+    async def delete(self, song_id: UUID) -> bool:
         """Delete a song by ID."""
-        orm_song = self.db.query(SongORM).filter(SongORM.id == song_id).first()
+        stmt = select(SongORM).where(SongORM.id == song_id)
+        orm_song = (await self.db.execute(stmt)).scalars().first()
         if orm_song:
-            self.db.delete(orm_song)
-            self.db.commit()
+            await self.db.delete(orm_song)
+            await self.db.commit()
             return True
         return False
 
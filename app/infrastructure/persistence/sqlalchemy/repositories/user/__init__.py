@@ -2,12 +2,14 @@
 
 from datetime import datetime
 from typing import Any, Dict, Optional
+from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User as DomainUser
 from app.domain.value_objects.email_address import EmailAddress
+from app.infrastructure.cache import user_status_cache
 
 from ...models.user import User as UserORM
 
@@ -15,10 +17,10 @@ from ...models.user import User as UserORM
 class UserRepository:
     """User repository implementation."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, user: DomainUser) -> DomainUser:
+    async def create(self, user: DomainUser) -> DomainUser:
         """Create a new user."""
         user_orm = UserORM(
             id=user.user_id,
@@ -33,33 +35,38 @@ class UserRepository:
             updated_at=user.updated_at,
         )
         self.db.add(user_orm)
-        self.db.commit()
-        self.db.refresh(user_orm)
+        await self.db.commit()
+        await self.db.refresh(user_orm)
         return self._to_domain(user_orm)
 
-    def get_by_id(self, user_id: str) -> Optional[DomainUser]:
+    async def get_by_id(self, user_id: str) -> Optional[DomainUser]:
         """Get user by ID."""
         stmt = select(UserORM).where(UserORM.id == user_id)
-        user_orm = self.db.execute(stmt).scalar_one_or_none()
+        user_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain(user_orm) if user_orm else None
 
-    def get_by_email(self, email: EmailAddress) -> Optional[DomainUser]:
+    async def get_active_status(self, user_id: UUID) -> Optional[bool]:
+        """Get only the user's is_active flag (None if the user does not exist)."""
+        stmt = select(UserORM.is_active).where(UserORM.id == user_id)
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    async def get_by_email(self, email: EmailAddress) -> Optional[DomainUser]:
         """Get user by email."""
         stmt = select(UserORM).where(UserORM.email == str(email))
-        user_orm = self.db.execute(stmt).scalar_one_or_none()
+        user_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain(user_orm) if user_orm else None
 
-    def get_by_alias(self, alias: str) -> Optional[DomainUser]:
+    async def get_by_alias(self, alias: str) -> Optional[DomainUser]:
         """Get user by alias."""
         stmt = select(UserORM).where(UserORM.alias == alias)
-        user_orm = self.db.execute(stmt).scalar_one_or_none()
+        user_orm = (await self.db.execute(stmt)).scalar_one_or_none()
         return self._to_domain(user_orm) if user_orm else None
 
-    def update(self, user_id: str, data: Dict[str, Any]) -> DomainUser:
+    async def update(self, user_id: str, data: Dict[str, Any]) -> DomainUser:
         """Update user with partial data."""
         stmt = select(UserORM).where(UserORM.id == user_id)
-        user_orm = self.db.execute(stmt).scalar_one_or_none()
-        
+        user_orm = (await self.db.execute(stmt)).scalar_one_or_none()
+
         if not user_orm:
             raise ValueError("User not found")
 
@@ -67,11 +74,12 @@ class UserRepository:
         for key, value in data.items():
             if hasattr(user_orm, key):
                 setattr(user_orm, key, value)
-        
+
         user_orm.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(user_orm)
+        await self.db.commit()
+        user_status_cache.invalidate(user_orm.id)
+        await self.db.refresh(user_orm)
         return self._to_domain(user_orm)
 
     def _to_domain(self, user_orm: UserORM) -> DomainUser:
@@ -0,0 +1,48 @@
+"""Background reaper for expired sessions."""
+
+from ...config.settings import settings
+from ...metrics import registry
+from ...tasks import PeriodicTask
+from .advisory_lock import try_advisory_lock
+from .engine import AsyncSessionLocal
+from .repositories.session import SessionRepository
+
+
+class SessionReaper(PeriodicTask):
+    """Periodically delete expired sessions in bounded batches.
+
+    Each batch is its own short transaction, so reaping a large backlog never
+    holds locks on the whole table or competes with logins for long. An
+    advisory lock lets only one worker reap on each tick.
+    """
+
+    name = "Session reaper"
+
+    def __init__(self, interval_seconds: int, batch_size: int):
+        super().__init__(interval_seconds)
+        self.batch_size = batch_size
+        self._reaped = registry.counter(
+            "sessions_reaped_total", "Expired sessions deleted by the reaper."
+        )
+
+    async def run_once(self) -> int:
+        """Delete expired sessions batch by batch until none are left."""
+        async with try_advisory_lock("parranda.session_reaper") as acquired:
+            if not acquired:
+                return 0
+            total = 0
+            while True:
+                async with AsyncSessionLocal() as db:
+                    deleted = await SessionRepository(db).delete_expired_sessions(
+                        self.batch_size
+                    )
+                total += deleted
+                self._reaped.inc(deleted)
+                if deleted < self.batch_size:
+                    return total
+
+
+# Global reaper
+session_reaper = SessionReaper(
+    settings.session_reaper_interval_seconds, settings.session_reaper_batch_size
+)
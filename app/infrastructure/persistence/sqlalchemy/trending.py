@@ -0,0 +1,50 @@
+"""Background recomputation of recipe trending scores."""
+
+import time
+
+from ...config.settings import settings
+from ...metrics import registry
+from ...tasks import PeriodicTask
+from .advisory_lock import try_advisory_lock
+from .engine import AsyncSessionLocal
+from .repositories.recipe import RecipeRepository
+
+
+class TrendingScoreUpdater(PeriodicTask):
+    """Periodically recompute every recipe's time-decayed trending score.
+
+    Every worker runs the task, but an advisory lock lets only one of them
+    do the work on each tick.
+    """
+
+    name = "Trending score updater"
+
+    def __init__(self, interval_seconds: int, half_life_hours: float, window_days: int):
+        super().__init__(interval_seconds)
+        self.half_life_hours = half_life_hours
+        self.window_days = window_days
+        self._duration = registry.histogram(
+            "trending_refresh_seconds", "Time spent recomputing trending scores."
+        )
+
+    async def run_once(self) -> int:
+        """Recompute scores in bulk (skipped if another worker is on it)."""
+        async with try_advisory_lock("parranda.trending_scores") as acquired:
+            if not acquired:
+                return 0
+            start = time.perf_counter()
+            try:
+                async with AsyncSessionLocal() as db:
+                    return await RecipeRepository(db).refresh_trending_scores(
+                        self.half_life_hours, self.window_days
+                    )
+            finally:
+                self._duration.observe(time.perf_counter() - start)
+
+
+# Global updater
+trending_updater = TrendingScoreUpdater(
+    settings.trending_refresh_interval_seconds,
+    settings.trending_half_life_hours,
+    settings.trending_window_days,
+)
@@ -0,0 +1,13 @@
+"""Request rate limiting."""
+
+from .backends import InMemoryRateLimitBackend, RateLimitBackend, RedisRateLimitBackend
+from .limiter import RateLimiter, RateLimitRule, rate_limiter
+
+__all__ = [
+    "RateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "RedisRateLimitBackend",
+    "RateLimiter",
+    "RateLimitRule",
+    "rate_limiter",
+]
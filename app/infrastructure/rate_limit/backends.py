@@ -0,0 +1,88 @@
+"""Token bucket storage backends."""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class RateLimitBackend(ABC):
+    """Token bucket store shared by the rate limiter."""
+
+    @abstractmethod
+    async def acquire(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """Take one token from the bucket.
+
+        Returns 0 when the request is allowed, otherwise the seconds until a
+        token becomes available.
+        """
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets (each worker enforces its own limit)."""
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def acquire(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """Take one token from the in-process bucket."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / refill_per_second
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+# Refill and take atomically on the Redis server, using its clock
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets shared by every worker through Redis (needs ``redis``)."""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires redis") from exc
+
+        self.prefix = prefix
+        self._client = Redis.from_url(url)
+        self._script = self._client.register_script(_TOKEN_BUCKET_LUA)
+
+    async def acquire(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """Take one token from the shared bucket."""
+        wait = await self._script(
+            keys=[self.prefix + key], args=[capacity, refill_per_second]
+        )
+        return float(wait)
@@ -0,0 +1,77 @@
+"""Token bucket rate limiter."""
+
+import logging
+from dataclasses import dataclass
+
+from ..config.settings import settings
+from ..metrics import registry
+from .backends import InMemoryRateLimitBackend, RateLimitBackend, RedisRateLimitBackend
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Bucket of ``capacity`` requests refilled evenly over ``period`` seconds."""
+
+    name: str
+    capacity: int
+    period: int
+
+    @property
+    def refill_per_second(self) -> float:
+        """Tokens added back per second."""
+        return self.capacity / self.period
+
+    @classmethod
+    def parse(cls, name: str, rate: str) -> "RateLimitRule":
+        """Parse a rate such as ``"10/minute"``."""
+        count, _, period = rate.partition("/")
+        try:
+            return cls(name, int(count), PERIODS[period.strip().lower()])
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid rate limit for {name}: {rate!r}")
+
+
+class RateLimiter:
+    """Check requests against token buckets in a pluggable backend."""
+
+    def __init__(self, backend: RateLimitBackend):
+        self.backend = backend
+        self._rejected = registry.counter(
+            "rate_limit_rejected_total", "Requests rejected by the rate limiter."
+        )
+        self._errors = registry.counter(
+            "rate_limit_backend_errors_total",
+            "Rate limit checks skipped because the backend failed.",
+        )
+
+    async def check(self, rule: RateLimitRule, identity: str) -> float:
+        """Return 0 if allowed, else seconds to wait (fails open on errors)."""
+        try:
+            wait = await self.backend.acquire(
+                f"{rule.name}:{identity}", rule.capacity, rule.refill_per_second
+            )
+        except Exception as exc:
+            self._errors.inc()
+            logger.error(f"Rate limit backend failed: {exc}")
+            return 0.0
+        if wait > 0:
+            self._rejected.inc()
+        return wait
+
+
+def build_backend() -> RateLimitBackend:
+    """Build the backend selected in settings."""
+    backend = settings.rate_limit_backend.lower()
+    if backend == "memory":
+        return InMemoryRateLimitBackend()
+    if backend == "redis":
+        return RedisRateLimitBackend(settings.rate_limit_redis_url)
+    raise ValueError(f"Unsupported rate limit backend: {backend}")
+
+
+# Global limiter
+rate_limiter = RateLimiter(build_backend())
@@ -1,22 +1,26 @@
 """JWT token service for authentication."""
 
+import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
+from ..cache.token_cache import TokenCache, token_cache
 from ..config.settings import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def token_digest(token: str) -> str:
+    """Return the SHA-256 hex digest stored in place of a raw token."""
+    return hashlib.sha256(token.encode()).hexdigest()
 
 
 class JWTTokenService:
     """Service for JWT token operations."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[TokenCache] = token_cache):
+        self.cache = cache
         self.secret_key = settings.jwt_secret
         self.algorithm = settings.jwt_algorithm
         self.expire_minutes = settings.jwt_expire_minutes
@@ -41,7 +45,10 @@ class JWTTokenService:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + timedelta(days=self.refresh_expire_days)
 
-        to_encode.update({"exp": expire, "type": "refresh"})
+        # jti keeps tokens unique so their digests can be indexed
+        to_encode.update(
+            {"exp": expire, "type": "refresh", "jti": secrets.token_urlsafe(16)}
+        )
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
 
@@ -53,13 +60,20 @@ class JWTTokenService:
 
     def verify_token(self, token: str, token_type: str = "access") -> Optional[dict]:
         """Verify JWT token and return payload."""
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            if payload.get("type") != token_type:
+        digest = token_digest(token) if self.cache else None
+        payload = self.cache.get(digest) if digest else None
+        if payload is None:
+            try:
+                payload = jwt.decode(
+                    token, self.secret_key, algorithms=[self.algorithm]
+                )
+            except JWTError:
                 return None
-            return payload
-        except JWTError:
+            if digest:
+                self.cache.set(digest, payload)
+        if payload.get("type") != token_type:
             return None
+        return payload
 
     def verify_access_token(self, token: str) -> Optional[dict]:
         """Verify access token specifically."""
@@ -69,17 +83,9 @@ class JWTTokenService:
         """Verify refresh token specifically."""
         return self.verify_token(token, "refresh")
 
-    def hash_password(self, password: str) -> str:
-        """Hash password using bcrypt."""
-        return pwd_context.hash(password)
-
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify password against hash."""
-        return pwd_context.verify(plain_password, hashed_password)
-
-    def generate_session_token(self) -> str:
-        """Generate a secure session token."""
-        return secrets.token_urlsafe(32)
+    def refresh_expires_at(self) -> datetime:
+        """Get the expiry for a refresh token issued now."""
+        return datetime.now(timezone.utc) + timedelta(days=self.refresh_expire_days)
 
 
 # Global instance
@@ -0,0 +1,39 @@
+"""Password hashing context shared by the API and scripts."""
+
+from passlib.context import CryptContext
+from passlib.hash import argon2
+
+from ..config.settings import settings
+
+SUPPORTED_SCHEMES = ("argon2", "bcrypt")
+
+
+def build_password_context() -> CryptContext:
+    """Build the CryptContext from settings.
+
+    The configured scheme is used for new hashes; every supported scheme stays
+    verifiable, and hashes with other schemes or parameters are flagged for
+    rehashing so cost changes roll out as users log in.
+    """
+    scheme = settings.password_hash_scheme.lower()
+    if scheme not in SUPPORTED_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+    if scheme == "argon2" and not argon2.has_backend():
+        raise RuntimeError("PASSWORD_HASH_SCHEME=argon2 requires argon2-cffi")
+
+    rounds = settings.password_bcrypt_rounds
+    return CryptContext(
+        schemes=[scheme] + [s for s in SUPPORTED_SCHEMES if s != scheme],
+        default=scheme,
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+        argon2__time_cost=settings.password_argon2_time_cost,
+        argon2__memory_cost=settings.password_argon2_memory_kib,
+        argon2__parallelism=settings.password_argon2_parallelism,
+    )
+
+
+# Global context
+pwd_context = build_password_context()
@@ -1,16 +1,102 @@
 """Password hasher utility."""
 
-from passlib.context import CryptContext
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.domain.errors import TooManyRequestsError
 
+from ..config.settings import settings
+from ..metrics import registry
+from .password_context import pwd_context
 
-def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    return pwd_context.hash(password)
+T = TypeVar("T")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password against hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+class PasswordHashPool:
+    """Bounded thread pool for CPU-heavy password hashing.
+
+    bcrypt releases the GIL, so hashing on worker threads keeps the event
+    loop responsive. At most ``workers`` operations run at once and at most
+    ``max_queue`` wait; beyond that callers get TooManyRequestsError (429).
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._capacity = workers + max_queue
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        registry.gauge(
+            "password_hash_pending",
+            "Password hash operations running or queued.",
+            lambda: self._pending,
+        )
+        self._queue_wait = registry.histogram(
+            "password_hash_queue_wait_seconds",
+            "Time a password hash operation waited for a worker.",
+        )
+        self._hash_time = registry.histogram(
+            "password_hash_seconds",
+            "Time spent computing a password hash or verification.",
+        )
+        self._rejected = registry.counter(
+            "password_hash_rejected_total",
+            "Password hash operations rejected because the pool was saturated.",
+        )
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """Run func(*args) on the pool, rejecting when saturated."""
+        with self._lock:
+            if self._pending >= self._capacity:
+                self._rejected.inc()
+                raise TooManyRequestsError(
+                    "Servidor ocupado, intenta de nuevo en unos segundos"
+                )
+            self._pending += 1
+
+        submitted = time.perf_counter()
+
+        def job() -> T:
+            started = time.perf_counter()
+            self._queue_wait.observe(started - submitted)
+            try:
+                return func(*args)
+            finally:
+                self._hash_time.observe(time.perf_counter() - started)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, job)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+# Global pool
+hash_pool = PasswordHashPool(
+    settings.password_hash_workers, settings.password_hash_max_queue
+)
+
+
+async def hash_password(password: str) -> str:
+    """Hash password with the configured scheme on the worker pool."""
+    return await hash_pool.run(pwd_context.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash on the worker pool."""
+    return await hash_pool.run(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_and_update(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify password and return a new hash if the stored one is outdated."""
+    return await hash_pool.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
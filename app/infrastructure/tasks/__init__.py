@@ -0,0 +1,5 @@
+"""Background tasks."""
+
+from .periodic import PeriodicTask
+
+__all__ = ["PeriodicTask"]
@@ -0,0 +1,53 @@
+"""Periodic background tasks."""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask(ABC):
+    """Run ``run_once`` every ``interval_seconds`` on the event loop.
+
+    Failures are logged and retried on the next tick; an interval of 0
+    disables the task.
+    """
+
+    name = "periodic task"
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def run_once(self) -> int:
+        """Do one round of work and return how many rows it touched."""
+        pass
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                count = await self.run_once()
+                if count:
+                    logger.info(f"{self.name}: {count} rows")
+            except Exception as exc:
+                logger.error(f"{self.name} failed: {exc}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start the task on the running event loop (no-op if disabled)."""
+        if self.interval_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
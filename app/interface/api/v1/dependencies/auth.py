@@ -1,73 +1,102 @@
 """Authentication dependencies."""
 
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dtos.auth import UserResponse
 from app.application.use_cases.auth.get_current_user import GetCurrentUserUseCase
 from app.domain.errors import NotFoundError, UnauthorizedError
+from app.infrastructure.cache import user_status_cache
 from app.infrastructure.persistence.sqlalchemy.engine import get_db_session
 from app.infrastructure.persistence.sqlalchemy.repositories.user import UserRepository
-from app.infrastructure.security.jwt_token_service import JWTTokenService
+from app.infrastructure.security.jwt_token_service import jwt_service
 
 security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
+def _verify_claims(token: str) -> Optional[Tuple[UUID, dict]]:
+    """Verify an access token and return (user id, claims)."""
+    payload = jwt_service.verify_access_token(token)
+    if payload is None:
+        return None
+
+    try:
+        return UUID(payload["sub"]), payload
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def _is_active(user_id: UUID, db: AsyncSession) -> bool:
+    """Check the user's status, hitting the database only on a cache miss."""
+    is_active = user_status_cache.get(user_id)
+    if is_active is None:
+        is_active = await UserRepository(db).get_active_status(user_id)
+        if is_active is None:
+            return False
+        user_status_cache.set(user_id, is_active)
+    return is_active
+
+
+async def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session),
 ) -> UserResponse:
-    """Get current authenticated user."""
+    """Get current authenticated user (loads the full user row)."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    jwt_service = JWTTokenService()
-    payload = jwt_service.verify_access_token(token.credentials)
-    if payload is None:
-        raise credentials_exception
-
-    user_id: str = payload.get("sub")
-    if user_id is None:
+    claims = _verify_claims(token.credentials)
+    if claims is None:
         raise credentials_exception
+    user_id, _ = claims
 
     try:
         user_repo = UserRepository(db)
         use_case = GetCurrentUserUseCase(user_repo)
-        user = use_case.execute(UUID(user_id))
+        user = await use_case.execute(user_id)
         return user
-    except (UnauthorizedError, NotFoundError):
+    except (UnauthorizedError, NotFoundError, ValueError):
+        raise credentials_exception
+
+
+async def get_current_user_id(
+    token: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db_session),
+) -> UUID:
+    """Get current user id from token claims and the cached account status."""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    claims = _verify_claims(token.credentials)
+    if claims is None or not await _is_active(claims[0], db):
         raise credentials_exception
+    return claims[0]
 
 
-def get_current_user_optional(
+async def get_current_user_optional(
     token: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session),
 ) -> Optional[dict]:
     """Get current user if authenticated, None otherwise."""
     if not token:
         return None
 
-    jwt_service = JWTTokenService()
-    payload = jwt_service.verify_access_token(token.credentials)
-    if payload is None:
-        return None
-
-    user_id: str = payload.get("sub")
-    if user_id is None:
+    claims = _verify_claims(token.credentials)
+    if claims is None:
         return None
 
-    try:
-        user_repo = UserRepository(db)
-        use_case = GetCurrentUserUseCase(user_repo)
-        user = use_case.execute(UUID(user_id))
-        return {"id": str(user.id), "email": user.email}
-    except (UnauthorizedError, NotFoundError):
+    user_id, payload = claims
+    if not await _is_active(user_id, db):
         return None
+    return {"id": str(user_id), "email": payload.get("email")}
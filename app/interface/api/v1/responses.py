@@ -0,0 +1,46 @@
+"""Pre-rendered JSON responses with ETag revalidation."""
+
+import hashlib
+from dataclasses import dataclass
+
+from fastapi import Request, Response, status
+
+from app.application.dtos.response import APIResponse
+
+
+@dataclass(frozen=True)
+class RenderedResponse:
+    """JSON body serialized once, with its strong content-hash ETag."""
+
+    body: bytes
+    etag: str
+
+
+def render_json(payload: APIResponse) -> RenderedResponse:
+    """Serialize an API response to bytes and compute its ETag."""
+    body = payload.model_dump_json().encode()
+    return RenderedResponse(body=body, etag=f'"{hashlib.sha256(body).hexdigest()}"')
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether If-None-Match lists the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def rendered_response(
+    request: Request, rendered: RenderedResponse, max_age: int
+) -> Response:
+    """Build a 200 with the pre-rendered body, or a 304 if the client is fresh."""
+    headers = {
+        "ETag": rendered.etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if etag_matches(request, rendered.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=rendered.body, media_type="application/json", headers=headers
+    )
@@ -4,9 +4,8 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.application.dtos.auth import UserResponse
 from app.application.dtos.games import (
     AnoViejoListResponse,
     AnoViejoResponse,
@@ -33,17 +32,21 @@ from app.infrastructure.persistence.sqlalchemy.repositories.game import (
     AnoViejoRepository,
     GameStatsRepository,
 )
-from app.interface.api.v1.dependencies.auth import get_current_user, get_current_user_optional
+from app.interface.api.v1.dependencies.auth import get_current_user_id
 
 router = APIRouter(prefix="/games", tags=["Games"])
 
 
-def get_game_stats_repo(db: Session = Depends(get_db_session)) -> GameStatsRepository:
+def get_game_stats_repo(
+    db: AsyncSession = Depends(get_db_session),
+) -> GameStatsRepository:
     """Get game stats repository dependency."""
     return GameStatsRepository(db)
 
 
-def get_ano_viejo_repo(db: Session = Depends(get_db_session)) -> AnoViejoRepository:
+def get_ano_viejo_repo(
+    db: AsyncSession = Depends(get_db_session),
+) -> AnoViejoRepository:
     """Get año viejo repository dependency."""
     return AnoViejoRepository(db)
 
@@ -53,12 +56,12 @@ def get_ano_viejo_repo(db: Session = Depends(get_db_session)) -> AnoViejoReposit
 
 @router.get("/stats", response_model=APIResponse)
 async def get_my_game_stats(
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: GameStatsRepository = Depends(get_game_stats_repo),
 ):
     """Get all game stats for current user."""
     use_case = GetGameStatsUseCase(repo)
-    result = use_case.execute(UUID(current_user.id))
+    result = await use_case.execute(user_id)
     return APIResponse(
         success=True,
         message="Game stats retrieved successfully",
@@ -69,12 +72,12 @@ async def get_my_game_stats(
 @router.get("/stats/{game_type}", response_model=APIResponse)
 async def get_game_stats_by_type(
     game_type: str,
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: GameStatsRepository = Depends(get_game_stats_repo),
 ):
     """Get stats for a specific game type."""
     use_case = GetGameStatsUseCase(repo)
-    result = use_case.execute_by_game(UUID(current_user.id), game_type)
+    result = await use_case.execute_by_game(user_id, game_type)
     return APIResponse(
         success=True,
         message=f"Stats for {game_type} retrieved successfully",
@@ -85,12 +88,12 @@ async def get_game_stats_by_type(
 @router.post("/stats", response_model=APIResponse)
 async def update_game_stats(
     request: UpdateGameStatsRequest,
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: GameStatsRepository = Depends(get_game_stats_repo),
 ):
     """Update game stats after playing a game."""
     use_case = UpdateGameStatsUseCase(repo)
-    result = use_case.execute(UUID(current_user.id), request)
+    result = await use_case.execute(user_id, request)
     return APIResponse(
         success=True,
         message="Game stats updated successfully",
@@ -106,16 +109,22 @@ async def list_ano_viejo(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
     include_burned: bool = Query(True, description="Include burned configs"),
-    current_user: UserResponse = Depends(get_current_user),
+    after: Optional[str] = Query(None, description="Cursor from a previous page"),
+    include_total: Optional[bool] = Query(
+        None, description="Count total matches (default: only without cursor)"
+    ),
+    user_id: UUID = Depends(get_current_user_id),
     repo: AnoViejoRepository = Depends(get_ano_viejo_repo),
 ):
     """List all Año Viejo configs for current user."""
     use_case = ListAnoViejoUseCase(repo)
-    result = use_case.execute(
-        user_id=UUID(current_user.id),
+    result = await use_case.execute(
+        user_id=user_id,
         page=page,
         page_size=page_size,
         include_burned=include_burned,
+        after=after,
+        include_total=include_total if include_total is not None else not after,
     )
     return APIResponse(
         success=True,
@@ -132,7 +141,7 @@ async def get_ano_viejo(
     """Get an Año Viejo by ID."""
     use_case = GetAnoViejoUseCase(repo)
     try:
-        result = use_case.execute(config_id)
+        result = await use_case.execute(config_id)
         return APIResponse(
             success=True,
             message="Año Viejo retrieved successfully",
@@ -148,12 +157,12 @@ async def get_ano_viejo(
 @router.post("/ano-viejo", response_model=APIResponse, status_code=status.HTTP_201_CREATED)
 async def create_ano_viejo(
     request: CreateAnoViejoRequest,
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: AnoViejoRepository = Depends(get_ano_viejo_repo),
 ):
     """Create a new Año Viejo configuration."""
     use_case = CreateAnoViejoUseCase(repo)
-    result = use_case.execute(UUID(current_user.id), request)
+    result = await use_case.execute(user_id, request)
     return APIResponse(
         success=True,
         message="Año Viejo created successfully",
@@ -165,13 +174,13 @@ async def create_ano_viejo(
 async def update_ano_viejo(
     config_id: UUID,
     request: UpdateAnoViejoRequest,
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: AnoViejoRepository = Depends(get_ano_viejo_repo),
 ):
     """Update an Año Viejo configuration."""
     use_case = UpdateAnoViejoUseCase(repo)
     try:
-        result = use_case.execute(config_id, UUID(current_user.id), request)
+        result = await use_case.execute(config_id, user_id, request)
         return APIResponse(
             success=True,
             message="Año Viejo updated successfully",
@@ -197,13 +206,13 @@ async def update_ano_viejo(
 @router.post("/ano-viejo/{config_id}/burn", response_model=APIResponse)
 async def burn_ano_viejo(
     config_id: UUID,
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: AnoViejoRepository = Depends(get_ano_viejo_repo),
 ):
     """Burn an Año Viejo! 🔥"""
     use_case = BurnAnoViejoUseCase(repo)
     try:
-        result = use_case.execute(config_id, UUID(current_user.id))
+        result = await use_case.execute(config_id, user_id)
         return APIResponse(
             success=True,
             message="¡Año Viejo quemado exitosamente! 🔥 ¡Feliz Año Nuevo!",
@@ -229,13 +238,13 @@ async def burn_ano_viejo(
 @router.delete("/ano-viejo/{config_id}", response_model=APIResponse)
 async def delete_ano_viejo(
     config_id: UUID,
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: AnoViejoRepository = Depends(get_ano_viejo_repo),
 ):
     """Delete an Año Viejo."""
     use_case = DeleteAnoViejoUseCase(repo)
     try:
-        use_case.execute(config_id, UUID(current_user.id))
+        await use_case.execute(config_id, user_id)
         return APIResponse(
             success=True,
             message="Año Viejo deleted successfully",
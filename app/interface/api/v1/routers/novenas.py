@@ -2,10 +2,9 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.application.dtos.auth import UserResponse
 from app.application.dtos.novenas import (
     MarkDayCompleteRequest,
 )
@@ -17,39 +16,63 @@ from app.application.use_cases.novenas import (
     MarkDayCompleteUseCase,
     NovenaDayNotFoundError,
 )
-from app.infrastructure.persistence.sqlalchemy.engine import get_db_session
+from app.infrastructure.cache import novena_cache
+from app.infrastructure.config.settings import settings
+from app.infrastructure.persistence.sqlalchemy.engine import (
+    get_db_session,
+    get_lazy_db,
+)
 from app.infrastructure.persistence.sqlalchemy.repositories.novena import (
     NovenaRepository,
 )
-from app.interface.api.v1.dependencies.auth import get_current_user
+from app.interface.api.v1.dependencies.auth import get_current_user_id
+from app.interface.api.v1.responses import render_json, rendered_response
 
 router = APIRouter(prefix="/novenas", tags=["Novenas"])
 
 
-def get_novena_repo(db: Session = Depends(get_db_session)) -> NovenaRepository:
+def get_novena_repo(
+    db: AsyncSession = Depends(get_db_session),
+) -> NovenaRepository:
     """Get novena repository dependency."""
     return NovenaRepository(db)
 
 
+def get_novena_content_repo(
+    db: AsyncSession = Depends(get_lazy_db),
+) -> NovenaRepository:
+    """Get novena repository that only connects on a cache miss."""
+    return NovenaRepository(db)
+
+
 @router.get("", response_model=APIResponse)
 async def list_novena_days(
+    request: Request,
     include_sections: bool = Query(False, description="Include sections content"),
-    repo: NovenaRepository = Depends(get_novena_repo),
+    repo: NovenaRepository = Depends(get_novena_content_repo),
 ):
     """List all novena days (1-9)."""
-    use_case = ListNovenaDaysUseCase(repo)
-    result = use_case.execute(include_sections=include_sections)
-    return APIResponse(
-        success=True,
-        message="Novena days retrieved successfully",
-        data=result.model_dump(),
-    )
+
+    async def render():
+        use_case = ListNovenaDaysUseCase(repo)
+        result = await use_case.execute(include_sections=include_sections)
+        return render_json(
+            APIResponse(
+                success=True,
+                message="Novena days retrieved successfully",
+                data=result.model_dump(),
+            )
+        )
+
+    rendered = await novena_cache.get_or_load(("days", include_sections), render)
+    return rendered_response(request, rendered, settings.novena_http_max_age_seconds)
 
 
 @router.get("/{day_number}", response_model=APIResponse)
 async def get_novena_day(
+    request: Request,
     day_number: int,
-    repo: NovenaRepository = Depends(get_novena_repo),
+    repo: NovenaRepository = Depends(get_novena_content_repo),
 ):
     """Get novena day by number (1-9) with all sections."""
     if day_number < 1 or day_number > 9:
@@ -57,30 +80,36 @@ async def get_novena_day(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Day number must be between 1 and 9",
         )
-    
-    use_case = GetNovenaDayUseCase(repo)
-    try:
-        result = use_case.execute_by_number(day_number)
-        return APIResponse(
-            success=True,
-            message=f"Day {day_number} retrieved successfully",
-            data=result.model_dump(),
+
+    async def render():
+        use_case = GetNovenaDayUseCase(repo)
+        result = await use_case.execute_by_number(day_number)
+        return render_json(
+            APIResponse(
+                success=True,
+                message=f"Day {day_number} retrieved successfully",
+                data=result.model_dump(),
+            )
         )
+
+    try:
+        rendered = await novena_cache.get_or_load(("day", day_number), render)
     except NovenaDayNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Day {day_number} not found",
         )
+    return rendered_response(request, rendered, settings.novena_http_max_age_seconds)
 
 
 @router.get("/progress/me", response_model=APIResponse)
 async def get_my_progress(
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: NovenaRepository = Depends(get_novena_repo),
 ):
     """Get current user's novena progress for all days."""
     use_case = GetUserProgressUseCase(repo)
-    result = use_case.execute(UUID(current_user.id))
+    result = await use_case.execute(user_id)
     return APIResponse(
         success=True,
         message="Progress retrieved successfully",
@@ -91,13 +120,13 @@ async def get_my_progress(
 @router.post("/progress/complete", response_model=APIResponse)
 async def mark_day_complete(
     request: MarkDayCompleteRequest,
-    current_user: UserResponse = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     repo: NovenaRepository = Depends(get_novena_repo),
 ):
     """Mark a day as complete for current user."""
     use_case = MarkDayCompleteUseCase(repo)
     try:
-        result = use_case.execute(UUID(current_user.id), request.day_number)
+        result = await use_case.execute(user_id, request.day_number)
         return APIResponse(
             success=True,
             message=f"Day {request.day_number} marked as complete! 🎉",
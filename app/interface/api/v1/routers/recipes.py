@@ -3,25 +3,35 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dtos.recipes import (
+    BatchFavoritesRequest,
+    BatchFavoritesResponse,
     CreateRecipeRequest,
-    RecipeListResponse,
-    RecipeResponse,
+    RateRecipeRequest,
     UpdateRecipeRequest,
 )
 from app.application.dtos.response import APIResponse
 from app.application.use_cases.recipes import (
+    BulkImportRecipesUseCase,
     CreateRecipeUseCase,
     DeleteRecipeUseCase,
+    ExportRecipesUseCase,
+    GetRecipeFacetsUseCase,
     GetRecipeUseCase,
     ListRecipesUseCase,
+    RateRecipeUseCase,
     UpdateRecipeUseCase,
 )
 from app.application.use_cases.recipes.get_recipe import RecipeNotFoundError
-from app.infrastructure.persistence.sqlalchemy.engine import get_db_session
+from app.infrastructure.config.settings import settings
+from app.infrastructure.persistence.sqlalchemy.engine import (
+    AsyncSessionLocal,
+    get_db_session,
+)
 from app.infrastructure.persistence.sqlalchemy.repositories.recipe import (
     RecipeRepository,
 )
@@ -29,12 +39,31 @@ from app.interface.api.v1.dependencies.auth import get_current_user_optional
 
 router = APIRouter(prefix="/recipes", tags=["Recipes"])
 
+# Upper bound on ids per favorites membership check
+MAX_FAVORITE_CHECK_IDS = 100
+
 
-def get_recipe_repository(db: Session = Depends(get_db_session)) -> RecipeRepository:
+def get_recipe_repository(
+    db: AsyncSession = Depends(get_db_session),
+) -> RecipeRepository:
     """Get recipe repository dependency."""
     return RecipeRepository(db)
 
 
+def include_steps(
+    include: Optional[str] = Query(
+        None, description="Set to 'steps' to embed each recipe's steps"
+    ),
+) -> bool:
+    """Parse the opt-in ``include`` list parameter (lists omit steps by default)."""
+    return "steps" in (include or "").split(",")
+
+
+def viewer_id(current_user: Optional[dict]) -> Optional[UUID]:
+    """ID of the authenticated user, used to flag their favorites in lists."""
+    return UUID(current_user["id"]) if current_user else None
+
+
 # === LIST RECIPES ===
 
 
@@ -43,19 +72,37 @@ async def list_recipes(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
     category: Optional[str] = Query(None, description="Filter by category"),
-    search: Optional[str] = Query(None, description="Search in title/author"),
+    search: Optional[str] = Query(None, description="Full-text search (ranked)"),
     tags: Optional[List[str]] = Query(None, description="Filter by tags"),
+    after: Optional[str] = Query(
+        None, description="Cursor from a previous page (recent order, no search)"
+    ),
+    include_total: Optional[bool] = Query(
+        None, description="Count total matches (default: only without cursor)"
+    ),
+    sort: str = Query(
+        "recent",
+        pattern="^(recent|best_rated|popular|trending)$",
+        description="Sort order",
+    ),
+    with_steps: bool = Depends(include_steps),
+    current_user: Optional[dict] = Depends(get_current_user_optional),
     repo: RecipeRepository = Depends(get_recipe_repository),
 ):
     """List all published recipes with pagination and filters."""
     use_case = ListRecipesUseCase(repo)
-    result = use_case.execute(
+    result = await use_case.execute(
         page=page,
         page_size=page_size,
         category=category,
         is_published=True,
         search=search,
         tags=tags,
+        after=after,
+        include_total=include_total if include_total is not None else not after,
+        include_steps=with_steps,
+        sort=sort,
+        viewer_id=viewer_id(current_user),
     )
     return APIResponse(
         success=True,
@@ -69,16 +116,34 @@ async def list_community_recipes(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
     category: Optional[str] = Query(None),
-    search: Optional[str] = Query(None, description="Search in title"),
+    search: Optional[str] = Query(None, description="Full-text search (ranked)"),
+    after: Optional[str] = Query(
+        None, description="Cursor from a previous page (recent order, no search)"
+    ),
+    include_total: Optional[bool] = Query(
+        None, description="Count total matches (default: only without cursor)"
+    ),
+    sort: str = Query(
+        "recent",
+        pattern="^(recent|best_rated|popular|trending)$",
+        description="Sort order",
+    ),
+    with_steps: bool = Depends(include_steps),
+    current_user: Optional[dict] = Depends(get_current_user_optional),
     repo: RecipeRepository = Depends(get_recipe_repository),
 ):
     """List community recipes."""
     use_case = ListRecipesUseCase(repo)
-    result = use_case.execute_community(
+    result = await use_case.execute_community(
         page=page,
         page_size=page_size,
         category=category,
         search=search,
+        after=after,
+        include_total=include_total if include_total is not None else not after,
+        include_steps=with_steps,
+        sort=sort,
+        viewer_id=viewer_id(current_user),
     )
     return APIResponse(
         success=True,
@@ -92,7 +157,8 @@ async def list_my_recipes(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
     category: Optional[str] = Query(None),
-    search: Optional[str] = Query(None, description="Search in title"),
+    search: Optional[str] = Query(None, description="Full-text search (ranked)"),
+    with_steps: bool = Depends(include_steps),
     current_user: Optional[dict] = Depends(get_current_user_optional),
     repo: RecipeRepository = Depends(get_recipe_repository),
 ):
@@ -104,12 +170,13 @@ async def list_my_recipes(
         )
 
     use_case = ListRecipesUseCase(repo)
-    result = use_case.execute_my_recipes(
+    result = await use_case.execute_my_recipes(
         user_id=UUID(current_user["id"]),
         page=page,
         page_size=page_size,
         category=category,
         search=search,
+        include_steps=with_steps,
     )
     return APIResponse(
         success=True,
@@ -118,6 +185,113 @@ async def list_my_recipes(
     )
 
 
+@router.get("/by-ingredients", response_model=APIResponse)
+async def list_recipes_by_ingredients(
+    ingredients: List[str] = Query(..., description="Ingredients you have"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=50),
+    current_user: Optional[dict] = Depends(get_current_user_optional),
+    repo: RecipeRepository = Depends(get_recipe_repository),
+):
+    """List published recipes ranked by coverage of the given ingredients.
+
+    Names are compared normalized (case, accents, plurals), and a bare noun
+    also matches qualified ingredients: "leche" finds "Leche fría".
+    """
+    use_case = ListRecipesUseCase(repo)
+    result = await use_case.execute_by_ingredients(
+        ingredients=ingredients,
+        page=page,
+        page_size=page_size,
+        viewer_id=viewer_id(current_user),
+    )
+    return APIResponse(
+        success=True,
+        message="Recipes matching your ingredients retrieved successfully",
+        data=result.model_dump(),
+    )
+
+
+@router.get("/facets", response_model=APIResponse)
+async def get_recipe_facets(
+    category: Optional[str] = Query(None, description="Scope tag counts to a category"),
+    repo: RecipeRepository = Depends(get_recipe_repository),
+):
+    """Get published recipe counts per category and per tag."""
+    use_case = GetRecipeFacetsUseCase(repo)
+    result = await use_case.execute(category=category or None)
+    return APIResponse(
+        success=True,
+        message="Recipe facets retrieved successfully",
+        data=result.model_dump(),
+    )
+
+
+# === BULK IMPORT / EXPORT ===
+
+
+@router.post("/bulk", response_model=APIResponse)
+async def bulk_import_recipes(
+    request: Request,
+    current_user: Optional[dict] = Depends(get_current_user_optional),
+    repo: RecipeRepository = Depends(get_recipe_repository),
+):
+    """Import draft recipes from a streamed NDJSON body (one recipe per line)."""
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+        )
+
+    use_case = BulkImportRecipesUseCase(
+        repo,
+        batch_size=settings.recipe_bulk_batch_size,
+        max_line_bytes=settings.recipe_bulk_max_line_bytes,
+        max_lines=settings.recipe_bulk_max_lines,
+    )
+    result = await use_case.execute(request.stream(), user_id=UUID(current_user["id"]))
+    return APIResponse(
+        success=result.failed == 0,
+        message=f"Imported {result.imported} recipes, {result.failed} failed",
+        data=result.model_dump(),
+    )
+
+
+async def _export_lines():
+    """NDJSON export lines read through a session owned by the stream.
+
+    Yield dependencies may be torn down before a streamed body is sent, so
+    the export cannot iterate the request's session.
+    """
+    async with AsyncSessionLocal() as db:
+        use_case = ExportRecipesUseCase(RecipeRepository(db))
+        async for line in use_case.execute(
+            fetch_size=settings.recipe_export_fetch_size
+        ):
+            yield line
+
+
+@router.get("/export")
+async def export_recipes(
+    current_user: Optional[dict] = Depends(get_current_user_optional),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Stream all published recipes as NDJSON (importable via /bulk)."""
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+        )
+
+    # Return the request's connection now; the stream checks out its own
+    await db.close()
+    return StreamingResponse(
+        _export_lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="recipes.ndjson"'},
+    )
+
+
 # === GET RECIPE ===
 
 
@@ -129,7 +303,7 @@ async def get_recipe(
     """Get recipe by ID."""
     use_case = GetRecipeUseCase(repo)
     try:
-        result = use_case.execute(recipe_id)
+        result = await use_case.execute(recipe_id)
         return APIResponse(
             success=True,
             message="Recipe retrieved successfully",
@@ -154,7 +328,7 @@ async def create_recipe(
     """Create a new recipe."""
     use_case = CreateRecipeUseCase(repo)
     user_id = UUID(current_user["id"]) if current_user else None
-    result = use_case.execute(request, user_id)
+    result = await use_case.execute(request, user_id)
     return APIResponse(
         success=True,
         message="Recipe created successfully",
@@ -177,7 +351,7 @@ async def update_recipe(
     user_id = UUID(current_user["id"]) if current_user else None
 
     try:
-        result = use_case.execute(recipe_id, request, user_id)
+        result = await use_case.execute(recipe_id, request, user_id)
         return APIResponse(
             success=True,
             message="Recipe updated successfully",
@@ -209,7 +383,7 @@ async def delete_recipe(
     user_id = UUID(current_user["id"]) if current_user else None
 
     try:
-        use_case.execute(recipe_id, user_id)
+        await use_case.execute(recipe_id, user_id)
         return APIResponse(
             success=True,
             message="Recipe deleted successfully",
@@ -227,6 +401,66 @@ async def delete_recipe(
         )
 
 
+# === RATINGS ===
+
+
+@router.put("/{recipe_id}/rating", response_model=APIResponse)
+async def rate_recipe(
+    recipe_id: UUID,
+    request: RateRecipeRequest,
+    current_user: Optional[dict] = Depends(get_current_user_optional),
+    repo: RecipeRepository = Depends(get_recipe_repository),
+):
+    """Rate a recipe (1-5); rating again replaces the previous vote."""
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+        )
+
+    use_case = RateRecipeUseCase(repo)
+    try:
+        result = await use_case.execute(recipe_id, UUID(current_user["id"]), request)
+    except RecipeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Recipe with ID {recipe_id} not found",
+        )
+    return APIResponse(
+        success=True,
+        message="Recipe rated successfully",
+        data=result.model_dump(),
+    )
+
+
+@router.delete("/{recipe_id}/rating", response_model=APIResponse)
+async def remove_rating(
+    recipe_id: UUID,
+    current_user: Optional[dict] = Depends(get_current_user_optional),
+    repo: RecipeRepository = Depends(get_recipe_repository),
+):
+    """Remove the current user's rating of a recipe."""
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+        )
+
+    use_case = RateRecipeUseCase(repo)
+    try:
+        result = await use_case.execute_remove(recipe_id, UUID(current_user["id"]))
+    except RecipeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Recipe with ID {recipe_id} not found",
+        )
+    return APIResponse(
+        success=True,
+        message="Recipe rating removed",
+        data=result.model_dump(),
+    )
+
+
 # === FAVORITES ===
 
 
@@ -235,7 +469,8 @@ async def list_my_favorites(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
     category: Optional[str] = Query(None),
-    search: Optional[str] = Query(None, description="Search in title"),
+    search: Optional[str] = Query(None, description="Full-text search (ranked)"),
+    with_steps: bool = Depends(include_steps),
     current_user: Optional[dict] = Depends(get_current_user_optional),
     repo: RecipeRepository = Depends(get_recipe_repository),
 ):
@@ -246,41 +481,14 @@ async def list_my_favorites(
             detail="Authentication required",
         )
 
-    recipes, total = repo.get_user_favorites(
+    use_case = ListRecipesUseCase(repo)
+    result = await use_case.execute_favorites(
         user_id=UUID(current_user["id"]),
         page=page,
         page_size=page_size,
         category=category,
         search=search,
-    )
-
-    recipe_responses = [
-        RecipeResponse(
-            id=str(r.recipe_id),
-            title=r.title,
-            author_user_id=str(r.author_user_id) if r.author_user_id else None,
-            author_alias=r.author_alias,
-            photo_url=r.photo_url,
-            prep_time_minutes=r.prep_time_minutes,
-            yield_amount=r.yield_amount,
-            category=r.category,
-            rating=float(r.rating) if r.rating else None,
-            tags=r.tags,
-            is_published=r.is_published,
-            is_community=r.is_community,
-            steps=[],
-            created_at=r.created_at,
-            updated_at=r.updated_at,
-        )
-        for r in recipes
-    ]
-
-    result = RecipeListResponse(
-        items=recipe_responses,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
+        include_steps=with_steps,
     )
 
     return APIResponse(
@@ -302,7 +510,7 @@ async def get_my_favorite_ids(
             detail="Authentication required",
         )
 
-    favorite_ids = repo.get_user_favorite_ids(UUID(current_user["id"]))
+    favorite_ids = await repo.get_user_favorite_ids(UUID(current_user["id"]))
 
     return APIResponse(
         success=True,
@@ -311,6 +519,66 @@ async def get_my_favorite_ids(
     )
 
 
+@router.get("/favorites/check", response_model=APIResponse)
+async def check_favorites(
+    ids: List[UUID] = Query(..., description="Recipe IDs to check"),
+    current_user: Optional[dict] = Depends(get_current_user_optional),
+    repo: RecipeRepository = Depends(get_recipe_repository),
+):
+    """Return which of the given recipes the current user has favorited."""
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+        )
+    if len(ids) > MAX_FAVORITE_CHECK_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {MAX_FAVORITE_CHECK_IDS} ids can be checked at once",
+        )
+
+    favorite_ids = await repo.get_favorite_membership(UUID(current_user["id"]), ids)
+
+    return APIResponse(
+        success=True,
+        message="Favorite membership retrieved successfully",
+        data={"favorite_ids": [str(fid) for fid in favorite_ids]},
+    )
+
+
+@router.post("/favorites/batch", response_model=APIResponse)
+async def batch_favorites(
+    request: BatchFavoritesRequest,
+    current_user: Optional[dict] = Depends(get_current_user_optional),
+    repo: RecipeRepository = Depends(get_recipe_repository),
+):
+    """Apply many favorite add/remove operations in one transaction."""
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+        )
+
+    # Collapse to the final state per recipe (offline clients replay toggles)
+    final_state = {op.recipe_id: op.favorite for op in request.operations}
+    added, removed, missing = await repo.apply_favorites(
+        UUID(current_user["id"]),
+        add=[rid for rid, favorite in final_state.items() if favorite],
+        remove=[rid for rid, favorite in final_state.items() if not favorite],
+    )
+
+    result = BatchFavoritesResponse(
+        added=[str(rid) for rid in added],
+        removed=[str(rid) for rid in removed],
+        not_found=[str(rid) for rid in missing],
+    )
+    return APIResponse(
+        success=True,
+        message="Favorites updated successfully",
+        data=result.model_dump(),
+    )
+
+
 @router.post("/{recipe_id}/favorite", response_model=APIResponse)
 async def add_favorite(
     recipe_id: UUID,
@@ -324,13 +592,13 @@ async def add_favorite(
             detail="Authentication required",
         )
 
-    if not repo.exists(recipe_id):
+    if not await repo.exists(recipe_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recipe with ID {recipe_id} not found",
         )
 
-    added = repo.add_favorite(UUID(current_user["id"]), recipe_id)
+    added = await repo.add_favorite(UUID(current_user["id"]), recipe_id)
 
     return APIResponse(
         success=True,
@@ -352,7 +620,7 @@ async def remove_favorite(
             detail="Authentication required",
         )
 
-    removed = repo.remove_favorite(UUID(current_user["id"]), recipe_id)
+    removed = await repo.remove_favorite(UUID(current_user["id"]), recipe_id)
 
     return APIResponse(
         success=True,
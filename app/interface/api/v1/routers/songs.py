@@ -4,7 +4,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dtos.response import APIResponse
 from app.application.dtos.songs import (
@@ -27,7 +27,9 @@ from app.infrastructure.persistence.sqlalchemy.repositories.song import SongRepo
 router = APIRouter(prefix="/songs", tags=["Songs"])
 
 
-def get_song_repository(db: Session = Depends(get_db_session)) -> SongRepository:
+def get_song_repository(
+    db: AsyncSession = Depends(get_db_session),
+) -> SongRepository:
     """Get song repository dependency."""
     return SongRepository(db)
 
@@ -42,16 +44,26 @@ async def list_songs(
     genre: Optional[str] = Query(None, description="Filter by genre"),
     is_christmas: Optional[bool] = Query(None, description="Filter Christmas songs"),
     search: Optional[str] = Query(None, description="Search in title/artist"),
+    fuzzy: bool = Query(False, description="Typo-tolerant search"),
+    after: Optional[str] = Query(
+        None, description="Cursor from a previous page (not with search)"
+    ),
+    include_total: Optional[bool] = Query(
+        None, description="Count total matches (default: only without cursor)"
+    ),
     repo: SongRepository = Depends(get_song_repository),
 ):
     """List all songs with pagination and filters."""
     use_case = ListSongsUseCase(repo)
-    result = use_case.execute(
+    result = await use_case.execute(
         page=page,
         page_size=page_size,
         genre=genre,
         is_christmas=is_christmas,
         search=search,
+        fuzzy=fuzzy,
+        after=after,
+        include_total=include_total if include_total is not None else not after,
     )
     return APIResponse(
         success=True,
@@ -71,7 +83,7 @@ async def get_song(
     """Get song by ID."""
     use_case = GetSongUseCase(repo)
     try:
-        result = use_case.execute(song_id)
+        result = await use_case.execute(song_id)
         return APIResponse(
             success=True,
             message="Song retrieved successfully",
@@ -92,7 +104,7 @@ async def get_song_by_youtube_id(
     """Get song by YouTube ID."""
     use_case = GetSongUseCase(repo)
     try:
-        result = use_case.execute_by_youtube_id(youtube_id)
+        result = await use_case.execute_by_youtube_id(youtube_id)
         return APIResponse(
             success=True,
             message="Song retrieved successfully",
@@ -115,7 +127,7 @@ async def create_song(
 ):
     """Create a new song."""
     use_case = CreateSongUseCase(repo)
-    result = use_case.execute(request)
+    result = await use_case.execute(request)
     return APIResponse(
         success=True,
         message="Song created successfully",
@@ -135,7 +147,7 @@ async def update_song(
     """Update an existing song."""
     use_case = UpdateSongUseCase(repo)
     try:
-        result = use_case.execute(song_id, request)
+        result = await use_case.execute(song_id, request)
         return APIResponse(
             success=True,
             message="Song updated successfully",
@@ -159,7 +171,7 @@ async def delete_song(
     """Delete a song."""
     use_case = DeleteSongUseCase(repo)
     try:
-        use_case.execute(song_id)
+        await use_case.execute(song_id)
         return APIResponse(
             success=True,
             message="Song deleted successfully",
@@ -1,27 +1,36 @@
 """Main FastAPI application."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.domain.errors import (
     ConflictError,
     NotFoundError,
+    TooManyRequestsError,
     UnauthorizedError,
     ValidationError,
 )
 from app.infrastructure.config.settings import settings
+from app.infrastructure.metrics import registry
+from app.infrastructure.persistence.sqlalchemy.session_reaper import session_reaper
+from app.infrastructure.persistence.sqlalchemy.trending import trending_updater
 from app.interface.middleware.error_handler import (
     conflict_error_handler,
     general_exception_handler,
     http_exception_handler,
     not_found_error_handler,
+    too_many_requests_error_handler,
     unauthorized_error_handler,
     validation_domain_error_handler,
     validation_exception_handler,
 )
 from app.interface.middleware.logging_middleware import logging_middleware
+from app.interface.middleware.rate_limit_middleware import rate_limit_middleware
 
 from .routers.auth import router as auth_router
 from .api.v1.routers.recipes import router as recipes_router
@@ -30,6 +39,17 @@ from .api.v1.routers.games import router as games_router
 from .api.v1.routers.uploads import router as uploads_router
 from .api.v1.routers.novenas import router as novenas_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background tasks."""
+    session_reaper.start()
+    trending_updater.start()
+    yield
+    await trending_updater.stop()
+    await session_reaper.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Parranda Navideña API",
@@ -37,9 +57,11 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
-# Add middleware
+# Add middleware (logging wraps rate limiting, so 429s are logged too)
+app.middleware("http")(rate_limit_middleware)
 app.middleware("http")(logging_middleware)
 
 # Add CORS middleware
@@ -58,6 +80,7 @@ app.add_exception_handler(UnauthorizedError, unauthorized_error_handler)
 app.add_exception_handler(NotFoundError, not_found_error_handler)
 app.add_exception_handler(ConflictError, conflict_error_handler)
 app.add_exception_handler(ValidationError, validation_domain_error_handler)
+app.add_exception_handler(TooManyRequestsError, too_many_requests_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 # Include routers
@@ -83,3 +106,9 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Metrics endpoint (Prometheus text format)."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -5,11 +5,13 @@ from .error_handler import (
     general_exception_handler,
     http_exception_handler,
     not_found_error_handler,
+    too_many_requests_error_handler,
     unauthorized_error_handler,
     validation_domain_error_handler,
     validation_exception_handler,
 )
 from .logging_middleware import logging_middleware
+from .rate_limit_middleware import rate_limit_middleware
 
 __all__ = [
     "http_exception_handler",
@@ -18,6 +20,8 @@ __all__ = [
     "unauthorized_error_handler",
     "not_found_error_handler",
     "conflict_error_handler",
+    "too_many_requests_error_handler",
     "general_exception_handler",
     "logging_middleware",
+    "rate_limit_middleware",
 ]
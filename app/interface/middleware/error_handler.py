@@ -10,6 +10,7 @@ from app.application.dtos.response import ErrorResponse
 from app.domain.errors import (
     ConflictError,
     NotFoundError,
+    TooManyRequestsError,
     UnauthorizedError,
     ValidationError,
 )
@@ -104,6 +105,20 @@ async def validation_domain_error_handler(
     )
 
 
+async def too_many_requests_error_handler(
+    request: Request, exc: TooManyRequestsError
+) -> JSONResponse:
+    """Handle saturation / rate limit errors."""
+    error_message = str(exc) if str(exc) else "Demasiadas solicitudes"
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(exc.retry_after)},
+        content=ErrorResponse(
+            success=False, message=error_message, errors=[error_message]
+        ).dict(),
+    )
+
+
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle general exceptions."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
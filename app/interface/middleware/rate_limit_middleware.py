@@ -0,0 +1,65 @@
+"""Rate limiting middleware."""
+
+import math
+from typing import Dict, List, Tuple
+
+from fastapi import Request
+
+from app.domain.errors import TooManyRequestsError
+from app.infrastructure.config.settings import settings
+from app.infrastructure.rate_limit import RateLimitRule, rate_limiter
+from app.infrastructure.security.jwt_token_service import jwt_service
+
+from .error_handler import too_many_requests_error_handler
+
+_uploads = RateLimitRule.parse("uploads", settings.rate_limit_uploads)
+
+# (method, path) -> bucket rule; routes sharing a rule share a bucket
+RATE_LIMITED_ROUTES: Dict[Tuple[str, str], RateLimitRule] = {
+    ("POST", "/auth/login"): RateLimitRule.parse("login", settings.rate_limit_login),
+    ("POST", "/auth/register"): RateLimitRule.parse(
+        "register", settings.rate_limit_register
+    ),
+    ("POST", "/api/v1/uploads/recipe-image"): _uploads,
+    ("POST", "/api/v1/uploads/avatar"): _uploads,
+    ("POST", "/api/v1/recipes/bulk"): RateLimitRule.parse(
+        "bulk_import", settings.rate_limit_bulk_import
+    ),
+}
+
+
+def _client_identities(request: Request) -> List[str]:
+    """Buckets charged for a request: the caller's IP, plus the user if known."""
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if settings.rate_limit_trust_forwarded_for and forwarded_for:
+        identities = [f"ip:{forwarded_for.split(',')[0].strip()}"]
+    else:
+        identities = [f"ip:{request.client.host if request.client else 'unknown'}"]
+
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = jwt_service.verify_access_token(token)
+        if payload and payload.get("sub"):
+            identities.append(f"user:{payload['sub']}")
+    return identities
+
+
+async def rate_limit_middleware(request: Request, call_next):
+    """Reject requests over their route's token bucket with 429."""
+    rule = RATE_LIMITED_ROUTES.get((request.method, request.url.path))
+    if rule is None or not settings.rate_limit_enabled:
+        return await call_next(request)
+
+    # Rotating tokens must not dodge the IP bucket, nor IPs the user bucket
+    wait = 0.0
+    for identity in _client_identities(request):
+        wait = max(wait, await rate_limiter.check(rule, identity))
+    if wait > 0:
+        return await too_many_requests_error_handler(
+            request,
+            TooManyRequestsError(
+                "Demasiadas solicitudes, intenta de nuevo más tarde",
+                retry_after=math.ceil(wait),
+            ),
+        )
+    return await call_next(request)
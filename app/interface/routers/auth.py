@@ -1,7 +1,7 @@
 """Authentication router."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...application.dtos.auth import (
     LoginRequest,
@@ -20,7 +20,7 @@ from ...infrastructure.persistence.sqlalchemy.repositories.session import (
     SessionRepository,
 )
 from ...infrastructure.persistence.sqlalchemy.repositories.user import UserRepository
-from ...infrastructure.security.jwt_token_service import JWTTokenService
+from ...infrastructure.security.jwt_token_service import jwt_service
 from ...interface.api.v1.dependencies.auth import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -29,12 +29,14 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @router.post(
     "/register", response_model=APIResponse, status_code=status.HTTP_201_CREATED
 )
-async def register(request: RegisterRequest, db: Session = Depends(get_db_session)):
+async def register(
+    request: RegisterRequest, db: AsyncSession = Depends(get_db_session)
+):
     """Register a new user with email and password."""
     user_repository = UserRepository(db)
     use_case = RegisterUserUseCase(user_repository)
     try:
-        user = use_case.execute(request)
+        user = await use_case.execute(request)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,14 +47,13 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db_sessio
 
 
 @router.post("/login", response_model=APIResponse)
-async def login(request: LoginRequest, db: Session = Depends(get_db_session)):
+async def login(request: LoginRequest, db: AsyncSession = Depends(get_db_session)):
     """Login with email and password."""
     user_repository = UserRepository(db)
     session_repository = SessionRepository(db)
-    jwt_service = JWTTokenService()
     use_case = LoginUserUseCase(user_repository, session_repository, jwt_service)
     try:
-        auth_data = use_case.execute(request)
+        auth_data = await use_case.execute(request)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,12 +75,12 @@ async def get_me(current_user: UserResponse = Depends(get_current_user)):
 async def update_me(
     request: UpdateProfileRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session),
 ):
     """Update current user profile."""
     user_repository = UserRepository(db)
     use_case = UpdateProfileUseCase(user_repository)
-    updated_user = use_case.execute(current_user.id, request)
+    updated_user = await use_case.execute(current_user.id, request)
 
     return APIResponse(
         success=True, message="Profile updated successfully", data=updated_user
@@ -88,13 +89,12 @@ async def update_me(
 
 @router.post("/refresh", response_model=APIResponse)
 async def refresh_token(
-    request: RefreshTokenRequest, db: Session = Depends(get_db_session)
+    request: RefreshTokenRequest, db: AsyncSession = Depends(get_db_session)
 ):
     """Refresh access token using refresh token."""
     session_repository = SessionRepository(db)
-    jwt_service = JWTTokenService()
     use_case = RefreshTokenUseCase(jwt_service, session_repository)
-    token_data = use_case.execute(request)
+    token_data = await use_case.execute(request)
 
     return APIResponse(
         success=True, message="Token refreshed successfully", data=token_data
@@ -0,0 +1,118 @@
+"""NDJSON bulk import: line splitting, limits and bad-row isolation."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.application.use_cases.recipes.bulk_recipes import BulkImportRecipesUseCase
+from app.domain.errors import ValidationError
+
+
+async def stream(*chunks):
+    """Async byte stream yielding ``chunks`` as given."""
+    for chunk in chunks:
+        yield chunk
+
+
+def lines(*chunks, max_line_bytes=8):
+    """Numbered lines the import reads from ``chunks``."""
+
+    async def collect():
+        use_case = BulkImportRecipesUseCase(None, max_line_bytes=max_line_bytes)
+        return [entry async for entry in use_case._lines(stream(*chunks))]
+
+    return asyncio.run(collect())
+
+
+def test_lines_split_across_chunks():
+    """Lines are reassembled whatever the chunk boundaries."""
+    assert lines(b"ab", b"c\nde", b"f\n", b"\ng\n") == [
+        (1, b"abc"),
+        (2, b"def"),
+        (3, b""),
+        (4, b"g"),
+    ]
+
+
+def test_final_line_without_newline():
+    """An unterminated last line is still read, with its own number."""
+    assert lines(b"abc\n", b"de") == [(1, b"abc"), (2, b"de")]
+    assert lines(b"abc\n") == [(1, b"abc")]
+    assert lines() == []
+
+
+def test_oversized_line_is_none():
+    """A complete line over the limit is reported as None, in sequence."""
+    assert lines(b"abc\n123456789\nde\n") == [(1, b"abc"), (2, None), (3, b"de")]
+
+
+def test_overlong_partial_line_is_dropped():
+    """An unfinished line past the limit is not buffered, only flagged."""
+    assert lines(b"abc\n1234", b"56789", b"0\nde\n") == [
+        (1, b"abc"),
+        (2, None),
+        (3, b"de"),
+    ]
+    assert lines(b"abc\n123456789") == [(1, b"abc"), (2, None)]
+
+
+class FakeRecipeRepository:
+    """Stores created recipes; rejects any batch holding a bad title."""
+
+    def __init__(self, bad_title="Rechazada"):
+        self.bad_title = bad_title
+        self.recipes = []
+        self.batches = 0
+
+    async def create_many(self, recipes, ingredients):
+        self.batches += 1
+        if any(recipe.title == self.bad_title for recipe in recipes):
+            raise ValidationError("value out of range")
+        self.recipes.extend(recipes)
+
+
+def run_import(repo, *titles, **options):
+    """Import one minimal recipe per title; returns the response."""
+    body = b"".join(
+        json.dumps({"title": title}).encode() + b"\n" if title else b"{}\n"
+        for title in titles
+    )
+    use_case = BulkImportRecipesUseCase(repo, **options)
+    return asyncio.run(use_case.execute(stream(body)))
+
+
+def test_import_saves_drafts():
+    """Imported recipes are never published directly."""
+    repo = FakeRecipeRepository()
+
+    response = run_import(repo, "Natilla", "Buñuelos")
+
+    assert (response.imported, response.failed) == (2, 0)
+    assert [recipe.is_published for recipe in repo.recipes] == [False, False]
+
+
+def test_invalid_and_rejected_lines_are_reported_alone():
+    """Bad lines are reported by number while the rest of the batch is kept."""
+    repo = FakeRecipeRepository()
+
+    response = run_import(repo, "Natilla", None, "Rechazada", "Buñuelos")
+
+    assert [recipe.title for recipe in repo.recipes] == ["Natilla", "Buñuelos"]
+    assert [(e.line, e.error) for e in response.errors] == [
+        (2, "title: Field required"),
+        (3, "value out of range"),
+    ]
+
+
+@pytest.mark.parametrize("count, imported", [(3, 3), (5, 3)])
+def test_import_stops_after_max_lines(count, imported):
+    """Lines past ``max_lines`` are not read; the cut-off is reported."""
+    repo = FakeRecipeRepository()
+
+    response = run_import(
+        repo, *(f"Receta {i}" for i in range(count)), batch_size=2, max_lines=3
+    )
+
+    assert response.imported == imported
+    assert [e.line for e in response.errors] == ([4] if count > 3 else [])
@@ -0,0 +1,47 @@
+"""Ingredient name normalization for the by-ingredients search."""
+
+import pytest
+
+from app.domain.services.ingredients import (
+    extract_ingredient_names,
+    normalize_ingredient,
+)
+
+
+@pytest.mark.parametrize(
+    "raw, normalized",
+    [
+        ("Leche", "leche"),
+        ("  LECHE  fría ", "leche fria"),
+        ("Azúcar", "azucar"),
+        ("Huevos", "huevo"),
+        ("Limones", "limon"),
+        ("Nueces", "nuez"),
+        ("Clavos de olor", "clavo de olor"),
+        ("Queso costeño", "queso costeño"),
+        ("Piña", "piña"),
+        ("Sal", "sal"),
+        ("Aceite (para freír)", "aceite para freir"),
+    ],
+)
+def test_normalize_ingredient(raw, normalized):
+    """Case, accents (but not ñ), punctuation and plurals are folded away."""
+    assert normalize_ingredient(raw) == normalized
+
+
+@pytest.mark.parametrize("raw", ["", "   ", "--", "()"])
+def test_normalize_ingredient_without_words(raw):
+    """Names with no letters or digits normalize to None."""
+    assert normalize_ingredient(raw) is None
+
+
+def test_extract_ingredient_names():
+    """Step lists yield distinct sorted names from strings and ``name`` keys."""
+    steps = [
+        [{"name": "Leche", "amount": "4 tazas"}, "Panela"],
+        [{"name": "leches"}, {"amount": "sin nombre"}, {"name": 3}, None, "  "],
+        None,
+        [],
+    ]
+
+    assert extract_ingredient_names(steps) == ["leche", "panela"]
@@ -0,0 +1,74 @@
+"""Keyset cursor encoding and the cursor guards."""
+
+import base64
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.domain.errors import ValidationError
+from app.infrastructure.persistence.sqlalchemy.pagination import (
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+    reject_cursor,
+)
+
+
+def _token(raw: bytes) -> str:
+    """Cursor-style (unpadded urlsafe base64) token for arbitrary bytes."""
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    """A decoded cursor gives back the exact position it was built from."""
+    created_at = datetime(2026, 12, 16, 20, 30, 5, 123456, tzinfo=timezone.utc)
+    row_id = uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, row_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor!",
+        _token(b"not json"),
+        _token(b"\xff\xfe"),
+        _token(b"[1, 2]"),
+        _token(b'{"c": "2026-12-16T20:30:05"}'),
+        _token(b'{"c": "yesterday", "i": "%s"}' % str(uuid4()).encode()),
+        _token(b'{"c": "2026-12-16T20:30:05", "i": "not-a-uuid"}'),
+        _token(b'{"c": 1, "i": null}'),
+    ],
+)
+def test_malformed_cursor_is_a_validation_error(cursor):
+    """Tampered or truncated cursors are rejected, never a server error."""
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_points_past_the_last_row_of_a_full_page():
+    """A full page yields a cursor at its last row, a short one yields none."""
+    rows = [
+        SimpleNamespace(created_at=datetime(2026, 12, day), id=uuid4())
+        for day in (20, 19, 18)
+    ]
+
+    assert decode_cursor(next_cursor(rows, page_size=3)) == (
+        rows[-1].created_at,
+        rows[-1].id,
+    )
+    assert next_cursor(rows, page_size=4) is None
+
+
+def test_reject_cursor():
+    """Ranked orders refuse a cursor but accept its absence."""
+    reject_cursor(None)
+    reject_cursor("")
+    with pytest.raises(ValidationError):
+        reject_cursor(encode_cursor(datetime(2026, 12, 16), uuid4()))
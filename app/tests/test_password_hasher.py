@@ -0,0 +1,87 @@
+"""Bounded password hashing pool and its 429 on saturation."""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.errors import TooManyRequestsError
+from app.infrastructure.persistence.sqlalchemy.engine import get_db_session
+from app.infrastructure.security import password_hasher
+from app.infrastructure.security.password_hasher import PasswordHashPool
+from app.interface.main_app import app
+from app.interface.routers import auth
+
+
+def test_pool_runs_jobs_off_the_event_loop():
+    """Work runs on a pool thread and its result is returned."""
+    pool = PasswordHashPool(workers=1, max_queue=0)
+
+    name = asyncio.run(pool.run(lambda: threading.current_thread().name))
+
+    assert name.startswith("password-hash")
+    assert pool._pending == 0
+
+
+def test_saturated_pool_rejects_and_recovers():
+    """Past ``workers + max_queue`` jobs are refused until a slot frees up."""
+    pool = PasswordHashPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)  # Let both claim their slots
+        with pytest.raises(TooManyRequestsError):
+            await pool.run(str, "rejected")
+        release.set()
+        await asyncio.gather(*running)
+        return await pool.run(str, "accepted")
+
+    assert asyncio.run(scenario()) == "accepted"
+    assert pool._pending == 0
+
+
+def test_failed_job_frees_its_slot():
+    """An exception in the job still releases its place in the pool."""
+    pool = PasswordHashPool(workers=1, max_queue=0)
+
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(pool.run(lambda: 1 / 0))
+
+    assert pool._pending == 0
+
+
+class NoUsers:
+    """User repository where every email and alias is free."""
+
+    def __init__(self, db):
+        pass
+
+    async def get_by_email(self, email):
+        return None
+
+    async def get_by_alias(self, alias):
+        return None
+
+
+def test_saturated_pool_returns_429(monkeypatch):
+    """Registration while the pool is full gets a 429 with Retry-After."""
+    full_pool = PasswordHashPool(workers=1, max_queue=0)
+    full_pool._pending = 1
+    monkeypatch.setattr(password_hasher, "hash_pool", full_pool)
+    monkeypatch.setattr(auth, "UserRepository", NoUsers)
+    monkeypatch.setitem(app.dependency_overrides, get_db_session, lambda: None)
+
+    response = TestClient(app).post(
+        "/auth/register",
+        json={
+            "email": "maria@example.com",
+            "password": "secreto123",
+            "full_name": "María",
+        },
+    )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["success"] is False
@@ -0,0 +1,149 @@
+"""Token bucket refill, rule parsing and the per-IP and per-user buckets."""
+
+import asyncio
+import importlib
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infrastructure.persistence.sqlalchemy.engine import get_db_session
+from app.infrastructure.rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    RateLimitRule,
+)
+from app.infrastructure.security.jwt_token_service import jwt_service
+from app.interface.main_app import app
+
+# The package re-exports the middleware function under the module's name
+middleware_module = importlib.import_module(
+    "app.interface.middleware.rate_limit_middleware"
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic()."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def acquire(backend, key="login:ip:1.2.3.4", capacity=2, refill_per_second=0.5):
+    """Take one token synchronously."""
+    return asyncio.run(backend.acquire(key, capacity, refill_per_second))
+
+
+def test_bucket_allows_a_burst_then_reports_the_wait(clock):
+    """A full bucket serves ``capacity`` requests, then says when to retry."""
+    backend = InMemoryRateLimitBackend()
+
+    assert acquire(backend) == 0
+    assert acquire(backend) == 0
+    assert acquire(backend) == pytest.approx(2.0)
+
+
+def test_bucket_refills_over_time(clock):
+    """Tokens come back at the refill rate, capped at the capacity."""
+    backend = InMemoryRateLimitBackend()
+    acquire(backend)
+    acquire(backend)
+
+    clock[0] += 1  # Half a token back
+    assert acquire(backend) == pytest.approx(1.0)
+
+    clock[0] += 1  # The rejected request took nothing: one token now
+    assert acquire(backend) == 0
+    assert acquire(backend) > 0
+
+    clock[0] += 3600  # Long idle: refilled to capacity only
+    assert [acquire(backend) for _ in range(3)] == [0, 0, pytest.approx(2.0)]
+
+
+def test_buckets_are_per_key_and_bounded(clock):
+    """Keys have separate buckets; the least recently used is dropped first."""
+    backend = InMemoryRateLimitBackend(max_keys=2)
+    for key in ("a", "b"):
+        acquire(backend, key, capacity=1)
+        assert acquire(backend, key, capacity=1) > 0
+
+    acquire(backend, "c", capacity=1)  # Evicts "a", whose bucket starts full
+
+    assert acquire(backend, "a", capacity=1) == 0
+    assert list(backend._buckets) == ["c", "a"]
+
+
+@pytest.mark.parametrize(
+    "rate, capacity, period",
+    [("10/minute", 10, 60), ("5 / Hour", 5, 3600), ("1/second", 1, 1)],
+)
+def test_rule_parse(rate, capacity, period):
+    """Rates read ``<requests>/<second|minute|hour>``."""
+    rule = RateLimitRule.parse("login", rate)
+
+    assert (rule.capacity, rule.period) == (capacity, period)
+
+
+@pytest.mark.parametrize("rate", ["10", "ten/minute", "10/day", ""])
+def test_rule_parse_rejects_bad_rates(rate):
+    """Malformed settings fail at startup with the rule name."""
+    with pytest.raises(ValueError, match="login"):
+        RateLimitRule.parse("login", rate)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client with a fresh limiter and no database; login allows 3 per minute."""
+    monkeypatch.setattr(
+        middleware_module,
+        "rate_limiter",
+        RateLimiter(InMemoryRateLimitBackend()),
+    )
+    monkeypatch.setitem(
+        middleware_module.RATE_LIMITED_ROUTES,
+        ("POST", "/auth/login"),
+        RateLimitRule("login", 3, 60),
+    )
+    monkeypatch.setattr(
+        middleware_module.settings, "rate_limit_trust_forwarded_for", True
+    )
+    monkeypatch.setitem(app.dependency_overrides, get_db_session, lambda: None)
+    return TestClient(app)
+
+
+def login(client, user_id=None, ip="203.0.113.7"):
+    """Post an (invalid) login, returning the status code."""
+    headers = {"X-Forwarded-For": ip}
+    if user_id:
+        token = jwt_service.create_access_token({"sub": str(user_id)})
+        headers["Authorization"] = f"Bearer {token}"
+    return client.post("/auth/login", json={}, headers=headers).status_code
+
+
+def test_rotating_tokens_do_not_escape_the_ip_bucket(client):
+    """A fresh token per request still drains the caller's IP bucket."""
+    codes = [login(client, user_id=uuid4()) for _ in range(4)]
+
+    assert codes == [422, 422, 422, 429]
+
+
+def test_rotating_ips_do_not_escape_the_user_bucket(client):
+    """One user spreading requests over several IPs drains their bucket."""
+    user_id = uuid4()
+    codes = [login(client, user_id, ip=f"198.51.100.{i}") for i in range(4)]
+
+    assert codes == [422, 422, 422, 429]
+
+
+def test_rejection_reports_retry_after(client):
+    """A 429 carries a Retry-After rounded up to whole seconds."""
+    for _ in range(3):
+        login(client)
+    response = client.post(
+        "/auth/login", json={}, headers={"X-Forwarded-For": "203.0.113.7"}
+    )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "20"
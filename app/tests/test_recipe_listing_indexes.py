@@ -0,0 +1,159 @@
+"""EXPLAIN checks that the planner serves each recipe listing from its index.
+
+Runs against a PostgreSQL database migrated to head, given by
+``DATABASE_URL``, and is skipped without one. A few thousand rows are
+seeded and analyzed inside a transaction that is rolled back afterwards.
+"""
+
+import os
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.infrastructure.config.settings import settings
+from app.infrastructure.persistence.sqlalchemy.repositories.recipe import (
+    RecipeRepository,
+)
+
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DATABASE_URL", "").startswith(("postgresql", "postgres")),
+    reason="needs a PostgreSQL DATABASE_URL",
+)
+
+# Selective filters: 25 categories, 0.2% of recipes tagged "navidad"
+SEED_STATEMENTS = [
+    """
+    INSERT INTO parranda.users (id, email, is_active)
+    SELECT gen_random_uuid(), 'explain' || i || '@example.com', true
+    FROM generate_series(1, 50) AS i
+    """,
+    """
+    INSERT INTO parranda.recipes (
+        id, title, author_user_id, category, tags, rating, favorite_count,
+        trending_score, is_published, is_community, created_at
+    )
+    SELECT
+        gen_random_uuid(),
+        'Receta ' || i,
+        (SELECT id FROM parranda.users ORDER BY id OFFSET i % 50 LIMIT 1),
+        CASE WHEN i % 25 = 0 THEN 'Postres' ELSE 'Categoria ' || i % 25 END,
+        CASE WHEN i % 500 = 0 THEN ARRAY['navidad'] ELSE ARRAY['tag' || i % 100] END,
+        round((random() * 4 + 1)::numeric, 1),
+        (random() * 100)::int,
+        random() * 50,
+        i % 10 <> 0,
+        i % 2 = 0,
+        now() - i * interval '1 minute'
+    FROM generate_series(1, 5000) AS i
+    """,
+    """
+    INSERT INTO parranda.user_favorite_recipes (user_id, recipe_id)
+    SELECT u.id, r.id
+    FROM (SELECT id FROM parranda.users ORDER BY id LIMIT 50) AS u
+    CROSS JOIN LATERAL (
+        SELECT id FROM parranda.recipes ORDER BY random() LIMIT 20
+    ) AS r
+    """,
+    "ANALYZE parranda.users, parranda.recipes, parranda.user_favorite_recipes",
+]
+
+# (listing, repository call, index expected in its plan)
+LISTINGS = [
+    (
+        "published_recent",
+        lambda repo: repo.get_all(is_published=True, include_total=False),
+        "ix_recipes_published_created",
+    ),
+    (
+        "by_author",
+        lambda repo: repo.get_by_user(uuid4()),
+        "ix_recipes_author_created",
+    ),
+    (
+        "by_category",
+        lambda repo: repo.get_all(
+            is_published=True, category="Postres", include_total=False
+        ),
+        "ix_recipes_category_created",
+    ),
+    (
+        "by_tag",
+        lambda repo: repo.get_all(
+            is_published=True, tags=["navidad"], include_total=False
+        ),
+        "ix_recipes_tags",
+    ),
+    (
+        "favorites_by_user",
+        lambda repo: repo.get_user_favorites(uuid4()),
+        "ix_user_favorite_recipes_user_created",
+    ),
+    (
+        "popular",
+        lambda repo: repo.get_community_recipes(sort="popular", include_total=False),
+        "ix_recipes_published_popular",
+    ),
+    (
+        "trending",
+        lambda repo: repo.get_community_recipes(sort="trending", include_total=False),
+        "ix_recipes_published_trending",
+    ),
+    (
+        "best_rated",
+        lambda repo: repo.get_community_recipes(sort="best_rated", include_total=False),
+        "ix_recipes_published_rating",
+    ),
+]
+
+
+def _plan_nodes(plan: dict):
+    """Yield a plan node and all of its children."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+@pytest_asyncio.fixture
+async def connection():
+    """A connection to seeded tables, inside a transaction rolled back afterwards."""
+    engine = create_async_engine(settings.async_database_url)
+    async with engine.connect() as conn:
+        await conn.begin()
+        for statement in SEED_STATEMENTS:
+            await conn.execute(text(statement))
+        yield conn
+        await conn.rollback()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "listing, call, index", LISTINGS, ids=[name for name, _, _ in LISTINGS]
+)
+async def test_listing_uses_index(connection, listing, call, index):
+    """The page query of each listing is planned with its index."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = connection.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call(RecipeRepository(AsyncSession(bind=connection)))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    # The page query runs last (after the optional count)
+    statement, parameters = statements[-1]
+    result = await connection.exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + statement, parameters
+    )
+    plan = result.scalar()[0]["Plan"]
+    nodes = list(_plan_nodes(plan))
+
+    assert index in {node.get("Index Name") for node in nodes}, plan
+    assert not any(node["Node Type"] == "Seq Scan" for node in nodes), plan
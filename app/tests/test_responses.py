@@ -0,0 +1,122 @@
+"""Pre-rendered JSON responses: ETag matching and 304 revalidation."""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.application.dtos.response import APIResponse
+from app.domain.entities.novena_day import NovenaDay, NovenaDaySection
+from app.infrastructure.cache import novena_cache
+from app.interface.api.v1.responses import (
+    etag_matches,
+    render_json,
+    rendered_response,
+)
+from app.interface.api.v1.routers.novenas import get_novena_content_repo
+from app.interface.main_app import app
+
+ETAG = '"abc"'
+
+
+def make_request(if_none_match=None) -> Request:
+    """Bare GET request, optionally carrying If-None-Match."""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        (None, False),
+        ("", False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"old", "abc"', True),
+        ('"old",W/"abc"', True),
+        ("*", True),
+        ('"abcd"', False),
+        ("abc", False),
+    ],
+)
+def test_etag_matches(header, matches):
+    """If-None-Match lists, weak tags and ``*`` are understood."""
+    assert etag_matches(make_request(header), ETAG) is matches
+
+
+def test_render_json_etag_follows_the_body():
+    """Equal payloads share an ETag; any change in content changes it."""
+    first = render_json(APIResponse(success=True, message="a", data={"day": 1}))
+    same = render_json(APIResponse(success=True, message="a", data={"day": 1}))
+    other = render_json(APIResponse(success=True, message="a", data={"day": 2}))
+
+    assert first.etag == same.etag != other.etag
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+
+
+def test_rendered_response_200_then_304():
+    """A fresh client gets an empty 304 with the same validators."""
+    rendered = render_json(APIResponse(success=True, message="ok"))
+
+    full = rendered_response(make_request(), rendered, max_age=60)
+    cached = rendered_response(make_request(rendered.etag), rendered, max_age=60)
+
+    assert full.status_code == 200
+    assert full.body == rendered.body
+    assert cached.status_code == 304
+    assert cached.body == b""
+    for response in (full, cached):
+        assert response.headers["etag"] == rendered.etag
+        assert response.headers["cache-control"] == "public, max-age=60"
+
+
+class StubNovenaRepository:
+    """Novena content with a single day, counting how often it is read."""
+
+    def __init__(self):
+        self.day = NovenaDay(day_number=3, title="Día tercero")
+        self.reads = 0
+
+    async def get_day_by_number(self, day_number):
+        self.reads += 1
+        return self.day if day_number == self.day.day_number else None
+
+    async def get_sections_by_day(self, day_id):
+        return [NovenaDaySection(day_id=day_id, section_type="oracion", content_md="…")]
+
+
+@pytest.fixture
+def novena_client(monkeypatch):
+    """Client serving novena days from the stub, with an empty cache."""
+    repo = StubNovenaRepository()
+    monkeypatch.setitem(app.dependency_overrides, get_novena_content_repo, lambda: repo)
+    novena_cache.invalidate()
+    yield TestClient(app), repo
+    novena_cache.invalidate()
+
+
+def test_novena_day_revalidates_with_304(novena_client):
+    """The day is rendered once; a matching If-None-Match gets a bare 304."""
+    client, repo = novena_client
+
+    first = client.get("/api/v1/novenas/3")
+    again = client.get(
+        "/api/v1/novenas/3", headers={"If-None-Match": first.headers["etag"]}
+    )
+
+    assert first.status_code == 200
+    assert first.json()["data"]["title"] == "Día tercero"
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == first.headers["etag"]
+    assert repo.reads == 1
+
+
+def test_missing_novena_day_is_not_cached(novena_client):
+    """A 404 is not stored, so the day is looked up again next time."""
+    client, repo = novena_client
+
+    assert client.get("/api/v1/novenas/4").status_code == 404
+    assert client.get("/api/v1/novenas/4").status_code == 404
+    assert repo.reads == 2
@@ -0,0 +1,64 @@
+"""Verified-token claims cache: expiry and LRU eviction."""
+
+import time
+
+import pytest
+
+from app.infrastructure.cache.token_cache import TokenCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time()."""
+    now = [1_800_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_entry_expires_with_its_token(clock):
+    """Claims are served until ``exp`` and never after it."""
+    cache = TokenCache()
+    claims = {"sub": "user", "exp": clock[0] + 60}
+    cache.set("digest", claims)
+
+    clock[0] += 59
+    assert cache.get("digest") == claims
+
+    clock[0] += 1
+    assert cache.get("digest") is None
+
+
+@pytest.mark.parametrize("exp", [None, "soon", 1_800_000_000.0, 1_799_999_999])
+def test_claims_without_a_future_exp_are_not_cached(clock, exp):
+    """Tokens with no usable expiry, or already expired, are not stored."""
+    cache = TokenCache()
+    cache.set("digest", {"sub": "user", "exp": exp})
+
+    assert cache.get("digest") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    """Past ``max_entries`` the entry read least recently goes first."""
+    cache = TokenCache(max_entries=2)
+    exp = clock[0] + 60
+    cache.set("a", {"sub": "a", "exp": exp})
+    cache.set("b", {"sub": "b", "exp": exp})
+
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", {"sub": "c", "exp": exp})
+
+    assert cache.get("b") is None
+    assert cache.get("a")["sub"] == "a"
+    assert cache.get("c")["sub"] == "c"
+
+
+def test_cached_claims_are_copies(clock):
+    """Callers mutating claims cannot alter what later hits return."""
+    cache = TokenCache()
+    claims = {"sub": "user", "exp": clock[0] + 60}
+    cache.set("digest", claims)
+
+    claims["sub"] = "other"
+    cache.get("digest")["sub"] = "other"
+
+    assert cache.get("digest")["sub"] == "user"